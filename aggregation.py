@@ -0,0 +1,102 @@
+import math
+
+
+class RunningStats:
+    """
+    Streaming mean/variance accumulator (Welford's algorithm).
+
+    Folds one observation at a time in O(1) memory, so multi-run sweeps can
+    discard each run as soon as its metrics are recorded. Variance and standard
+    deviation are population statistics (ddof=0), matching np.std.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        """Fold one observation into the running statistics."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count > 0 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def ci(self, z: float = 1.96) -> float:
+        """Half-width of the normal-approximation confidence interval (default 95%)."""
+        return z * self.std / math.sqrt(self.count) if self.count > 0 else 0.0
+
+
+class MinerAggregates:
+    """
+    Running per-class totals over a miner population.
+
+    Miners are classed as Byzantine when their observed error rate exceeds
+    byzantine_threshold (thesis Equation 2). Each miner's contribution (class,
+    tasks completed, tokens, score) is snapshotted, and refresh() swaps the old
+    snapshot for the current one in O(1), so class averages and score totals
+    are available without rescanning all miners. The renewable proportion α_m
+    is fixed at creation, so its mean is computed once.
+    """
+
+    def __init__(self, miners, byzantine_threshold: float = 0.2):
+        self.miners = miners
+        self.byzantine_threshold = byzantine_threshold
+        self.renewable_mean = (sum(m.renewable_energy_proportion for m in miners) / len(miners)
+                               if miners else 0.0)
+        self.rebuild()
+
+    def _snapshot(self, miner) -> tuple:
+        return (miner.error_rate > self.byzantine_threshold, miner.tasks_completed,
+                miner.tokens, miner.score)
+
+    def rebuild(self):
+        """Recompute all totals from the miners in O(M) (e.g. after a bulk state sync)."""
+        self._snapshots = {}
+        self._counts = [0, 0]        # Indexed by is-Byzantine
+        self._tasks = [0, 0]
+        self._tokens = [0.0, 0.0]
+        self.total_score = 0.0
+        for miner in self.miners:
+            snapshot = self._snapshot(miner)
+            self._snapshots[miner] = snapshot
+            self._add(snapshot, 1)
+
+    def _add(self, snapshot: tuple, sign: int):
+        byzantine, tasks, tokens, score = snapshot
+        self._counts[byzantine] += sign
+        self._tasks[byzantine] += sign * tasks
+        self._tokens[byzantine] += sign * tokens
+        self.total_score += sign * score
+
+    def refresh(self, miner):
+        """Fold a miner's changed state into the totals in O(1)."""
+        snapshot = self._snapshot(miner)
+        old = self._snapshots[miner]
+        if snapshot == old:
+            return
+        self._add(old, -1)
+        self._add(snapshot, 1)
+        self._snapshots[miner] = snapshot
+
+    def count(self, byzantine: bool) -> int:
+        """Number of miners currently classed as Byzantine (or honest)."""
+        return self._counts[byzantine]
+
+    def avg_tasks(self, byzantine: bool) -> float:
+        """Mean tasks completed per miner of the class (0 if the class is empty)."""
+        count = self._counts[byzantine]
+        return self._tasks[byzantine] / count if count else 0
+
+    def avg_tokens(self, byzantine: bool) -> float:
+        """Mean tokens per miner of the class (0 if the class is empty)."""
+        count = self._counts[byzantine]
+        return self._tokens[byzantine] / count if count else 0
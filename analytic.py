@@ -0,0 +1,207 @@
+from typing import Dict, List
+import numpy as np
+from task import TaskType, LINEAR_COST, QUADRATIC_COST, MASKED_FAULT_PROBABILITY
+from miner import Miner
+from vectorized import VectorizedEngine
+
+_SORTING = list(TaskType).index(TaskType.SORTING)
+
+
+def task_moments(input_size_min: int = 10, input_size_max: int = 100) -> Dict[str, float]:
+    """
+    Per-task expectations over the task distribution (uniform type, uniform n).
+
+    Returns:
+        'cost':          E[C]            (thesis Equation 1)
+        'masked':        E[q]            probability that a faulty execution is still correct
+        'masked_cost':   E[C × q]
+    """
+    n = np.arange(input_size_min, input_size_max + 1, dtype=np.float64)
+    costs = LINEAR_COST[:, None] * n + QUADRATIC_COST[:, None] * n * n  # types × sizes
+    masked = np.repeat(MASKED_FAULT_PROBABILITY[:, None], len(n), axis=1)
+    # A single-element sort has nothing to swap, so a fault is always masked
+    masked[_SORTING, n <= 1] = 1.0
+    return {
+        'cost': float(costs.mean()),
+        'masked': float(masked.mean()),
+        'masked_cost': float((costs * masked).mean()),
+    }
+
+
+class MeanFieldModel:
+    """
+    Deterministic expected-value model of the simulation.
+
+    Verifiers check solutions against ground truth, so a task is valid exactly
+    when its executor's result is correct (thesis Equations 11-12). Given the
+    selection probabilities π_m of thesis Equation 4, one task therefore has
+
+        P(valid) = Σ_m π_m (1 - p_m),   p_m = error probability × (1 - E[q])
+
+    where E[q] is the chance that a fault leaves the result unchanged, and
+    η = P(valid) / (1 + 0.1 V). Expected scores, tokens and task counts follow
+    from the reward equations (5-8, 10) with E[C] in place of each task cost.
+
+    run() integrates the expected score dynamics with Euler steps whose size
+    grows with elapsed tasks (step ≈ resolution × t), so a run costs
+    O(M log N / resolution) instead of O(N) task draws. Error-rate tiers use
+    each miner's long-run error rate, i.e. the model describes a tier-stable
+    regime; early tier flips from a few unlucky draws are not modelled.
+    """
+
+    def __init__(self, miners: List[Miner], num_verifiers: int = 3,
+                 k: float = 1.0, z: float = 0.5,
+                 fault_tolerance_enabled: bool = True,
+                 input_size_min: int = 10, input_size_max: int = 100):
+        """
+        Initialize the model from an existing miner population (its current
+        scores and tokens are the starting state).
+
+        Args:
+            miners: Miners to model (their state is written back by sync_miners)
+            num_verifiers: Number of verifiers per task V (thesis Eq.11)
+            k: Base reward multiplier (thesis Eq.5)
+            z: Verifier reward coefficient (thesis Eq.8)
+            fault_tolerance_enabled: Use thesis Equation 4 for selection
+            input_size_min: Minimum task input size n
+            input_size_max: Maximum task input size n
+        """
+        self.miners = miners
+        self.num_miners = len(miners)
+        self.num_verifiers = min(num_verifiers, max(self.num_miners - 1, 0))
+        self.k = k
+        self.z = z
+        self.fault_tolerance_enabled = fault_tolerance_enabled
+        moments = task_moments(input_size_min, input_size_max)
+        self.expected_cost = moments['cost']
+
+        self.error_probability = np.array([m.error_probability for m in miners], dtype=np.float64)
+        self.renewable = np.array([m.renewable_energy_proportion for m in miners], dtype=np.float64)
+        # With no verifiers ⌈0/2⌉ = 0 approvals suffice, so every task is valid
+        if self.num_verifiers == 0:
+            self.invalid_probability = np.zeros(self.num_miners)
+            self.invalid_cost = np.zeros(self.num_miners)
+        else:
+            self.invalid_probability = self.error_probability * (1.0 - moments['masked'])
+            self.invalid_cost = self.error_probability * (moments['cost'] - moments['masked_cost'])
+        self.valid_cost = moments['cost'] - self.invalid_cost  # E[C × 1{valid}]
+        self.tier = np.array([VectorizedEngine.tier_multiplier(p) for p in self.error_probability])
+
+        self.score = np.array([m.score for m in miners], dtype=np.float64)
+        self.tokens = np.array([m.tokens for m in miners], dtype=np.float64)
+        self.attempts = np.array([m.total_tasks_attempted for m in miners], dtype=np.float64)
+        self.failures = np.array([m.total_failures for m in miners], dtype=np.float64)
+        self.tasks_completed = np.array([m.tasks_completed for m in miners], dtype=np.float64)
+        self.penalties = np.array([m.penalties for m in miners], dtype=np.float64)
+
+    def selection_probabilities(self, score: np.ndarray = None) -> np.ndarray:
+        """π_m for the next task (thesis Equation 4), uniform if no miner has weight."""
+        if score is None:
+            score = self.score
+        if self.fault_tolerance_enabled:
+            weights = score * self.tier
+            total = weights.sum()
+            if total > 0:
+                return weights / total
+        return np.full(self.num_miners, 1.0 / self.num_miners)
+
+    def expected_outcome(self, score: np.ndarray = None) -> Dict[str, object]:
+        """
+        Expectations for one task drawn in the given (default: current) state.
+
+        Returns:
+            'success_rate':           P(valid)
+            'useful_work_efficiency': η for a long run in this state
+            'selection':              π_m
+            'executor_tokens':        expected executor reward per miner (Eq. 5-7)
+            'verifier_tokens':        expected verifier reward per miner (Eq. 8)
+        """
+        pi = self.selection_probabilities(score)
+        valid = pi * (1.0 - self.invalid_probability)
+        success = float(valid.sum())
+        executor_tokens = pi * self.k * self.valid_cost * (1.0 + self.renewable)
+        verifier_tokens = self._verifier_tokens(pi)
+        return {
+            'success_rate': success,
+            'useful_work_efficiency': success / (1.0 + 0.1 * self.num_verifiers),
+            'selection': pi,
+            'executor_tokens': executor_tokens,
+            'verifier_tokens': verifier_tokens,
+        }
+
+    def _verifier_tokens(self, pi: np.ndarray) -> np.ndarray:
+        """Expected Eq. 8 reward per miner: verifiers are uniform over the M - 1 non-executors."""
+        if self.num_verifiers == 0 or self.num_miners < 2:
+            return np.zeros(self.num_miners)
+        paid = pi * self.k * self.valid_cost * self.z  # Reward per verifier of m's valid tasks
+        share = self.num_verifiers / (self.num_miners - 1)
+        return share * (paid.sum() - paid)
+
+    def run(self, num_tasks: int, resolution: float = 0.05) -> Dict[str, object]:
+        """
+        Integrate the expected dynamics over num_tasks tasks and write the
+        expected final state back to the miners.
+
+        Args:
+            num_tasks: Number of tasks to model
+            resolution: Maximum step size as a fraction of the tasks modelled so
+                        far (smaller is more accurate)
+
+        Returns:
+            'successful_tasks': expected number of valid tasks
+            'selection_count':  expected number of selections per miner
+            'step_ends':        task index at the end of each step
+            'step_success':     P(valid) during each step
+        """
+        score = self.score
+        selection_count = np.zeros(self.num_miners)
+        step_ends = []
+        step_success = []
+        successful = 0.0
+        done = 0
+        start = self.attempts.sum()
+        while done < num_tasks:
+            h = min(num_tasks - done, max(1, int(resolution * (start + done))))
+            outcome = self.expected_outcome(score)
+            pi = outcome['selection']
+            executor_tokens = outcome['executor_tokens']
+            verifier_tokens = outcome['verifier_tokens']
+            # Equation 10 penalty: S_new = max(0, S - C) on invalid tasks
+            penalty = pi * self.invalid_cost
+            score += h * (executor_tokens + verifier_tokens - penalty)
+            np.maximum(score, 0.0, out=score)
+            self.tokens += h * (executor_tokens + verifier_tokens)
+            self.tasks_completed += h * pi * (1.0 - self.invalid_probability)
+            self.penalties += h * pi * self.invalid_probability
+            self.attempts += h * pi
+            self.failures += h * pi * self.error_probability
+            selection_count += h * pi
+            successful += h * outcome['success_rate']
+            done += h
+            step_ends.append(done)
+            step_success.append(outcome['success_rate'])
+        self.sync_miners()
+        return {
+            'successful_tasks': successful,
+            'selection_count': selection_count,
+            'step_ends': np.array(step_ends, dtype=np.int64),
+            'step_success': np.array(step_success),
+        }
+
+    def sync_miners(self):
+        """Write the expected state back into the Miner objects (counts become floats)."""
+        for i, miner in enumerate(self.miners):
+            miner.score = float(self.score[i])
+            miner.tokens = float(self.tokens[i])
+            miner.tasks_completed = float(self.tasks_completed[i])
+            miner.penalties = float(self.penalties[i])
+            miner.total_tasks_attempted = float(self.attempts[i])
+            miner.total_failures = float(self.failures[i])
+            miner.error_rate = (miner.total_failures / miner.total_tasks_attempted
+                                if miner.total_tasks_attempted > 0 else 0.0)
+
+
+def tiers_stable(miners: List[Miner]) -> bool:
+    """True once every miner's observed error-rate tier equals its long-run tier."""
+    return all(VectorizedEngine.tier_multiplier(m.error_rate) == VectorizedEngine.tier_multiplier(m.error_probability)
+               for m in miners)
@@ -1,37 +1,89 @@
 from flask import Flask, render_template, request, jsonify, Response
 from flask_cors import CORS
+import bisect
+import gzip
 import json
-import random
+import os
+import time
 from typing import List, Dict, Any
-from task import Task, TaskType
-from miner import Miner
-from distribution import TaskDistributor
-from validation import ValidationManager
+from simulation import SimulationCore
+from observers import MetricsSampler
+from cache import cache_key, resolve_cache
+from jobs import JobManager
+from encoding import COLUMNS_MIMETYPE, encode_columns
 import io
 import base64
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
-import numpy as np
+
+# Default simulation configuration (thesis specifications, see get_default_config)
+DEFAULT_CONFIG = {
+    'num_miners': 20,
+    'num_tasks': 1000,
+    'reward_multiplier': 1.0,            # k = 1.0 (thesis Equations 5-8)
+    'verifier_reward_multiplier': 0.5,   # z = 0.5 (thesis Equation 8)
+    'renewable_energy_alpha': 'random',  # α_m ∈ [0, 0.5] - 'random' or fixed value
+    'byzantine_threshold': 0.2,          # e_m > 0.2 = Byzantine (thesis Equation 2)
+    'byzantine_error_rate': 0.3,         # 30% error rate (thesis Equation 3)
+    'num_verifiers': 3,                  # V = 3 verifiers per task (thesis Equation 11)
+    'input_size_min': 10,                # n ∈ [10, 100] (thesis Equation 13)
+    'input_size_max': 100,
+    'multiplication_mode': 'exact',      # 'exact', 'modular' (mod 2^61-1) or 'log' products
+    'max_byzantine_miners': 3,           # Up to 3 Byzantine (thesis Section 3.1)
+    'fault_tolerance_enabled': True,     # Enable thesis Equation 4 (score-based selection)
+    'independent_verification': False,   # Verifiers re-execute tasks instead of using cached ground truth
+    'verifier_fault_model': 'honest',    # 'honest', 'random_flip', 'collude' or 'always_reject'
+    'metrics_interval': 10,              # Record chart metrics every this many tasks
+    'metrics_max_points': 500,           # Points kept per chart series (bounds memory and payload)
+    'metrics_downsampling': 'decimate',  # 'decimate', 'minmax' (keeps peaks) or 'ring' (latest only)
+    'stream_frame_interval': 50,         # Tasks between streamed progress frames
+    'stream_miner_limit': 10,            # Miners whose score/token samples are streamed (the charted ones)
+    'seed': None                         # Random seed for reproducibility (None = random)
+}
+
+
+# Config keys that only shape the progress stream; the final result does not depend on them
+STREAM_CONFIG_KEYS = ('stream_frame_interval', 'stream_miner_limit')
+
+# A streaming client receives at most one frame per this many seconds; frames
+# published in between are coalesced into one
+STREAM_MIN_SECONDS = 0.2
+
+# Responses smaller than this are sent uncompressed even if the client accepts gzip
+GZIP_MIN_BYTES = 1024
+
 
 app = Flask(__name__)
 CORS(app)
 
-class WebBlockchainSimulation:
+
+def web_cache_key(config: Dict[str, Any]):
+    """
+    Result cache key of a web run, or None if the run is not reproducible.
+    
+    Seedless runs draw fresh randomness every time and are never cached.
+    """
+    if config.get('seed') in (None, ''):
+        return None
+    normalized = {**DEFAULT_CONFIG, **config}
+    seed = normalized.pop('seed')
+    for name in STREAM_CONFIG_KEYS:
+        normalized.pop(name)
+    if normalized['renewable_energy_alpha'] in ('random', '', None):
+        normalized['renewable_energy_alpha'] = 'random'
+    return cache_key('web', normalized, seed)
+
+class WebBlockchainSimulation(SimulationCore):
+    """
+    Simulation driven by a web request config. Runs the shared SimulationCore
+    loop in chunks of stream_frame_interval tasks and yields a progress frame
+    after each chunk; chart metrics are recorded by a MetricsSampler observer.
+    """
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         
-        # Get configuration parameters
-        num_miners = config['num_miners']
-        max_byzantine = config.get('max_byzantine_miners', 3)
-        byzantine_error_rate = config.get('byzantine_error_rate', 0.3)
-        
-        # Random seed for reproducibility
-        seed = config.get('seed')
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
-        
         # Get renewable energy alpha (α_m) - if None, random per miner
         # Per thesis: α_m ∈ [0, 0.5]
         renewable_alpha = config.get('renewable_energy_alpha')
@@ -40,147 +92,67 @@ class WebBlockchainSimulation:
         else:
             renewable_alpha = float(renewable_alpha)
         
-        # Create miners with deterministic Byzantine selection
-        self.miners = Miner.create_miners(
-            num_miners=num_miners,
-            max_byzantine=max_byzantine,
-            byzantine_error_rate=byzantine_error_rate,
-            renewable_energy_alpha=renewable_alpha
+        # Random seed for reproducibility. The simulation owns its generators, so
+        # concurrent requests on the threaded server cannot disturb each other.
+        # Fault tolerance toggle (per thesis Equation 4): when disabled, selection
+        # is uniform (to see raw Byzantine impact).
+        super().__init__(
+            num_miners=config['num_miners'],
+            num_tasks=config['num_tasks'],
+            max_byzantine=config.get('max_byzantine_miners', 3),
+            byzantine_error_rate=config.get('byzantine_error_rate', 0.3),
+            reward_multiplier=config['reward_multiplier'],
+            verifier_reward_multiplier=config.get('verifier_reward_multiplier', 0.5),
+            renewable_energy_alpha=renewable_alpha,
+            num_verifiers=config.get('num_verifiers', 3),  # V: Number of verifiers per task (thesis Eq.11)
+            byzantine_threshold=config.get('byzantine_threshold', 0.2),
+            fault_tolerance_enabled=config.get('fault_tolerance_enabled', True),
+            seed=config.get('seed'),
+            independent_verification=config.get('independent_verification', False),
+            input_size_min=config.get('input_size_min', 10),
+            input_size_max=config.get('input_size_max', 100),
+            multiplication_mode=config.get('multiplication_mode', 'exact'),
+            verifier_fault_model=config.get('verifier_fault_model', 'honest')
         )
         
-        # Fault tolerance toggle (per thesis Equation 4)
-        # When enabled: score-based selection with Byzantine penalty
-        # When disabled: uniform selection (to see raw Byzantine impact)
-        fault_tolerance_enabled = config.get('fault_tolerance_enabled', True)
-        self.distributor = TaskDistributor(self.miners, fault_tolerance_enabled=fault_tolerance_enabled)
-        
-        # Create validation manager (per thesis Equations 5-8)
-        self.validator = ValidationManager(
-            k=config['reward_multiplier'],
-            z=config.get('verifier_reward_multiplier', 0.5)
-        )
-        
-        self.total_tasks = config['num_tasks']
-        self.completed_tasks = 0
-        self.successful_tasks = 0
-        self.byzantine_threshold = config.get('byzantine_threshold', 0.2)
-        self.input_size_min = config.get('input_size_min', 10)
-        self.input_size_max = config.get('input_size_max', 100)
-        self.num_verifiers = config.get('num_verifiers', 3)  # V: Number of verifiers per task (thesis Eq.11)
-        self.fault_tolerance_enabled = fault_tolerance_enabled
-        
-        # Count actual Byzantine miners created
-        self.actual_byzantine_count = sum(1 for m in self.miners if m.is_byzantine)
-        
-        # Enhanced metrics tracking for analysis
-        self.miner_selection_count = {m.miner_id: 0 for m in self.miners}
-        self.task_history = []
-        
-        # Metrics for visualization
-        self.metrics_history = {
-            'scores': {},
-            'renewable_energy': [],
-            'success_rate': [],
-            'tokens': {},
-            'useful_work_efficiency': []  # Track η over time
-        }
-
-    def generate_random_task(self) -> Task:
-        """Generate a random task with random input size."""
-        task_type = random.choice(list(TaskType))
-        input_size = random.randint(self.input_size_min, self.input_size_max)
-        return Task(task_type, input_size)
+        # Chart metrics, sampled every metrics_interval tasks into bounded buffers;
+        # progress frames carry the samples of the first stream_miner_limit miners
+        self.metrics = self.add_observer(MetricsSampler(
+            self.miners,
+            interval=int(config.get('metrics_interval', 10)),
+            capacity=int(config.get('metrics_max_points', 500)),
+            policy=config.get('metrics_downsampling', 'decimate'),
+            stream_miner_limit=int(config.get('stream_miner_limit', 10))
+        ))
+        self.frame_interval = max(1, int(config.get('stream_frame_interval', 50)))
 
     def run_simulation(self):
-        """Run the main simulation loop and return results."""
-        # Generate initial task queue
-        for _ in range(self.total_tasks):
-            self.distributor.add_task(self.generate_random_task())
-
-        while self.completed_tasks < self.total_tasks:
-            # Distribute task with configured number of verifiers
-            distribution_result = self.distributor.distribute_task(num_verifiers=self.num_verifiers)
-            if not distribution_result:
-                break
-
-            task, miner, verifiers = distribution_result
-            
-            # Track miner selection
-            self.miner_selection_count[miner.miner_id] += 1
-
-            # Execute task
-            solution = miner.execute_task(task)
-
-            # Validate and process rewards
-            is_valid = self.validator.process_validation(task, solution)
-            if is_valid:
-                self.successful_tasks += 1
-
-            self.completed_tasks += 1
-            success_rate = self.successful_tasks / self.completed_tasks
-            
-            # Store task outcome for analysis
-            self.task_history.append({
-                'task_id': self.completed_tasks,
-                'miner_id': miner.miner_id,
-                'is_byzantine': miner.is_byzantine,
-                'is_valid': is_valid,
-                'num_verifiers': len(verifiers)
-            })
+        """Run the simulation, yielding a progress frame per chunk and then the final results."""
+        while self.run_tasks(self.frame_interval) and self.completed_tasks < self.total_tasks:
+            yield self.get_progress_data()
 
-            # Update metrics every 10 tasks to reduce data size
-            if self.completed_tasks % 10 == 0:
-                self.update_metrics(success_rate)
-
-            # Yield progress for streaming
-            if self.completed_tasks % 50 == 0:
-                yield self.get_progress_data()
-
-        # Final metrics update
-        self.update_metrics(self.successful_tasks / self.completed_tasks)
+        # The last progress frame also carries the final metrics sample
+        self.finish()
+        yield self.get_progress_data()
         yield self.get_final_results()
 
-    def calculate_useful_work_efficiency(self) -> float:
-        """
-        Calculate useful work efficiency η = U/(U+W).
-        U = useful work (successful tasks), W = wasted work (failed tasks + verification overhead).
-        """
-        if self.completed_tasks == 0:
-            return 0.0
-        useful_work = self.successful_tasks
-        wasted_work = (self.completed_tasks - self.successful_tasks) + (self.completed_tasks * self.num_verifiers * 0.1)
-        return useful_work / (useful_work + wasted_work) if (useful_work + wasted_work) > 0 else 0
-    
-    def update_metrics(self, success_rate: float):
-        """Update metrics for visualization."""
-        for miner in self.miners:
-            if miner.miner_id not in self.metrics_history['scores']:
-                self.metrics_history['scores'][miner.miner_id] = []
-            self.metrics_history['scores'][miner.miner_id].append(miner.score)
-
-            if miner.miner_id not in self.metrics_history['tokens']:
-                self.metrics_history['tokens'][miner.miner_id] = []
-            self.metrics_history['tokens'][miner.miner_id].append(miner.tokens)
-
-        avg_renewable = sum(m.renewable_energy_proportion for m in self.miners) / len(self.miners)
-        self.metrics_history['renewable_energy'].append(avg_renewable)
-        self.metrics_history['success_rate'].append(success_rate)
-        self.metrics_history['useful_work_efficiency'].append(self.calculate_useful_work_efficiency())
+    @property
+    def metrics_history(self) -> Dict[str, Any]:
+        return self.metrics.history()
 
     def get_progress_data(self):
-        """Get current progress data."""
+        """Get current progress data and the metric samples recorded since the last frame."""
         return {
             'type': 'progress',
             'completed': self.completed_tasks,
             'total': self.total_tasks,
-            'success_rate': self.successful_tasks / self.completed_tasks if self.completed_tasks > 0 else 0
+            'success_rate': self.success_rate,
+            'delta': self.metrics.take_delta()
         }
 
     def get_final_results(self):
         """Get final simulation results with enhanced metrics."""
-        # Count miners with high error rates (detected as Byzantine)
-        detected_byzantine = [m for m in self.miners if m.error_rate > self.byzantine_threshold]
-        honest_miners = [m for m in self.miners if m.error_rate <= self.byzantine_threshold]
+        aggregates = self.aggregates
         
         miners_data = []
         for miner in sorted(self.miners, key=lambda x: x.tokens, reverse=True):
@@ -205,11 +177,11 @@ class WebBlockchainSimulation:
                 'success_rate': round(self.successful_tasks / self.completed_tasks, 4) if self.completed_tasks > 0 else 0,
                 'useful_work_efficiency': round(self.calculate_useful_work_efficiency(), 4),
                 'byzantine_count': self.actual_byzantine_count,
-                'detected_byzantine_count': len(detected_byzantine),
-                'avg_tasks_honest': round(np.mean([m.tasks_completed for m in honest_miners]), 2) if honest_miners else 0,
-                'avg_tasks_byzantine': round(np.mean([m.tasks_completed for m in detected_byzantine]), 2) if detected_byzantine else 0,
-                'avg_tokens_honest': round(np.mean([m.tokens for m in honest_miners]), 2) if honest_miners else 0,
-                'avg_tokens_byzantine': round(np.mean([m.tokens for m in detected_byzantine]), 2) if detected_byzantine else 0,
+                'detected_byzantine_count': aggregates.count(byzantine=True),  # Error rate above threshold
+                'avg_tasks_honest': round(aggregates.avg_tasks(byzantine=False), 2),
+                'avg_tasks_byzantine': round(aggregates.avg_tasks(byzantine=True), 2),
+                'avg_tokens_honest': round(aggregates.avg_tokens(byzantine=False), 2),
+                'avg_tokens_byzantine': round(aggregates.avg_tokens(byzantine=True), 2),
                 'num_verifiers': self.num_verifiers,
                 'fault_tolerance_enabled': self.fault_tolerance_enabled
             },
@@ -217,6 +189,134 @@ class WebBlockchainSimulation:
             'metrics': self.metrics_history
         }
 
+def validate_config(config: Dict[str, Any]):
+    """Return an error message if a submitted config cannot be run, else None."""
+    if not isinstance(config, dict):
+        return 'Expected a JSON object with the simulation configuration'
+    required_params = ['num_miners', 'num_tasks', 'reward_multiplier']
+    for param in required_params:
+        if param not in config:
+            return f'Missing required parameter: {param}'
+    return None
+
+def simulation_frames(config: Dict[str, Any]):
+    """
+    Progress frames and the final frame of one web run.
+    
+    A reproducible run that is already in the result cache yields only its
+    final frame; a fresh one stores its final frame in the cache.
+    """
+    cache = resolve_cache(True)
+    key = web_cache_key(config) if cache is not None else None
+    cached = cache.get(key) if key is not None else None
+    if cached is not None:
+        yield cached
+        return
+    for result in WebBlockchainSimulation(config).run_simulation():
+        if key is not None and result['type'] == 'final':
+            cache.put(key, result)
+        yield result
+
+def coalesce_progress(frames: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge consecutive progress frames: latest counters, concatenated metric deltas."""
+    if len(frames) == 1:
+        return frames[0]
+    merged = dict(frames[-1])
+    delta: Dict[str, Any] = {}
+    for frame in frames:
+        for name, values in frame['delta'].items():
+            if isinstance(values, dict):
+                series = delta.setdefault(name, {})
+                for miner_id, samples in values.items():
+                    series.setdefault(miner_id, []).extend(samples)
+            else:
+                delta.setdefault(name, []).extend(values)
+    merged['delta'] = delta
+    return merged
+
+def delta_after(metrics: Dict[str, Any], task_index: int, miner_ids: List[Any]) -> Dict[str, Any]:
+    """The samples of a metrics history after task_index, as a progress delta for miner_ids."""
+    start = bisect.bisect_right(metrics['task_index'], task_index)
+    delta: Dict[str, Any] = {}
+    for name, values in metrics.items():
+        if isinstance(values, dict):
+            delta[name] = {miner_id: values[miner_id][start:] for miner_id in miner_ids}
+        else:
+            delta[name] = values[start:]
+    return delta
+
+def job_events(job):
+    """
+    Server-sent events for a job: coalesced progress frames, then one final frame.
+    
+    The final frame omits 'metrics': a client that received progress deltas
+    already holds the chart series, and one that did not (a cached result)
+    fetches them from /api/jobs/<job_id>/result in a compact encoding.
+    A client that reads too slowly misses frames the job no longer keeps.
+    Frames missed at the end of the run are replaced by the matching samples
+    of the result. If frames were missed earlier, 'metrics_streamed' is False
+    and the client fetches the full series.
+    """
+    sent = 0            # Sequence number of the next progress frame
+    streamed = None     # Miners whose samples were streamed, once a frame was sent
+    last_task = -1      # Task index of the latest streamed sample
+    skipped = False     # Frames were missed while the job was running
+    missed_tail = False # Frames were released when the job finished before being sent
+    while True:
+        frames, first, finished = job.frames_after(sent, timeout=15)
+        if first > sent:
+            missed_tail = finished
+            skipped = skipped or not finished
+        sent = first + len(frames)
+        if frames:
+            frame = coalesce_progress(frames)
+            streamed = list(frame['delta']['scores'])
+            if frame['delta']['task_index']:
+                last_task = frame['delta']['task_index'][-1]
+            yield f"data: {json.dumps(frame)}\n\n"
+        if finished:
+            break
+        if frames:
+            time.sleep(STREAM_MIN_SECONDS)
+        else:
+            yield ": keep-alive\n\n"
+    if job.status == 'done':
+        if streamed is not None and missed_tail and not skipped:
+            # Catch up from the result on the samples of the released frames
+            tail = dict(job.progress, delta=delta_after(job.result['metrics'], last_task, streamed))
+            yield f"data: {json.dumps(tail)}\n\n"
+        result = {k: v for k, v in job.result.items() if k != 'metrics'}
+        result['job_id'] = job.job_id
+        result['metrics_streamed'] = streamed is not None and not skipped
+        yield f"data: {json.dumps(result)}\n\n"
+    else:
+        yield f"data: {json.dumps({'type': job.status, 'error': job.error})}\n\n"
+
+def result_response(result: Dict[str, Any]) -> Response:
+    """
+    Final results in the encoding the client asks for.
+    
+    JSON is the default; a client whose Accept header prefers COLUMNS_MIMETYPE
+    gets numeric series as binary typed-array columns (see encoding.py). Either
+    body is gzip-compressed when the client accepts it.
+    """
+    if request.accept_mimetypes.best_match(['application/json', COLUMNS_MIMETYPE]) == COLUMNS_MIMETYPE:
+        body, mimetype = encode_columns(result), COLUMNS_MIMETYPE
+    else:
+        body, mimetype = json.dumps(result).encode(), 'application/json'
+    response = Response(body, mimetype=mimetype)
+    response.vary.add('Accept')
+    response.vary.add('Accept-Encoding')
+    if len(body) >= GZIP_MIN_BYTES and 'gzip' in request.accept_encodings:
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+# Background simulations: a bounded pool (SIM_JOB_WORKERS threads), so long runs
+# never occupy request threads and identical seeded submissions share one run
+jobs = JobManager(simulation_frames, key_fn=web_cache_key,
+                  max_workers=int(os.environ.get('SIM_JOB_WORKERS', 2)))
+
 @app.route('/')
 def index():
     """Serve the main frontend page."""
@@ -224,52 +324,87 @@ def index():
 
 @app.route('/api/simulate', methods=['POST'])
 def simulate():
-    """Run simulation with provided parameters."""
+    """Run simulation with provided parameters, streaming progress deltas (server-sent events)."""
     try:
         config = request.json
         
         # Validate configuration
-        required_params = ['num_miners', 'num_tasks', 'reward_multiplier']
-        for param in required_params:
-            if param not in config:
-                return jsonify({'error': f'Missing required parameter: {param}'}), 400
+        error = validate_config(config)
+        if error:
+            return jsonify({'error': error}), 400
 
-        simulation = WebBlockchainSimulation(config)
-        
-        def generate():
-            for result in simulation.run_simulation():
-                yield f"data: {json.dumps(result)}\n\n"
-        
-        return Response(generate(), mimetype='text/event-stream')
+        job = jobs.submit(config)
+        return Response(job_events(job), mimetype='text/event-stream')
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/simulate/sync', methods=['POST'])
 def simulate_sync():
-    """Run simulation synchronously (no streaming)."""
+    """Run simulation synchronously (no streaming) on the job pool and wait for it."""
     try:
         config = request.json
         
         # Validate configuration
-        required_params = ['num_miners', 'num_tasks', 'reward_multiplier']
-        for param in required_params:
-            if param not in config:
-                return jsonify({'error': f'Missing required parameter: {param}'}), 400
+        error = validate_config(config)
+        if error:
+            return jsonify({'error': error}), 400
 
-        simulation = WebBlockchainSimulation(config)
-        
-        # Run simulation and collect all results
-        results = []
-        for result in simulation.run_simulation():
-            results.append(result)
-        
-        # Return the final result
-        return jsonify(results[-1])
+        job = jobs.submit(config)
+        job.wait()
+        if job.status != 'done':
+            return jsonify({'error': job.error or f'Simulation {job.status}'}), 500
+        return result_response(job.result)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """Queue a simulation and return its job ID (poll /api/jobs/<job_id> for progress)."""
+    config = request.json
+    error = validate_config(config)
+    if error:
+        return jsonify({'error': error}), 400
+    job = jobs.submit(config)
+    return jsonify(job.to_dict()), 202
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Job status and latest progress frame."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def stream_job(job_id):
+    """Stream a job's progress deltas and final result as server-sent events."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    return Response(job_events(job), mimetype='text/event-stream')
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def get_job_result(job_id):
+    """Final results of a finished job (409 while it is still queued or running)."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    if job.status == 'done':
+        return result_response(job.result)
+    if job.status in ('queued', 'running'):
+        return jsonify({'error': 'Job has not finished', **job.to_dict()}), 409
+    return jsonify({'error': job.error or f'Job {job.status}', **job.to_dict()}), 410
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Cancel a queued or running job."""
+    job = jobs.cancel(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown job: {job_id}'}), 404
+    return jsonify(job.to_dict())
+
 @app.route('/api/config/default', methods=['GET'])
 def get_default_config():
     """
@@ -285,21 +420,7 @@ def get_default_config():
     - V = 3 verifiers per task (Equation 11)
     - n ∈ [10, 100] (Equation 13)
     """
-    return jsonify({
-        'num_miners': 20,
-        'num_tasks': 1000,
-        'reward_multiplier': 1.0,            # k = 1.0 (thesis Equations 5-8)
-        'verifier_reward_multiplier': 0.5,   # z = 0.5 (thesis Equation 8)
-        'renewable_energy_alpha': 'random',  # α_m ∈ [0, 0.5] - 'random' or fixed value
-        'byzantine_threshold': 0.2,          # e_m > 0.2 = Byzantine (thesis Equation 2)
-        'byzantine_error_rate': 0.3,         # 30% error rate (thesis Equation 3)
-        'num_verifiers': 3,                  # V = 3 verifiers per task (thesis Equation 11)
-        'input_size_min': 10,                # n ∈ [10, 100] (thesis Equation 13)
-        'input_size_max': 100,
-        'max_byzantine_miners': 3,           # Up to 3 Byzantine (thesis Section 3.1)
-        'fault_tolerance_enabled': True,     # Enable thesis Equation 4 (score-based selection)
-        'seed': None                         # Random seed for reproducibility (None = random)
-    })
+    return jsonify(DEFAULT_CONFIG)
 
 if __name__ == '__main__':
     app.run(debug=True, port=5001, threaded=True)
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+# Directory of the on-disk cache, next to the simulation modules whatever the
+# working directory (override with the SIM_CACHE_DIR environment variable)
+DEFAULT_CACHE_DIR = os.environ.get(
+    'SIM_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.sim_cache'))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Modules whose source determines cached results: the model, the engines, the
+# aggregates and metric series stored with a result, and the front ends that
+# dispatch engines and build the cached summaries (main.py) and web payloads
+# (app.py). Editing any of them changes the code version and so invalidates
+# every cached entry; analysis scripts that only choose parameters are
+# deliberately not listed.
+SIMULATION_MODULES = ('task.py', 'miner.py', 'distribution.py', 'validation.py', 'sampling.py',
+                      'simulation.py', 'vectorized.py', 'analytic.py', 'aggregation.py',
+                      'metrics.py', 'observers.py', 'main.py', 'app.py')
+
+_code_version: Optional[str] = None
+_default_cache: Optional['ResultCache'] = None
+# Setting SIM_CACHE=0 disables the shared default cache
+_default_cache_enabled = os.environ.get('SIM_CACHE', '1') != '0'
+
+
+def source_version(directory: str) -> str:
+    """Hash of the SIMULATION_MODULES sources in directory."""
+    digest = hashlib.sha256()
+    for name in SIMULATION_MODULES:
+        path = os.path.join(directory, name)
+        digest.update(name.encode())
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def code_version() -> str:
+    """Hash of the simulation source files (computed once per process)."""
+    global _code_version
+    if _code_version is None:
+        _code_version = source_version(os.path.dirname(os.path.abspath(__file__)))
+    return _code_version
+
+
+def cache_key(namespace: str, config: Dict[str, Any], seed: int) -> str:
+    """
+    Content address of a run: hash of its namespace, normalized config, seed
+    and code version.
+
+    The config must already be normalized (defaults filled in), so that
+    spelling a default explicitly or leaving it out maps to the same entry.
+    """
+    payload = json.dumps({'namespace': namespace, 'config': config, 'seed': seed,
+                          'version': code_version()}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Size-bounded on-disk cache of simulation results (SQLite, LRU eviction).
+
+    Values are stored as JSON, so anything cached must be JSON-serializable
+    (scalar run summaries, web API responses). Each operation opens its own
+    connection, which keeps the cache safe to share between threads of the
+    web server and between the parent and worker processes of a sweep.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            path: SQLite file (DEFAULT_CACHE_DIR/results.sqlite if None)
+            max_bytes: Evict least recently used entries once stored values
+                       exceed this many bytes
+        """
+        if path is None:
+            path = os.path.join(DEFAULT_CACHE_DIR, 'results.sqlite')
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS results ("
+                       "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                       "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction (committed on success) and close it."""
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key (marking it recently used), or None."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return {key: value} for every key that is cached."""
+        found = {}
+        if not keys:
+            return found
+        with self._connect() as db:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                marks = ','.join('?' * len(chunk))
+                rows = db.execute(f"SELECT key, value FROM results WHERE key IN ({marks})", chunk)
+                for key, value in rows:
+                    found[key] = json.loads(value)
+            if found:
+                now = time.time()
+                db.executemany("UPDATE results SET last_used = ? WHERE key = ?",
+                               [(now, key) for key in found])
+        return found
+
+    def put(self, key: str, value: Any):
+        """Store value under key and evict old entries if over the size bound."""
+        self.put_many({key: value})
+
+    def put_many(self, items: Dict[str, Any]):
+        """Store several values in one transaction."""
+        if not items:
+            return
+        now = time.time()
+        rows = []
+        for key, value in items.items():
+            text = json.dumps(value)
+            rows.append((key, text, len(text), now))
+        with self._connect() as db:
+            db.executemany("INSERT OR REPLACE INTO results (key, value, size, last_used) "
+                           "VALUES (?, ?, ?, ?)", rows)
+            self._evict(db)
+
+    def _evict(self, db: sqlite3.Connection):
+        """Delete least recently used entries until the total size fits max_bytes."""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        doomed = []
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY last_used"):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM results WHERE key = ?", doomed)
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self):
+        """Delete every entry."""
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
+
+
+def disable_default_cache():
+    """Make resolve_cache(True) return None for the rest of the process (e.g. --no-cache)."""
+    global _default_cache_enabled
+    _default_cache_enabled = False
+
+
+def resolve_cache(cache: Union['ResultCache', bool, None]) -> Optional['ResultCache']:
+    """
+    Map a cache argument to a ResultCache or None.
+
+    True selects the shared default cache (unless disabled), False or None
+    disables caching, and a ResultCache instance is used as is.
+    """
+    global _default_cache
+    if isinstance(cache, ResultCache):
+        return cache
+    if not cache or not _default_cache_enabled:
+        return None
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
@@ -1,10 +1,15 @@
 import random
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
 from task import Task
-from miner import Miner
+from miner import Miner, SELECTION_TIERS, TIER_MULTIPLIERS
+from sampling import TieredSampler, sample_excluding
 
 class TaskDistributor:
-    def __init__(self, miners: List[Miner], fault_tolerance_enabled: bool = True):
+    def __init__(self, miners: List[Miner], fault_tolerance_enabled: bool = True,
+                 rng: Optional[random.Random] = None, np_rng: Optional[np.random.Generator] = None,
+                 max_tier_events: int = 1000):
         """
         Initialize task distributor.
         
@@ -12,30 +17,138 @@ class TaskDistributor:
             miners: List of miners in the network
             fault_tolerance_enabled: If True, use thesis Equation 4 for selection.
                                     If False, use uniform selection (for testing).
+            rng: Random generator owned by the simulation. If None, the
+                 module-level random functions are used.
+            np_rng: NumPy generator for batched verifier selection
+                    (select_verifier_block); a fresh one if None
+            max_tier_events: Number of most recent tier moves kept in
+                             tier_events (0 = none recorded)
         """
         self.miners = miners
-        self.task_queue: List[Task] = []
+        self.task_queue: Deque[Task] = deque()
+        self._task_sources: Deque[Iterator[Task]] = deque()
         self.fault_tolerance_enabled = fault_tolerance_enabled
+        self.rng = rng if rng is not None else random
+        self.np_rng = np_rng if np_rng is not None else np.random.default_rng()
+        
+        # Incremental Eq. 4 weights: miners sit in honest/suspicious/byzantine
+        # buckets and only miners touched by a task are refreshed
+        self._positions = {miner: i for i, miner in enumerate(miners)}
+        self._sampler = TieredSampler((m.score for m in miners), (m.selection_tier() for m in miners),
+                                      TIER_MULTIPLIERS)
+        self._dirty: List[Miner] = []
+        self.tasks_distributed = 0
+        # (tasks distributed, miner_id, old tier, new tier) of the most recent bucket moves
+        self.tier_events: Deque[Tuple[int, int, str, str]] = deque(maxlen=max_tier_events)
 
     def add_task(self, task: Task):
         """Add a new task to the queue."""
         self.task_queue.append(task)
 
+    def add_tasks(self, tasks: Iterable[Task]):
+        """
+        Queue a lazy source of tasks (e.g. a generator).
+        
+        Tasks are pulled from the source one at a time, only once the explicit
+        queue is empty, so a large run never materializes its whole workload.
+        Sources are consumed in the order they were added.
+        """
+        self._task_sources.append(iter(tasks))
+
+    def next_task(self) -> Optional[Task]:
+        """Pop the next task: queued tasks first, then streamed sources."""
+        if self.task_queue:
+            return self.task_queue.popleft()
+        while self._task_sources:
+            task = next(self._task_sources[0], None)
+            if task is not None:
+                return task
+            self._task_sources.popleft()
+        return None
+
     def get_total_score(self) -> float:
         """Calculate total score of all miners."""
         return sum(miner.score for miner in self.miners)
 
+    def mark_dirty(self, *miners: Miner):
+        """
+        Schedule miners' selection weights for refresh after their score or
+        error rate changed; the buckets are updated at the next selection.
+        """
+        self._dirty.extend(miners)
+
+    def _refresh_weights(self):
+        """
+        Re-read the score and tier of every miner touched since the last selection.
+        
+        A miner changes bucket only when its error rate crossed a tier
+        threshold; moves are recorded in tier_events.
+        """
+        if not self._dirty:
+            return
+        sampler = self._sampler
+        for miner in self._dirty:
+            tier = miner.selection_tier()
+            old_tier = sampler.update(self._positions[miner], miner.score, tier)
+            if old_tier != tier:
+                self.tier_events.append((self.tasks_distributed, miner.miner_id,
+                                         SELECTION_TIERS[old_tier], SELECTION_TIERS[tier]))
+        self._dirty.clear()
+
+    def tier_counts(self) -> dict:
+        """Number of miners currently in each selection tier."""
+        self._refresh_weights()
+        return dict(zip(SELECTION_TIERS, self._sampler.counts))
+
     def select_miner(self) -> Miner:
-        """Select a miner based on their score probability."""
-        total_score = self.get_total_score()
-        probabilities = [miner.get_selection_probability(total_score, self.fault_tolerance_enabled) 
-                        for miner in self.miners]
-        return random.choices(self.miners, weights=probabilities, k=1)[0]
+        """
+        Select a miner based on their score probability.
+        
+        Per thesis Equation 4, P(m) is proportional to s_m scaled by the miner's
+        error-rate tier. A tier is picked in proportion to its multiplier times
+        its score total, then a miner within it in proportion to its score.
+        Buckets are updated only for the executor and verifiers of previously
+        distributed tasks, so each selection costs O(log M) instead of O(M).
+        """
+        self._refresh_weights()
+        u = self.rng.random()
+        if not self.fault_tolerance_enabled:
+            return self.miners[int(u * len(self.miners))]
+        total = self._sampler.total()
+        if total > 0:
+            return self.miners[self._sampler.find(u * total)]
+        # No miner has a score yet: uniform selection
+        return self.miners[int(u * len(self.miners))]
 
     def select_verifiers(self, task: Task, excluded_miner: Miner, num_verifiers: int = 3) -> List[Miner]:
-        """Select random verifiers excluding the task executor."""
-        available_verifiers = [m for m in self.miners if m != excluded_miner]
-        return random.sample(available_verifiers, min(num_verifiers, len(available_verifiers)))
+        """
+        Select random verifiers excluding the task executor.
+        
+        Draws distinct offsets from range(M - 1) and shifts those at or past
+        the executor's position by one, so no candidate list is built and the
+        cost is O(V) instead of O(M).
+        """
+        miners = self.miners
+        excluded = self._positions.get(excluded_miner)
+        if excluded is None:
+            return self.rng.sample(miners, min(num_verifiers, len(miners)))
+        offsets = self.rng.sample(range(len(miners) - 1), min(num_verifiers, len(miners) - 1))
+        return [miners[i + (i >= excluded)] for i in offsets]
+
+    def select_verifier_block(self, executor_indices: np.ndarray, num_verifiers: int = 3) -> np.ndarray:
+        """
+        Draw verifier sets for a block of tasks at once.
+        
+        Args:
+            executor_indices: Position in self.miners of each task's executor
+            num_verifiers: Verifiers per task (capped at M - 1)
+        
+        Returns:
+            int64 array of shape (len(executor_indices), V) with miner
+            positions; each row is distinct and excludes its executor
+        """
+        count = min(num_verifiers, max(len(self.miners) - 1, 0))
+        return sample_excluding(self.np_rng, len(self.miners), count, executor_indices)
 
     def distribute_task(self, num_verifiers: int = 3) -> Optional[tuple[Task, Miner, List[Miner]]]:
         """
@@ -44,14 +157,18 @@ class TaskDistributor:
         Args:
             num_verifiers: Number of verifiers to select (default: 3)
         """
-        if not self.task_queue:
+        task = self.next_task()
+        if task is None:
             return None
 
-        task = self.task_queue.pop(0)
         selected_miner = self.select_miner()
         verifiers = self.select_verifiers(task, selected_miner, num_verifiers)
         
         task.assigned_miner = selected_miner
         task.verifiers = verifiers
+        self.tasks_distributed += 1
+        
+        # Validation only changes the executor's and verifiers' score and error rate
+        self.mark_dirty(selected_miner, *verifiers)
         
         return task, selected_miner, verifiers 
\ No newline at end of file
@@ -0,0 +1,87 @@
+import json
+import struct
+from typing import Any, List, Tuple
+import numpy as np
+
+# Binary result encoding ("columns"): numeric series travel as raw little-endian
+# typed arrays instead of JSON text. Layout:
+#
+#   b'SIMC' | uint32 header length | header (UTF-8 JSON, space-padded to 4 bytes) | column data
+#
+# The header is {'document': ..., 'columns': [{'dtype', 'offset', 'length'}, ...]}
+# where 'document' is the original document with every numeric series replaced
+# by {'$col': i}. Offsets are relative to the start of the column data and
+# 4-byte aligned, so a browser can wrap them in Float32Array/Int32Array views
+# without copying.
+COLUMNS_MIMETYPE = 'application/x-sim-columns'
+COLUMNS_MAGIC = b'SIMC'
+
+# Lists shorter than this stay in the JSON header (a column reference is not smaller)
+MIN_COLUMN_LENGTH = 8
+
+_INT32_MIN, _INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+def _column_dtype(values: List[Any]):
+    """dtype for a list that should become a column, or None to keep it in JSON."""
+    if len(values) < MIN_COLUMN_LENGTH:
+        return None
+    integral = True
+    for v in values:
+        if isinstance(v, bool) or not isinstance(v, (int, float)):
+            return None
+        if integral and (isinstance(v, float) or not _INT32_MIN <= v <= _INT32_MAX):
+            integral = False
+    # Task indices and counts stay exact; metric values are plotted, so float32 suffices
+    return '<i4' if integral else '<f4'
+
+
+def encode_columns(document: Any) -> bytes:
+    """Encode a JSON-compatible document with its numeric lists as float32/int32 columns."""
+    columns: List[Tuple[str, np.ndarray]] = []
+    offset = 0
+    specs = []
+
+    def extract(node):
+        nonlocal offset
+        if isinstance(node, dict):
+            return {k: extract(v) for k, v in node.items()}
+        if isinstance(node, list):
+            dtype = _column_dtype(node)
+            if dtype is None:
+                return [extract(v) for v in node]
+            array = np.asarray(node, dtype=dtype)
+            specs.append({'dtype': 'int32' if dtype == '<i4' else 'float32',
+                          'offset': offset, 'length': len(array)})
+            columns.append(array)
+            offset += array.nbytes
+            return {'$col': len(specs) - 1}
+        return node
+
+    header = json.dumps({'document': extract(document), 'columns': specs}).encode()
+    header += b' ' * (-len(header) % 4)
+    return b''.join([COLUMNS_MAGIC, struct.pack('<I', len(header)), header]
+                    + [array.tobytes() for array in columns])
+
+
+def decode_columns(data: bytes) -> Any:
+    """Inverse of encode_columns; columns come back as lists of Python numbers."""
+    if data[:4] != COLUMNS_MAGIC:
+        raise ValueError('Not a columns-encoded document')
+    (header_length,) = struct.unpack_from('<I', data, 4)
+    header = json.loads(data[8:8 + header_length])
+    base = 8 + header_length
+    columns = [np.frombuffer(data, dtype='<i4' if spec['dtype'] == 'int32' else '<f4',
+                             count=spec['length'], offset=base + spec['offset']).tolist()
+               for spec in header['columns']]
+
+    def restore(node):
+        if isinstance(node, dict):
+            if len(node) == 1 and '$col' in node:
+                return columns[node['$col']]
+            return {k: restore(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [restore(v) for v in node]
+        return node
+
+    return restore(header['document'])
@@ -9,12 +9,19 @@ This script uses adjusted parameters that maintain realism while showing visible
 from main import (
     BlockchainSimulation,
     run_multiple_simulations,
+    run_sweep,
+    sweep_stats,
     sensitivity_analysis_byzantine_error_rate,
     sensitivity_analysis_num_verifiers,
     ablation_study
 )
+from sweep import summarize_sweep
+from cache import disable_default_cache
 import sys
 
+# Process pool size for seeded runs and sweep cells (--workers N)
+WORKERS = None
+
 def print_section(title):
     print(f"\n{'='*70}")
     print(f"  {title}")
@@ -27,6 +34,8 @@ def generate_baseline_results():
     print_section("BASELINE RESULTS (20 runs for tight CIs)")
     results = run_multiple_simulations(
         num_runs=20,  # More runs for better statistics
+        workers=WORKERS,
+        keep_raw_results=False,
         num_miners=20,
         num_tasks=2000,  # More tasks to see clearer effects
         max_byzantine=3,
@@ -46,24 +55,22 @@ def generate_error_rate_sensitivity():
     print("With fault tolerance enabled, they'll still be down-weighted")
     print()
     
+    rows = run_sweep(
+        {'byzantine_error_rate': [0.1, 0.2, 0.3, 0.4, 0.5]},
+        num_runs=10,
+        workers=WORKERS,
+        num_miners=20,
+        num_tasks=2000,
+        max_byzantine=6,  # More Byzantine miners for visible effect
+        fault_tolerance_enabled=True
+    )
     results = []
-    error_rates = [0.1, 0.2, 0.3, 0.4, 0.5]
-    
-    for rate in error_rates:
-        print(f"\nTesting Byzantine error rate: {rate:.1%}")
-        stats = run_multiple_simulations(
-            num_runs=10,
-            num_miners=20,
-            num_tasks=2000,
-            max_byzantine=6,  # More Byzantine miners for visible effect
-            byzantine_error_rate=rate,
-            fault_tolerance_enabled=True
-        )
+    for entry in summarize_sweep(rows, by=['byzantine_error_rate']):
         results.append({
-            'error_rate': rate,
-            'success_rate': stats['success_rate_mean'],
-            'success_rate_ci': stats['success_rate_ci'],
-            'efficiency': stats['efficiency_mean']
+            'error_rate': entry['byzantine_error_rate'],
+            'success_rate': entry['success_rate_mean'],
+            'success_rate_ci': entry['success_rate_ci'],
+            'efficiency': entry['useful_work_efficiency_mean']
         })
     
     print("\n=== Byzantine Error Rate Sensitivity Results ===")
@@ -78,25 +85,23 @@ def generate_error_rate_sensitivity():
 def generate_verifier_sensitivity():
     print_section("NUMBER OF VERIFIERS SENSITIVITY")
     
+    rows = run_sweep(
+        {'num_verifiers': [1, 3, 5, 7, 9]},
+        num_runs=10,
+        workers=WORKERS,
+        num_miners=20,
+        num_tasks=2000,
+        max_byzantine=3,
+        byzantine_error_rate=0.3,
+        fault_tolerance_enabled=True
+    )
     results = []
-    verifier_counts = [1, 3, 5, 7, 9]
-    
-    for V in verifier_counts:
-        print(f"\nTesting V = {V} verifiers")
-        stats = run_multiple_simulations(
-            num_runs=10,
-            num_miners=20,
-            num_tasks=2000,
-            max_byzantine=3,
-            byzantine_error_rate=0.3,
-            num_verifiers=V,
-            fault_tolerance_enabled=True
-        )
+    for entry in summarize_sweep(rows, by=['num_verifiers']):
         results.append({
-            'num_verifiers': V,
-            'success_rate': stats['success_rate_mean'],
-            'success_rate_ci': stats['success_rate_ci'],
-            'efficiency': stats['efficiency_mean']
+            'num_verifiers': entry['num_verifiers'],
+            'success_rate': entry['success_rate_mean'],
+            'success_rate_ci': entry['success_rate_ci'],
+            'efficiency': entry['useful_work_efficiency_mean']
         })
     
     print("\n=== Number of Verifiers Sensitivity Results ===")
@@ -111,38 +116,27 @@ def generate_verifier_sensitivity():
 def generate_ablation_results():
     print_section("ABLATION STUDY")
     
-    # Baseline: Full model
-    print("\n1. Full Model (with renewable bonus + fault tolerance)")
-    baseline = run_multiple_simulations(
-        num_runs=10,
-        num_miners=20,
-        num_tasks=2000,
-        max_byzantine=3,
-        renewable_energy_alpha=None,
-        fault_tolerance_enabled=True
-    )
+    print("1. Full Model (with renewable bonus + fault tolerance)")
+    print("2. No Renewable Energy Bonus (α=0 for all)")
+    print("3. No Fault Tolerance (uniform selection) - with 6 Byzantine miners")
     
-    # Ablation 1: No renewable bonus
-    print("\n2. No Renewable Energy Bonus (α=0 for all)")
-    no_green = run_multiple_simulations(
+    arms = [
+        # Baseline: Full model
+        {'max_byzantine': [3], 'renewable_energy_alpha': [None], 'fault_tolerance_enabled': [True]},
+        # Ablation 1: No renewable bonus
+        {'max_byzantine': [3], 'renewable_energy_alpha': [0.0], 'fault_tolerance_enabled': [True]},
+        # Ablation 2: No fault tolerance - use MORE Byzantine miners to show effect
+        {'max_byzantine': [6], 'renewable_energy_alpha': [None], 'fault_tolerance_enabled': [False]},
+    ]
+    rows = run_sweep(
+        arms,
         num_runs=10,
+        workers=WORKERS,
         num_miners=20,
-        num_tasks=2000,
-        max_byzantine=3,
-        renewable_energy_alpha=0.0,
-        fault_tolerance_enabled=True
-    )
-    
-    # Ablation 2: No fault tolerance - use MORE Byzantine miners to show effect
-    print("\n3. No Fault Tolerance (uniform selection) - with 6 Byzantine miners")
-    no_ft = run_multiple_simulations(
-        num_runs=10,
-        num_miners=20,
-        num_tasks=2000,
-        max_byzantine=6,  # More Byzantine for visible effect
-        renewable_energy_alpha=None,
-        fault_tolerance_enabled=False  # This should show big drop
+        num_tasks=2000
     )
+    baseline, no_green, no_ft = (sweep_stats(entry) for entry in summarize_sweep(
+        rows, by=['max_byzantine', 'renewable_energy_alpha', 'fault_tolerance_enabled']))
     
     print("\n=== Ablation Study Summary ===")
     print(f"Full Model: Success = {baseline['success_rate_mean']:.2%}, Efficiency = {baseline['efficiency_mean']:.2%}")
@@ -165,8 +159,17 @@ if __name__ == "__main__":
     # Create results directory if it doesn't exist
     os.makedirs('results_thesis', exist_ok=True)
     
-    if len(sys.argv) > 1:
-        mode = sys.argv[1]
+    args = sys.argv[1:]
+    if "--workers" in args:
+        idx = args.index("--workers")
+        WORKERS = int(args[idx + 1])
+        del args[idx:idx + 2]
+    if "--no-cache" in args:
+        args.remove("--no-cache")
+        disable_default_cache()
+    
+    if len(args) > 0:
+        mode = args[0]
         
         if mode == "baseline":
             results = generate_baseline_results()
@@ -190,9 +193,9 @@ if __name__ == "__main__":
             print("="*70)
         else:
             print(f"Unknown mode: {mode}")
-            print("Usage: python generate_thesis_results.py [baseline|sensitivity-error|sensitivity-verifiers|ablation|all]")
+            print("Usage: python generate_thesis_results.py [baseline|sensitivity-error|sensitivity-verifiers|ablation|all] [--workers N] [--no-cache]")
     else:
-        print("Usage: python generate_thesis_results.py [baseline|sensitivity-error|sensitivity-verifiers|ablation|all]")
+        print("Usage: python generate_thesis_results.py [baseline|sensitivity-error|sensitivity-verifiers|ablation|all] [--workers N] [--no-cache]")
         print()
         print("This script generates thesis-quality results with parameters adjusted to show clear effects.")
         print()
@@ -203,6 +206,10 @@ if __name__ == "__main__":
         print("  ablation              - Test system with/without features")
         print("  all                   - Generate all results (~30-45 minutes)")
         print()
+        print("Options:")
+        print("  --workers N           - Run seeded runs and sweep cells on N processes")
+        print("  --no-cache            - Recompute runs already stored in the .sim_cache/ result cache")
+        print()
         print("Why different parameters?")
         print("  - More Byzantine miners (6 instead of 3) to show clearer effects in sensitivity analysis")
         print("  - More tasks (2000 instead of 1000) for better statistical power")
@@ -0,0 +1,208 @@
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Dict, Iterator, Optional, Union
+import numpy as np
+from task import TaskType
+
+# Task types are stored as their position in TaskType's declaration order
+TASK_TYPES = list(TaskType)
+TASK_TYPE_CODES = {task_type: code for code, task_type in enumerate(TASK_TYPES)}
+
+# Column name → dtype. Roughly 24 bytes per task instead of a five-key dict.
+HISTORY_COLUMNS = {
+    'task_id': np.int64,
+    'miner_id': np.int32,
+    'is_byzantine': np.bool_,
+    'is_valid': np.bool_,
+    'num_verifiers': np.int32,
+    'task_type': np.int8,
+    'cost': np.float64,
+}
+
+
+class TaskHistory:
+    """
+    Columnar per-task outcome log.
+
+    Each column is a typed NumPy array that grows by doubling. Iterating or
+    indexing yields the same row dictionaries the simulation used to append
+    (plus task_type and cost), so existing analysis code keeps working, while
+    column() gives direct array access for vectorized analysis.
+
+    With spill_threshold set, rows are flushed to one raw binary file per
+    column (in a private subdirectory of spill_dir) whenever that many rows
+    are buffered in memory, and column() maps the spilled part back with
+    np.memmap. Spill files are deleted by load() or discard(), or when the
+    history is garbage collected or the interpreter exits normally; processes
+    that end with os._exit (pool workers) must call one of them. A pickled
+    copy holds all rows in memory and shares no files with the original.
+    """
+
+    def __init__(self, capacity: int = 1024, spill_threshold: Optional[int] = None,
+                 spill_dir: Optional[str] = None):
+        """
+        Args:
+            capacity: Initial number of rows allocated in memory
+            spill_threshold: If set, spill buffered rows to disk once this many
+                             are held in memory
+            spill_dir: Parent directory for spill files (the system temporary
+                       directory if None)
+        """
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self._spill_path_dir: Optional[str] = None
+        self._cleanup: Optional[weakref.finalize] = None  # Deletes the spill directory
+        self._size = 0
+        self._spilled = 0
+        self._columns = {name: np.empty(max(capacity, 1), dtype=dtype)
+                         for name, dtype in HISTORY_COLUMNS.items()}
+
+    def __len__(self) -> int:
+        return self._spilled + self._size
+
+    def _reserve(self, extra: int):
+        """Make room for extra more buffered rows."""
+        needed = self._size + extra
+        capacity = len(self._columns['task_id'])
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def append(self, task_id: int, miner_id: int, is_byzantine: bool, is_valid: bool,
+               num_verifiers: int, task_type: Union[TaskType, int] = 0, cost: float = 0.0):
+        """Record the outcome of one task."""
+        if self._size == len(self._columns['task_id']):
+            self._reserve(1)
+        i = self._size
+        columns = self._columns
+        columns['task_id'][i] = task_id
+        columns['miner_id'][i] = miner_id
+        columns['is_byzantine'][i] = is_byzantine
+        columns['is_valid'][i] = is_valid
+        columns['num_verifiers'][i] = num_verifiers
+        columns['task_type'][i] = TASK_TYPE_CODES[task_type] if isinstance(task_type, TaskType) else task_type
+        columns['cost'][i] = cost
+        self._size += 1
+        if self.spill_threshold is not None and self._size >= self.spill_threshold:
+            self.flush()
+
+    def extend(self, **columns: np.ndarray):
+        """Record many tasks at once from equally long column arrays (task_type as codes)."""
+        count = len(columns['task_id'])
+        self._reserve(count)
+        for name in HISTORY_COLUMNS:
+            target = self._columns[name]
+            if name in columns:
+                target[self._size:self._size + count] = columns[name]
+            else:
+                target[self._size:self._size + count] = 0
+        self._size += count
+        if self.spill_threshold is not None and self._size >= self.spill_threshold:
+            self.flush()
+
+    def _spill_path(self, name: str) -> str:
+        return os.path.join(self._spill_path_dir, f"{name}.bin")
+
+    def flush(self):
+        """Append all buffered rows to the spill files and empty the buffer."""
+        if self._size == 0:
+            return
+        if self._spill_path_dir is None:
+            if self.spill_dir is not None:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill_path_dir = tempfile.mkdtemp(prefix='task_history_', dir=self.spill_dir)
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self._spill_path_dir, True)
+        for name, column in self._columns.items():
+            with open(self._spill_path(name), 'ab') as f:
+                f.write(column[:self._size].tobytes())
+        self._spilled += self._size
+        self._size = 0
+
+    def shrink_to_fit(self):
+        """Release unused buffer capacity (e.g. before keeping or pickling a finished run)."""
+        for name, column in self._columns.items():
+            self._columns[name] = column[:max(self._size, 1)].copy()
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return one column as an array over all rows.
+
+        Fully spilled histories return a read-only memory map; otherwise the
+        spilled and buffered parts are concatenated.
+        """
+        buffered = self._columns[name][:self._size]
+        if self._spilled == 0:
+            return buffered
+        spilled = np.memmap(self._spill_path(name), dtype=HISTORY_COLUMNS[name],
+                            mode='r', shape=(self._spilled,))
+        if self._size == 0:
+            return spilled
+        return np.concatenate([spilled, buffered])
+
+    def _row(self, columns: Dict[str, np.ndarray], i: int) -> Dict:
+        return {
+            'task_id': int(columns['task_id'][i]),
+            'miner_id': int(columns['miner_id'][i]),
+            'is_byzantine': bool(columns['is_byzantine'][i]),
+            'is_valid': bool(columns['is_valid'][i]),
+            'num_verifiers': int(columns['num_verifiers'][i]),
+            'task_type': TASK_TYPES[columns['task_type'][i]].value,
+            'cost': float(columns['cost'][i]),
+        }
+
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("task history index out of range")
+        if index >= self._spilled:
+            return self._row(self._columns, index - self._spilled)
+        columns = {name: self.column(name) for name in HISTORY_COLUMNS}
+        return self._row(columns, index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        columns = {name: self.column(name) for name in HISTORY_COLUMNS}
+        for i in range(len(self)):
+            yield self._row(columns, i)
+
+    def to_dicts(self):
+        """Materialize the history as a list of row dictionaries."""
+        return list(self)
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        if self._spilled:
+            state['_columns'] = {name: np.array(self.column(name)) for name in HISTORY_COLUMNS}
+            state['_size'] = len(self)
+            state['_spilled'] = 0
+        state['_spill_path_dir'] = None
+        state['_cleanup'] = None
+        return state
+
+    def load(self):
+        """Read spilled rows back into memory, delete the spill files and stop spilling."""
+        if self._spilled:
+            self._columns = {name: np.array(self.column(name)) for name in HISTORY_COLUMNS}
+            self._size = len(self)
+            self._spilled = 0
+        self.spill_threshold = None
+        if self._cleanup is not None:
+            self._cleanup()
+            self._cleanup = None
+        self._spill_path_dir = None
+
+    def discard(self):
+        """Drop all rows and delete any spill files."""
+        if self._cleanup is not None:
+            self._cleanup()
+            self._cleanup = None
+        self._spill_path_dir = None
+        self._spilled = 0
+        self._size = 0
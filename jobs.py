@@ -0,0 +1,209 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Job lifecycle: queued → running → done | failed | cancelled
+JOB_STATES = ('queued', 'running', 'done', 'failed', 'cancelled')
+FINISHED_STATES = ('done', 'failed', 'cancelled')
+
+# Progress frames kept per running job for subscribers that read behind the runner
+FRAME_BUFFER = 64
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's runner thread once cancellation was requested."""
+
+
+class Job:
+    """One submitted simulation and its progress, result or error."""
+
+    def __init__(self, config: Dict[str, Any], key: Optional[str] = None):
+        self.job_id = uuid.uuid4().hex
+        self.config = config
+        self.key = key  # Deduplication key (None = never shared)
+        self.submitters = 1  # Submissions sharing this job that have not cancelled it
+        self.status = 'queued'
+        self.progress: Dict[str, Any] = {}  # Latest progress frame
+        self.frames: Deque[Dict[str, Any]] = deque(maxlen=FRAME_BUFFER)  # Most recent progress frames
+        self.published = 0  # Progress frames published so far
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._changed = threading.Condition()
+        self._future = None
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job has finished; False if the timeout expired first."""
+        return self._done.wait(timeout)
+
+    def frames_after(self, start: int, timeout: Optional[float] = None) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """
+        Progress frames from sequence number start on, waiting up to timeout
+        for one if there are none yet. Returns (frames, first, finished), where
+        first is the sequence number of frames[0] (or of the next frame if
+        there are none). Only the FRAME_BUFFER most recent frames are kept, and
+        none once the job has finished, so first > start means frames were
+        missed. Once finished is True no further frames will be published.
+        """
+        with self._changed:
+            if self.published <= start and self.status not in FINISHED_STATES:
+                self._changed.wait(timeout)
+            oldest = self.published - len(self.frames)
+            first = max(start, oldest)
+            return list(self.frames)[first - oldest:], first, self.status in FINISHED_STATES
+
+    def _publish(self, frame: Dict[str, Any]):
+        with self._changed:
+            self.frames.append(frame)
+            self.published += 1
+            self.progress = frame
+            self._changed.notify_all()
+
+    def _finish(self, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        with self._changed:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished = time.time()
+            # The result supersedes the progress frames; keep only the latest as a snapshot
+            self.frames.clear()
+            self._changed.notify_all()
+        self._done.set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status view for the API (without the result payload or metric deltas)."""
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'progress': {k: v for k, v in self.progress.items() if k != 'delta'},
+            'error': self.error,
+            'created': self.created,
+            'finished': self.finished,
+        }
+
+
+class JobManager:
+    """
+    Runs simulations on a bounded thread pool and tracks them by job ID.
+
+    The runner is called as runner(config) and must return an iterator of
+    frames: dicts with 'type': 'progress' while running and a last frame with
+    'type': 'final', which becomes the job result. Cancellation is checked
+    between frames, so a running job stops at its next progress frame.
+
+    Submissions whose key_fn(config) is not None are deduplicated: a config
+    with the same key as a queued, running or finished job returns that job
+    instead of starting another run. A shared job is only cancelled once
+    every submission of it has been cancelled. Only the most recent
+    max_finished finished jobs are remembered.
+    """
+
+    def __init__(self, runner: Callable[[Dict[str, Any]], Iterator[Dict[str, Any]]],
+                 key_fn: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
+                 max_workers: int = 2, max_finished: int = 100):
+        """
+        Args:
+            runner: Produces the frames of one simulation
+            key_fn: Deduplication key of a config (None = not deduplicated)
+            max_workers: Number of simulations run at the same time
+            max_finished: Number of finished jobs kept for polling
+        """
+        self.runner = runner
+        self.key_fn = key_fn
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='simulation')
+        self._lock = threading.Lock()
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._by_key: Dict[str, Job] = {}
+
+    def submit(self, config: Dict[str, Any]) -> Job:
+        """Queue a simulation, or return the existing job for an identical seeded config."""
+        key = self.key_fn(config) if self.key_fn is not None else None
+        with self._lock:
+            existing = self._by_key.get(key) if key is not None else None
+            if (existing is not None and existing.status not in ('failed', 'cancelled')
+                    and not existing.cancel_requested):
+                existing.submitters += 1
+                return existing
+            job = Job(config, key)
+            self._jobs[job.job_id] = job
+            if key is not None:
+                self._by_key[key] = job
+            self._prune()
+        job._future = self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Withdraw one submission of a job. Once no submission is left, a queued
+        job is cancelled at once and a running one at its next progress frame;
+        finished jobs are left as they are.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES or job.cancel_requested:
+                return job
+            job.submitters -= 1
+            if job.submitters > 0:
+                return job
+            job._cancel.set()
+        self._stop(job)
+        return job
+
+    def _stop(self, job: Job):
+        """Finish a cancelled job that has not started running yet."""
+        if job._future is not None and job._future.cancel():
+            job._finish('cancelled')
+
+    def _run(self, job: Job):
+        with self._lock:
+            if not job.cancel_requested:
+                job.status = 'running'
+        if job.status != 'running':
+            job._finish('cancelled')
+            return
+        try:
+            for frame in self.runner(job.config):
+                if frame.get('type') == 'final':
+                    job._finish('done', result=frame)
+                    return
+                job._publish(frame)
+                if job.cancel_requested:
+                    raise JobCancelled()
+            job._finish('failed', error='Simulation ended without a final result')
+        except JobCancelled:
+            job._finish('cancelled')
+        except Exception as e:
+            job._finish('failed', error=str(e))
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond max_finished (caller holds the lock)."""
+        finished = [job for job in self._jobs.values() if job.status in FINISHED_STATES]
+        for job in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job.job_id]
+            if job.key is not None and self._by_key.get(job.key) is job:
+                del self._by_key[job.key]
+
+    def shutdown(self, wait: bool = True):
+        """Cancel queued and running jobs, however many submissions share them, and stop the pool."""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if job.status not in FINISHED_STATES]
+            for job in jobs:
+                job._cancel.set()
+        for job in jobs:
+            self._stop(job)
+        self._executor.shutdown(wait=wait)
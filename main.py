@@ -1,19 +1,31 @@
-import random
-from typing import List, Dict, Tuple
+import inspect
+from typing import List, Dict, Tuple, Union
 import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from task import Task, TaskType
-from miner import Miner
-from distribution import TaskDistributor
-from validation import ValidationManager
+from simulation import SimulationCore
+from observers import ConsoleReporter, PlotRecorder
 from visualization import Visualizer
+from vectorized import VectorizedEngine
+from analytic import MeanFieldModel, tiers_stable
+from aggregation import RunningStats
+from sweep import expand_grid, execute_cells, summarize_sweep
+from cache import ResultCache, cache_key, disable_default_cache, resolve_cache
 
-class BlockchainSimulation:
+# Simulation engines selectable via BlockchainSimulation(engine=...)
+ENGINES = ('object', 'vectorized', 'analytic', 'hybrid')
+
+class BlockchainSimulation(SimulationCore):
     def __init__(self, num_miners: int = 20, num_tasks: int = 1000, 
                  max_byzantine: int = 3, byzantine_error_rate: float = 0.3,
                  reward_multiplier: float = 1.0, renewable_energy_alpha: float = None,
                  num_verifiers: int = 3, byzantine_threshold: float = 0.2,
-                 fault_tolerance_enabled: bool = True, seed: int = None):
+                 fault_tolerance_enabled: bool = True, seed: int = None,
+                 engine: str = 'object', independent_verification: bool = False,
+                 input_size_min: int = 10, input_size_max: int = 100,
+                 multiplication_mode: str = 'exact',
+                 history_spill_threshold: int = None, history_spill_dir: str = None,
+                 verifier_fault_model: str = 'honest', verifier_reward_multiplier: float = 0.5):
         """
         Initialize blockchain simulation with configurable parameters.
         
@@ -29,135 +41,226 @@ class BlockchainSimulation:
             byzantine_threshold: Threshold for Byzantine detection (thesis Eq.2: 0.2)
             fault_tolerance_enabled: Enable Byzantine fault tolerance (Eq.4 penalties)
             seed: Random seed for reproducibility
+            engine: 'object' runs one Task/Miner object call chain per task;
+                    'vectorized' keeps miner state in NumPy arrays (see VectorizedEngine).
+                    Both implement the same model and agree statistically.
+                    'analytic' returns expected values from the mean-field model
+                    (see MeanFieldModel) without drawing tasks; 'hybrid' runs the
+                    vectorized engine until every miner's error-rate tier has
+                    settled and models the remaining tasks analytically.
+            independent_verification: If True, each verifier re-executes its task
+                                      instead of checking the cached ground truth
+                                      (object engine only; outcomes are identical)
+            input_size_min: Minimum task input size n (thesis Eq.13: 10)
+            input_size_max: Maximum task input size n (thesis Eq.13: 100)
+            multiplication_mode: 'exact', 'modular' (mod 2^61-1) or 'log' products for
+                                 MULTIPLICATION tasks; the bounded modes keep
+                                 stress runs with large input sizes cheap
+            history_spill_threshold: If set, task_history spills to memory-mapped
+                                     files once this many rows are held in memory
+            history_spill_dir: Parent directory for task_history spill files
+            verifier_fault_model: How verifiers vote: 'honest', 'random_flip'
+                                  (flip at the verifier's error probability),
+                                  'collude' (Byzantine verifiers approve Byzantine
+                                  executors only) or 'always_reject' (Byzantine
+                                  verifiers reject everything). The analytic and
+                                  hybrid engines assume honest verifiers.
+            verifier_reward_multiplier: z value (thesis Eq.8: default 0.5)
         """
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
-        
-        # Create miners with deterministic Byzantine selection
-        self.miners = Miner.create_miners(
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}")
+        if engine in ('analytic', 'hybrid') and verifier_fault_model != 'honest':
+            raise ValueError(f"The {engine} engine assumes honest verifiers")
+        super().__init__(
             num_miners=num_miners,
+            num_tasks=num_tasks,
             max_byzantine=max_byzantine,
             byzantine_error_rate=byzantine_error_rate,
-            renewable_energy_alpha=renewable_energy_alpha
+            reward_multiplier=reward_multiplier,
+            verifier_reward_multiplier=verifier_reward_multiplier,
+            renewable_energy_alpha=renewable_energy_alpha,
+            num_verifiers=num_verifiers,
+            byzantine_threshold=byzantine_threshold,
+            fault_tolerance_enabled=fault_tolerance_enabled,
+            seed=seed,
+            independent_verification=independent_verification,
+            input_size_min=input_size_min,
+            input_size_max=input_size_max,
+            multiplication_mode=multiplication_mode,
+            history_spill_threshold=history_spill_threshold,
+            history_spill_dir=history_spill_dir,
+            verifier_fault_model=verifier_fault_model
         )
-        self.distributor = TaskDistributor(self.miners, fault_tolerance_enabled=fault_tolerance_enabled)
-        self.validator = ValidationManager(k=reward_multiplier)  # Per thesis Equations 5-8
         self.visualizer = Visualizer()
-        self.total_tasks = num_tasks
-        self.completed_tasks = 0
-        self.successful_tasks = 0
-        self.byzantine_threshold = byzantine_threshold
-        self.actual_byzantine_count = sum(1 for m in self.miners if m.is_byzantine)
-        self.num_verifiers = num_verifiers
-        self.fault_tolerance_enabled = fault_tolerance_enabled
-        
-        # Metrics tracking for analysis
-        self.task_history = []
-        self.success_rate_history = []
-        self.miner_selection_count = {m.miner_id: 0 for m in self.miners}
-
-    def generate_random_task(self) -> Task:
-        """Generate a random task with random input size."""
-        task_type = random.choice(list(TaskType))
-        input_size = random.randint(10, 100)
-        return Task(task_type, input_size)
+        self.engine = engine
 
     def run_simulation(self, verbose: bool = True):
         """Run the main simulation loop."""
+        if self.engine == 'vectorized':
+            return self.run_vectorized_simulation(verbose=verbose)
+        if self.engine in ('analytic', 'hybrid'):
+            return self.run_analytic_simulation(verbose=verbose)
+
+        # The object engine is the shared per-task loop of SimulationCore;
+        # console output and plotting are observers attached only when verbose
         if verbose:
-            print("Starting blockchain mining simulation...")
-            print(f"Number of miners: {len(self.miners)}")
-            print(f"Number of tasks: {self.total_tasks}")
-            print(f"Byzantine miners: {self.actual_byzantine_count}")
-            print(f"Number of verifiers per task (V): {self.num_verifiers}")
-            print(f"Byzantine fault tolerance: {'Enabled' if self.fault_tolerance_enabled else 'Disabled'}")
-            print(f"Byzantine threshold: {self.byzantine_threshold:.2%}")
-            print("\nInitial miner states:")
-            for miner in self.miners:
-                print(miner)
-            print("\nStarting tasks...")
-
-        # Generate initial task queue
-        for _ in range(self.total_tasks):
-            self.distributor.add_task(self.generate_random_task())
-
-        while self.completed_tasks < self.total_tasks:
-            # Distribute task with configured number of verifiers
-            distribution_result = self.distributor.distribute_task(num_verifiers=self.num_verifiers)
-            if not distribution_result:
-                break
-
-            task, miner, verifiers = distribution_result
-            
-            # Track miner selection
-            self.miner_selection_count[miner.miner_id] += 1
-            
-            # Only print every 100th task to avoid console spam
-            if verbose and (self.completed_tasks + 1) % 100 == 0:
-                print(f"\nTask {self.completed_tasks + 1}/{self.total_tasks}")
-                print(f"Assigned to: {miner}")
-                print(f"Verifiers: {len(verifiers)}")
-
-            # Execute task
-            solution = miner.execute_task(task)
-
-            # Validate and process rewards
-            is_valid = self.validator.process_validation(task, solution)
-            if is_valid:
-                self.successful_tasks += 1
-                if verbose and (self.completed_tasks + 1) % 100 == 0:
-                    print("Task completed successfully!")
-            else:
-                if verbose and (self.completed_tasks + 1) % 100 == 0:
-                    print("Task failed validation.")
-                    if miner.error_rate > self.byzantine_threshold:
-                        print(f"WARNING: Miner {miner.miner_id} shows Byzantine behavior! "
-                              f"Error rate: {miner.error_rate:.2%}")
-
-            self.completed_tasks += 1
-            success_rate = self.successful_tasks / self.completed_tasks
-            self.success_rate_history.append(success_rate)
-            
-            # Store task outcome for analysis
-            self.task_history.append({
-                'task_id': self.completed_tasks,
-                'miner_id': miner.miner_id,
-                'is_byzantine': miner.is_byzantine,
-                'is_valid': is_valid,
-                'num_verifiers': len(verifiers)
-            })
-            
-            if verbose and (self.completed_tasks) % 100 == 0:
-                print(f"Current success rate: {success_rate:.2%}")
-
-            # Update visualization (only if verbose)
-            if verbose:
-                self.visualizer.update_metrics(self.miners, success_rate)
-                if self.completed_tasks % 100 == 0:  # Update plot every 100 tasks
-                    self.visualizer.plot_metrics()
-
-        # Final visualization
+            self.add_observer(PlotRecorder(self.visualizer))
+            self.add_observer(ConsoleReporter())
+        self.run_tasks()
+        self.finish()
+        
+        return self.get_simulation_results()
+
+    def run_vectorized_simulation(self, verbose: bool = True):
+        """
+        Run the simulation with the NumPy array engine.
+
+        Produces the same results dictionary as the object engine. When verbose,
+        per-task score/token snapshots are recorded to feed the Visualizer.
+        """
+        if verbose:
+            self.print_initial_state()
+
+        engine = VectorizedEngine(
+            self.miners,
+            num_verifiers=self.num_verifiers,
+            k=self.validator.k,
+            z=self.validator.z,
+            fault_tolerance_enabled=self.fault_tolerance_enabled,
+            input_size_min=self.input_size_min,
+            input_size_max=self.input_size_max,
+            rng=self.np_rng,
+            verifier_fault_model=self.validator.verifier_fault_model
+        )
+        run = engine.run(self.total_tasks, record_trace=verbose)
+        self.aggregates.rebuild()  # Miner state was written back in bulk
+        executors = run['executor']
+        is_valid = run['is_valid']
+
+        self.completed_tasks = len(executors)
+        self.successful_tasks = int(is_valid.sum())
+        successes = np.cumsum(is_valid)
+        self.success_rate_history = (successes / np.arange(1, self.completed_tasks + 1)).tolist()
+        counts = np.bincount(executors, minlength=len(self.miners))
+        self.miner_selection_count = {m.miner_id: int(counts[i]) for i, m in enumerate(self.miners)}
+        miner_ids = np.array([m.miner_id for m in self.miners])
+        self.task_history.extend(
+            task_id=np.arange(1, self.completed_tasks + 1),
+            miner_id=miner_ids[executors],
+            is_byzantine=engine.is_byzantine[executors],
+            is_valid=is_valid,
+            num_verifiers=np.full(self.completed_tasks, engine.num_verifiers),
+            task_type=run['types'],
+            cost=run['costs']
+        )
+        self.task_history.shrink_to_fit()
+
         if verbose:
+            avg_renewable = float(engine.renewable.mean())
+            for i, miner in enumerate(self.miners):
+                self.visualizer.miner_scores_history[miner.miner_id] = run['score_trace'][:, i].tolist()
+                self.visualizer.token_distribution_history[miner.miner_id] = run['token_trace'][:, i].tolist()
+            self.visualizer.renewable_energy_history = [avg_renewable] * self.completed_tasks
+            self.visualizer.task_success_history = list(self.success_rate_history)
             self.visualizer.plot_metrics()
             self.print_final_stats()
-        
+
+        return self.get_simulation_results()
+
+    def _record_vectorized_run(self, engine: VectorizedEngine, run: Dict, offset: int = 0):
+        """Fold a vectorized run of tasks offset+1.. into the counters and task history."""
+        executors = run['executor']
+        is_valid = run['is_valid']
+        count = len(executors)
+        counts = np.bincount(executors, minlength=len(self.miners))
+        for i, miner in enumerate(self.miners):
+            self.miner_selection_count[miner.miner_id] += int(counts[i])
+        miner_ids = np.array([m.miner_id for m in self.miners])
+        self.task_history.extend(
+            task_id=np.arange(offset + 1, offset + count + 1),
+            miner_id=miner_ids[executors],
+            is_byzantine=engine.is_byzantine[executors],
+            is_valid=is_valid,
+            num_verifiers=np.full(count, engine.num_verifiers),
+            task_type=run['types'],
+            cost=run['costs']
+        )
+        successes = self.successful_tasks + np.cumsum(is_valid)
+        self.success_rate_history.extend((successes / np.arange(offset + 1, offset + count + 1)).tolist())
+        self.completed_tasks += count
+        self.successful_tasks += int(is_valid.sum())
+
+    def run_analytic_simulation(self, verbose: bool = True):
+        """
+        Run the 'analytic' or 'hybrid' engine.
+
+        'analytic' integrates the mean-field model over all tasks. 'hybrid'
+        first simulates chunks of tasks with the vectorized engine until every
+        miner's observed error-rate tier matches its long-run tier (the regime
+        the mean-field model assumes), then models the remaining tasks
+        analytically. Modelled tasks contribute expected values: counts and
+        token totals may be fractional, and they do not appear in task_history.
+        """
+        if verbose:
+            self.print_initial_state()
+
+        if self.engine == 'hybrid':
+            chunk = max(1, self.total_tasks // 50)
+            while self.completed_tasks < self.total_tasks and not (self.completed_tasks and tiers_stable(self.miners)):
+                engine = VectorizedEngine(
+                    self.miners,
+                    num_verifiers=self.num_verifiers,
+                    k=self.validator.k,
+                    z=self.validator.z,
+                    fault_tolerance_enabled=self.fault_tolerance_enabled,
+                    input_size_min=self.input_size_min,
+                    input_size_max=self.input_size_max,
+                    rng=self.np_rng
+                )
+                run = engine.run(min(chunk, self.total_tasks - self.completed_tasks))
+                self._record_vectorized_run(engine, run, offset=self.completed_tasks)
+            self.task_history.shrink_to_fit()
+
+        remaining = self.total_tasks - self.completed_tasks
+        if remaining > 0:
+            model = MeanFieldModel(
+                self.miners,
+                num_verifiers=self.num_verifiers,
+                k=self.validator.k,
+                z=self.validator.z,
+                fault_tolerance_enabled=self.fault_tolerance_enabled,
+                input_size_min=self.input_size_min,
+                input_size_max=self.input_size_max
+            )
+            expected = model.run(remaining)
+            for i, miner in enumerate(self.miners):
+                self.miner_selection_count[miner.miner_id] += float(expected['selection_count'][i])
+            # Expected cumulative success rate, one entry per modelled task
+            per_task = np.repeat(expected['step_success'], np.diff(expected['step_ends'], prepend=0))
+            successes = self.successful_tasks + np.cumsum(per_task)
+            first = self.completed_tasks + 1
+            self.success_rate_history.extend((successes / np.arange(first, first + remaining)).tolist())
+            self.successful_tasks += expected['successful_tasks']
+            self.completed_tasks += remaining
+        self.aggregates.rebuild()  # Miner state was written back in bulk
+
+        if verbose:
+            self.print_final_stats()
+
         return self.get_simulation_results()
 
     def get_simulation_results(self) -> Dict:
         """Get comprehensive simulation results for analysis."""
-        byzantine_miners = [m for m in self.miners if m.error_rate > self.byzantine_threshold]
-        honest_miners = [m for m in self.miners if m.error_rate <= self.byzantine_threshold]
-        
+        aggregates = self.aggregates
         results = {
             'success_rate': self.successful_tasks / self.completed_tasks if self.completed_tasks > 0 else 0,
             'total_tasks': self.completed_tasks,
             'successful_tasks': self.successful_tasks,
-            'byzantine_count': len(byzantine_miners),
-            'avg_tasks_honest': np.mean([m.tasks_completed for m in honest_miners]) if honest_miners else 0,
-            'avg_tasks_byzantine': np.mean([m.tasks_completed for m in byzantine_miners]) if byzantine_miners else 0,
-            'avg_tokens_honest': np.mean([m.tokens for m in honest_miners]) if honest_miners else 0,
-            'avg_tokens_byzantine': np.mean([m.tokens for m in byzantine_miners]) if byzantine_miners else 0,
+            'byzantine_count': aggregates.count(byzantine=True),
+            'avg_tasks_honest': aggregates.avg_tasks(byzantine=False),
+            'avg_tasks_byzantine': aggregates.avg_tasks(byzantine=True),
+            'avg_tokens_honest': aggregates.avg_tokens(byzantine=False),
+            'avg_tokens_byzantine': aggregates.avg_tokens(byzantine=True),
             'task_history': self.task_history,
             'miner_selection_count': self.miner_selection_count,
             'miners': self.miners,
@@ -166,104 +269,129 @@ class BlockchainSimulation:
         }
         return results
     
-    def calculate_useful_work_efficiency(self) -> float:
-        """
-        Calculate useful work efficiency η = U/(U+W).
-        U = useful work (successful tasks), W = wasted work (failed tasks + verification overhead).
-        """
-        useful_work = self.successful_tasks
-        wasted_work = (self.completed_tasks - self.successful_tasks) + (self.completed_tasks * self.num_verifiers * 0.1)
-        return useful_work / (useful_work + wasted_work) if (useful_work + wasted_work) > 0 else 0
-    
-    def print_final_stats(self):
-        """Print final simulation statistics with detailed Byzantine analysis."""
-        print("\n=== Final Statistics ===")
-        print("\n1. Overall Performance:")
-        print(f"   Total tasks completed: {self.completed_tasks}")
-        print(f"   Successful tasks: {self.successful_tasks}")
-        print(f"   Overall success rate: {(self.successful_tasks / self.completed_tasks):.2%}")
-        print(f"   Useful work efficiency (η): {self.calculate_useful_work_efficiency():.2%}")
-        
-        # Byzantine Analysis
-        byzantine_miners = [m for m in self.miners if m.error_rate > self.byzantine_threshold]
-        print(f"   {len(byzantine_miners)} miners showed Byzantine behavior (error rate > {self.byzantine_threshold:.0%})")
-        
-        print("\n2. Byzantine Miners (error rate > 20%):")
-        # Sort byzantine miners by error rate
-        byzantine_miners.sort(key=lambda x: x.error_rate, reverse=True)
-        for miner in byzantine_miners:
-            print(f"   Miner {miner.miner_id}: {miner.error_rate:.2%} error rate, selected {self.miner_selection_count[miner.miner_id]} times")
-        
-        print("\n3. Impact of Byzantine Behavior on Rewards:")
-        # Sort all miners by tokens for top performers
-        sorted_miners = sorted(self.miners, key=lambda x: x.tokens, reverse=True)
-        top_performers = sorted_miners[:4]
-        print("   Top performers:")
-        for miner in top_performers:
-            print(f"   Miner {miner.miner_id}: {miner.tasks_completed} tasks, {miner.error_rate:.2%} error rate, {miner.tokens:.0f} tokens")
-        
-        print("\n   Byzantine miners performance:")
-        for miner in byzantine_miners:
-            print(f"   Miner {miner.miner_id} ({miner.error_rate:.2%} error rate): {miner.tasks_completed} tasks completed, {miner.tokens:.0f} tokens")
-        
-        print("\n4. Byzantine Fault Tolerance Analysis:")
-        print("   a. Task Distribution Impact:")
-        avg_tasks_normal = sum(m.tasks_completed for m in self.miners if m.error_rate <= self.byzantine_threshold) / (len(self.miners) - len(byzantine_miners)) if len(self.miners) > len(byzantine_miners) else 0
-        avg_tasks_byzantine = sum(m.tasks_completed for m in byzantine_miners) / len(byzantine_miners) if byzantine_miners else 0
-        print(f"      - Average tasks per normal miner: {avg_tasks_normal:.1f}")
-        print(f"      - Average tasks per Byzantine miner: {avg_tasks_byzantine:.1f}")
-        
-        print("\n   b. Token Distribution Impact:")
-        avg_tokens_normal = sum(m.tokens for m in self.miners if m.error_rate <= self.byzantine_threshold) / (len(self.miners) - len(byzantine_miners)) if len(self.miners) > len(byzantine_miners) else 0
-        avg_tokens_byzantine = sum(m.tokens for m in byzantine_miners) / len(byzantine_miners) if byzantine_miners else 0
-        print(f"      - Average tokens per normal miner: {avg_tokens_normal:.0f}")
-        print(f"      - Average tokens per Byzantine miner: {avg_tokens_byzantine:.0f}")
-        
-        print("\n5. Detailed Miner Statistics (sorted by tokens):")
-        for miner in sorted_miners:
-            print(f"\nMiner {miner.miner_id}:")
-            print(f"   Score: {miner.score:.2f}")
-            print(f"   Renewable Energy: {miner.renewable_energy_proportion:.2%}")
-            print(f"   Tasks Completed: {miner.tasks_completed}")
-            print(f"   Selection Count: {self.miner_selection_count[miner.miner_id]}")
-            print(f"   Penalties: {miner.penalties}")
-            print(f"   Error Rate: {miner.error_rate:.2%}")
-            print(f"   Total Tokens: {miner.tokens:.0f}")
-            print(f"   Status: {'BYZANTINE' if miner.error_rate > self.byzantine_threshold else 'Normal'}")
-
-def run_multiple_simulations(num_runs: int = 10, **kwargs) -> Dict:
+# Scalar metrics kept per run when raw results are not retained
+RUN_SUMMARY_KEYS = ('success_rate', 'total_tasks', 'successful_tasks', 'byzantine_count',
+                    'avg_tasks_honest', 'avg_tasks_byzantine', 'avg_tokens_honest',
+                    'avg_tokens_byzantine', 'useful_work_efficiency')
+
+
+def summarize_run(result: Dict) -> Dict:
+    """Reduce a full simulation result to its scalar metrics (no miners or histories)."""
+    return {key: float(result[key]) for key in RUN_SUMMARY_KEYS}
+
+
+# Constructor arguments that do not affect results and are left out of cache keys
+_UNCACHED_ARGS = ('self', 'seed', 'history_spill_threshold', 'history_spill_dir')
+
+
+def normalized_config(kwargs_for_init: Dict) -> Dict:
+    """Constructor arguments with defaults filled in, as used for cache keys."""
+    bound = inspect.signature(BlockchainSimulation.__init__).bind_partial(**kwargs_for_init)
+    bound.apply_defaults()
+    return {k: v for k, v in bound.arguments.items() if k not in _UNCACHED_ARGS}
+
+
+def run_cache_key(seed: int, kwargs_for_init: Dict) -> str:
+    """Cache key of the summary of one seeded run."""
+    return cache_key('simulation', normalized_config(kwargs_for_init), seed)
+
+
+def _run_seeded_simulation(seed: int, kwargs_for_init: Dict, keep_raw_results: bool = True) -> Dict:
+    """Run one non-verbose simulation for a seed (top-level so worker processes can pickle it)."""
+    sim = BlockchainSimulation(seed=seed, **kwargs_for_init)
+    result = sim.run_simulation(verbose=False)
+    # Pool workers exit without running finalizers, so spill files are removed here
+    if keep_raw_results:
+        sim.task_history.load()
+        return result
+    summary = summarize_run(result)
+    sim.task_history.discard()
+    return summary
+
+
+def run_multiple_simulations(num_runs: int = 10, workers: int = None,
+                             keep_raw_results: bool = True,
+                             cache: Union[ResultCache, bool, None] = True, **kwargs) -> Dict:
     """
     Run multiple simulations and compute statistics with confidence intervals.
     
+    Args:
+        num_runs: Number of runs; run i uses seed i
+        workers: If greater than 1, fan the seeded runs out across a process pool
+                 of this size. Results are collected in seed order and are
+                 identical to serial execution.
+        keep_raw_results: If True, return every run's full result dict (miners,
+                          task history) under 'raw_results'. If False, each run is
+                          reduced to its scalar metrics and folded into running
+                          statistics immediately, so memory is O(1) in num_runs
+                          and 'raw_results' is omitted.
+        cache: Result cache for run summaries (True = shared on-disk cache,
+               False/None = always recompute). Only used when keep_raw_results
+               is False, since full results are not cached.
+        **kwargs: BlockchainSimulation constructor arguments
+    
     Returns:
         Dictionary with mean, std, and confidence intervals for key metrics.
     """
     results = []
+    success_stats = RunningStats()
+    efficiency_stats = RunningStats()
     print(f"\nRunning {num_runs} simulations for statistical analysis...")
     
     # Remove 'verbose' from kwargs if present (it's for run_simulation, not __init__)
     kwargs_for_init = {k: v for k, v in kwargs.items() if k != 'verbose'}
     
-    for i in range(num_runs):
-        sim = BlockchainSimulation(seed=i, **kwargs_for_init)
-        result = sim.run_simulation(verbose=False)
-        results.append(result)
-        print(f"  Run {i+1}/{num_runs} complete: Success rate = {result['success_rate']:.2%}")
+    def record(i: int, result: Dict, cached: bool = False):
+        success_stats.add(result['success_rate'])
+        efficiency_stats.add(result['useful_work_efficiency'])
+        if keep_raw_results:
+            results.append(result)
+        source = " (cached)" if cached else ""
+        print(f"  Run {i+1}/{num_runs} complete{source}: Success rate = {result['success_rate']:.2%}")
     
-    # Aggregate statistics
-    success_rates = [r['success_rate'] for r in results]
-    useful_efficiencies = [r['useful_work_efficiency'] for r in results]
+    seeds = range(num_runs)
+    cache = None if keep_raw_results else resolve_cache(cache)
+    keys = {}
+    cached = {}
+    if cache is not None:
+        keys = {seed: run_cache_key(seed, kwargs_for_init) for seed in seeds}
+        found = cache.get_many(list(keys.values()))
+        cached = {seed: found[key] for seed, key in keys.items() if key in found}
+    pending = [seed for seed in seeds if seed not in cached]
     
+    executor = None
+    if workers is not None and workers > 1 and len(pending) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(pending)))
+        # map() yields in submission order, so runs stay in seed order
+        run_iter = executor.map(_run_seeded_simulation, pending,
+                                [kwargs_for_init] * len(pending), [keep_raw_results] * len(pending))
+    else:
+        run_iter = (_run_seeded_simulation(seed, kwargs_for_init, keep_raw_results) for seed in pending)
+    try:
+        for i in seeds:
+            if i in cached:
+                record(i, cached[i], cached=True)
+                continue
+            result = next(run_iter)
+            if cache is not None:
+                cache.put(keys[i], result)
+            record(i, result)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    # Aggregate statistics
     stats = {
         'num_runs': num_runs,
-        'success_rate_mean': np.mean(success_rates),
-        'success_rate_std': np.std(success_rates),
-        'success_rate_ci': 1.96 * np.std(success_rates) / np.sqrt(num_runs),  # 95% CI
-        'efficiency_mean': np.mean(useful_efficiencies),
-        'efficiency_std': np.std(useful_efficiencies),
-        'efficiency_ci': 1.96 * np.std(useful_efficiencies) / np.sqrt(num_runs),
-        'raw_results': results
+        'success_rate_mean': success_stats.mean,
+        'success_rate_std': success_stats.std,
+        'success_rate_ci': success_stats.ci(),  # 95% CI
+        'efficiency_mean': efficiency_stats.mean,
+        'efficiency_std': efficiency_stats.std,
+        'efficiency_ci': efficiency_stats.ci(),
     }
+    if keep_raw_results:
+        stats['raw_results'] = results
     
     print(f"\n=== Aggregated Results ({num_runs} runs) ===")
     print(f"Success Rate: {stats['success_rate_mean']:.2%} ± {stats['success_rate_ci']:.2%} (95% CI)")
@@ -272,7 +400,88 @@ def run_multiple_simulations(num_runs: int = 10, **kwargs) -> Dict:
     return stats
 
 
-def sensitivity_analysis_byzantine_error_rate(error_rates: List[float] = None, num_runs: int = 5):
+def _estimate_cell_cost(cell: tuple) -> float:
+    """Relative run time of a sweep cell: tasks × (executor + verifiers)."""
+    config = cell[1]
+    return config.get('num_tasks', 1000) * (1 + config.get('num_verifiers', 3))
+
+
+def run_sweep(grid, num_runs: int = 5, workers: int = None,
+              cache: Union[ResultCache, bool, None] = True, **base_config) -> List[Dict]:
+    """
+    Run every (configuration, seed) cell of a declarative parameter grid.
+    
+    All cells of all configurations are scheduled together, so a process pool
+    stays busy across the whole study instead of one configuration at a time.
+    
+    Args:
+        grid: Dict (or list of dicts) mapping BlockchainSimulation constructor
+              arguments to the values to try; see sweep.expand_grid
+        num_runs: Number of seeds per configuration (seeds 0..num_runs-1)
+        workers: Process pool size shared by all cells (serial if None)
+        cache: Result cache for cell summaries (True = shared on-disk cache,
+               False/None = always recompute). Only cells missing from the
+               cache are run, and each is stored as soon as it finishes.
+        **base_config: Constructor arguments shared by every cell
+    
+    Returns:
+        Tidy table with one row per cell: the swept arguments, 'seed' and the
+        scalar metrics from summarize_run. Rows are in grid order, then seed order.
+    """
+    configs = expand_grid(grid)
+    base_config = {k: v for k, v in base_config.items() if k != 'verbose'}
+    cells = [(seed, {**base_config, **config}, False) for config in configs for seed in range(num_runs)]
+    print(f"\nRunning sweep: {len(configs)} configurations × {num_runs} seeds = {len(cells)} runs...")
+    
+    completed = [0]
+    def report(i: int, summary: Dict, cached: bool = False):
+        completed[0] += 1
+        config = configs[i // num_runs]
+        params = ", ".join(f"{k}={v}" for k, v in config.items())
+        source = " (cached)" if cached else ""
+        print(f"  [{completed[0]}/{len(cells)}] {params}, seed={cells[i][0]}{source}: "
+              f"Success rate = {summary['success_rate']:.2%}")
+    
+    summaries: List[Dict] = [None] * len(cells)
+    cache = resolve_cache(cache)
+    keys = []
+    if cache is not None:
+        keys = [run_cache_key(seed, config) for seed, config, _ in cells]
+        found = cache.get_many(keys)
+        for i, key in enumerate(keys):
+            if key in found:
+                summaries[i] = found[key]
+                report(i, summaries[i], cached=True)
+    pending = [i for i, summary in enumerate(summaries) if summary is None]
+    
+    def finish(j: int, summary: Dict):
+        i = pending[j]
+        summaries[i] = summary
+        if cache is not None:
+            cache.put(keys[i], summary)
+        report(i, summary)
+    
+    execute_cells([cells[i] for i in pending], _run_seeded_simulation, workers=workers,
+                  cost=_estimate_cell_cost, on_result=finish)
+    return [{**configs[i // num_runs], 'seed': cells[i][0], **summary}
+            for i, summary in enumerate(summaries)]
+
+
+def sweep_stats(entry: Dict) -> Dict:
+    """Convert a summarize_sweep group into the run_multiple_simulations stats format."""
+    return {
+        'num_runs': entry['num_runs'],
+        'success_rate_mean': entry['success_rate_mean'],
+        'success_rate_std': entry['success_rate_std'],
+        'success_rate_ci': entry['success_rate_ci'],
+        'efficiency_mean': entry['useful_work_efficiency_mean'],
+        'efficiency_std': entry['useful_work_efficiency_std'],
+        'efficiency_ci': entry['useful_work_efficiency_ci'],
+    }
+
+
+def sensitivity_analysis_byzantine_error_rate(error_rates: List[float] = None, num_runs: int = 5,
+                                              workers: int = None):
     """
     Analyze system performance across different Byzantine error rates.
     Addresses reviewer comment on Eq. (3): Why 0.30 vs 0.02?
@@ -281,22 +490,20 @@ def sensitivity_analysis_byzantine_error_rate(error_rates: List[float] = None, n
         error_rates = [0.1, 0.2, 0.3, 0.4, 0.5]  # Range of Byzantine error rates
     
     print("\n=== Sensitivity Analysis: Byzantine Error Rate ===")
+    rows = run_sweep(
+        {'byzantine_error_rate': error_rates},
+        num_runs=num_runs,
+        workers=workers,
+        num_miners=20,
+        num_tasks=1000,
+        max_byzantine=3
+    )
     results = []
-    
-    for rate in error_rates:
-        print(f"\nTesting Byzantine error rate: {rate:.1%}")
-        stats = run_multiple_simulations(
-            num_runs=num_runs,
-            num_miners=20,
-            num_tasks=1000,
-            max_byzantine=3,
-            byzantine_error_rate=rate,
-            verbose=False
-        )
+    for entry in summarize_sweep(rows, by=['byzantine_error_rate']):
         results.append({
-            'error_rate': rate,
-            'success_rate': stats['success_rate_mean'],
-            'success_rate_ci': stats['success_rate_ci']
+            'error_rate': entry['byzantine_error_rate'],
+            'success_rate': entry['success_rate_mean'],
+            'success_rate_ci': entry['success_rate_ci']
         })
     
     print("\n=== Byzantine Error Rate Sensitivity Results ===")
@@ -306,7 +513,8 @@ def sensitivity_analysis_byzantine_error_rate(error_rates: List[float] = None, n
     return results
 
 
-def sensitivity_analysis_num_verifiers(verifier_counts: List[int] = None, num_runs: int = 5):
+def sensitivity_analysis_num_verifiers(verifier_counts: List[int] = None, num_runs: int = 5,
+                                       workers: int = None):
     """
     Analyze validation failure probability as function of V (number of verifiers).
     Addresses reviewer comment on Eqs. (11)-(12): What is V and its impact?
@@ -315,23 +523,21 @@ def sensitivity_analysis_num_verifiers(verifier_counts: List[int] = None, num_ru
         verifier_counts = [1, 3, 5, 7, 9]  # Range of verifier counts
     
     print("\n=== Sensitivity Analysis: Number of Verifiers (V) ===")
+    rows = run_sweep(
+        {'num_verifiers': verifier_counts},
+        num_runs=num_runs,
+        workers=workers,
+        num_miners=20,
+        num_tasks=1000,
+        max_byzantine=3
+    )
     results = []
-    
-    for V in verifier_counts:
-        print(f"\nTesting V = {V} verifiers")
-        stats = run_multiple_simulations(
-            num_runs=num_runs,
-            num_miners=20,
-            num_tasks=1000,
-            max_byzantine=3,
-            num_verifiers=V,
-            verbose=False
-        )
+    for entry in summarize_sweep(rows, by=['num_verifiers']):
         results.append({
-            'num_verifiers': V,
-            'success_rate': stats['success_rate_mean'],
-            'success_rate_ci': stats['success_rate_ci'],
-            'efficiency': stats['efficiency_mean']
+            'num_verifiers': entry['num_verifiers'],
+            'success_rate': entry['success_rate_mean'],
+            'success_rate_ci': entry['success_rate_ci'],
+            'efficiency': entry['useful_work_efficiency_mean']
         })
     
     print("\n=== Number of Verifiers Sensitivity Results ===")
@@ -341,45 +547,31 @@ def sensitivity_analysis_num_verifiers(verifier_counts: List[int] = None, num_ru
     return results
 
 
-def ablation_study(num_runs: int = 5):
+def ablation_study(num_runs: int = 5, workers: int = None):
     """
     Ablation study: Test system with/without renewable bonus and fault tolerance.
     Addresses reviewer comment: need ablation studies.
     """
     print("\n=== Ablation Study ===")
+    print("1. Full Model (with renewable bonus + fault tolerance)")
+    print("2. No Renewable Energy Bonus (α=0 for all)")
+    print("3. No Fault Tolerance (uniform selection)")
     
-    # Baseline: Full model
-    print("\n1. Full Model (with renewable bonus + fault tolerance)")
-    baseline = run_multiple_simulations(
-        num_runs=num_runs,
-        num_miners=20,
-        num_tasks=1000,
-        max_byzantine=3,
-        renewable_energy_alpha=None,  # Random per miner
-        fault_tolerance_enabled=True
-    )
-    
-    # Ablation 1: No renewable bonus
-    print("\n2. No Renewable Energy Bonus (α=0 for all)")
-    no_green = run_multiple_simulations(
+    arms = [
+        {'renewable_energy_alpha': [None], 'fault_tolerance_enabled': [True]},   # Full model (random α)
+        {'renewable_energy_alpha': [0.0], 'fault_tolerance_enabled': [True]},    # No bonus
+        {'renewable_energy_alpha': [None], 'fault_tolerance_enabled': [False]},  # No fault tolerance
+    ]
+    rows = run_sweep(
+        arms,
         num_runs=num_runs,
+        workers=workers,
         num_miners=20,
         num_tasks=1000,
-        max_byzantine=3,
-        renewable_energy_alpha=0.0,  # No bonus
-        fault_tolerance_enabled=True
-    )
-    
-    # Ablation 2: No fault tolerance
-    print("\n3. No Fault Tolerance (uniform selection)")
-    no_ft = run_multiple_simulations(
-        num_runs=num_runs,
-        num_miners=20,
-        num_tasks=1000,
-        max_byzantine=3,
-        renewable_energy_alpha=None,
-        fault_tolerance_enabled=False
+        max_byzantine=3
     )
+    baseline, no_green, no_ft = (sweep_stats(entry) for entry in
+                                 summarize_sweep(rows, by=['renewable_energy_alpha', 'fault_tolerance_enabled']))
     
     print("\n=== Ablation Study Summary ===")
     print(f"Full Model: Success = {baseline['success_rate_mean']:.2%}, Efficiency = {baseline['efficiency_mean']:.2%}")
@@ -392,19 +584,32 @@ def ablation_study(num_runs: int = 5):
 if __name__ == "__main__":
     import sys
     
+    # Optional "--workers N" runs the seeded runs of each analysis in parallel
+    args = sys.argv[1:]
+    workers = None
+    if "--workers" in args:
+        idx = args.index("--workers")
+        workers = int(args[idx + 1])
+        del args[idx:idx + 2]
+    # Optional "--no-cache" recomputes every run instead of reusing cached summaries
+    if "--no-cache" in args:
+        args.remove("--no-cache")
+        disable_default_cache()
+    
     # Check for command-line arguments
-    if len(sys.argv) > 1:
-        mode = sys.argv[1]
+    if len(args) > 0:
+        mode = args[0]
         
         if mode == "sensitivity-error":
-            sensitivity_analysis_byzantine_error_rate()
+            sensitivity_analysis_byzantine_error_rate(workers=workers)
         elif mode == "sensitivity-verifiers":
-            sensitivity_analysis_num_verifiers()
+            sensitivity_analysis_num_verifiers(workers=workers)
         elif mode == "ablation":
-            ablation_study()
+            ablation_study(workers=workers)
         elif mode == "multi-run":
-            num_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
-            run_multiple_simulations(num_runs=num_runs, num_miners=20, num_tasks=1000, max_byzantine=3)
+            num_runs = int(args[1]) if len(args) > 1 else 10
+            run_multiple_simulations(num_runs=num_runs, workers=workers, keep_raw_results=False,
+                                     num_miners=20, num_tasks=1000, max_byzantine=3)
         else:
             print("Unknown mode. Use: sensitivity-error, sensitivity-verifiers, ablation, or multi-run")
     else:
@@ -414,6 +619,7 @@ if __name__ == "__main__":
         print("  python main.py sensitivity-verifiers")
         print("  python main.py ablation")
         print("  python main.py multi-run [num_runs]")
+        print("Add --workers N to run the seeded runs on N processes, --no-cache to recompute cached runs.")
         print()
         
         simulation = BlockchainSimulation(
@@ -0,0 +1,200 @@
+from typing import List, Tuple
+import numpy as np
+
+# How a BoundedSeries keeps its memory bounded once capacity samples are held:
+# - 'ring':     keep only the most recent samples
+# - 'decimate': keep every stride-th sample, doubling the stride when full
+# - 'minmax':   keep the minimum and maximum of each bucket of samples,
+#               doubling the bucket width when full (peaks survive)
+SERIES_POLICIES = ('ring', 'decimate', 'minmax')
+
+
+class BoundedSeries:
+    """
+    A group of time series sampled together, with bounded memory.
+
+    Every append() adds one row: an x value (e.g. the task index) and one value
+    per column (e.g. every miner's score). Rows are stored in NumPy buffers of
+    at most `capacity` rows, so memory is O(capacity × width) however long the
+    run is, and all columns share the same x positions when exported.
+    The most recent row is always part of the export.
+    """
+
+    def __init__(self, width: int, capacity: int = 500, policy: str = 'decimate'):
+        """
+        Args:
+            width: Number of columns per row
+            capacity: Maximum number of rows kept (and exported)
+            policy: One of SERIES_POLICIES
+        """
+        if policy not in SERIES_POLICIES:
+            raise ValueError(f"Unknown series policy '{policy}', expected one of {SERIES_POLICIES}")
+        self.width = width
+        self.policy = policy
+        # minmax exports two rows per bucket, so it keeps capacity // 2 buckets (even, for
+        # pairing); decimate leaves one row free for the latest sample
+        self.capacity = max(capacity, 4)
+        if policy == 'minmax':
+            rows = self.capacity // 2 // 2 * 2
+        elif policy == 'decimate':
+            rows = self.capacity - 1
+        else:
+            rows = self.capacity
+        self._x = np.empty(rows, dtype=np.int64)
+        self._values = np.empty((rows, width), dtype=np.float64)
+        self._size = 0
+        self._head = 0            # ring: index of the oldest row
+        self._samples = 0         # rows appended so far
+        self._stride = 1          # decimate: sample spacing; minmax: samples per bucket
+        self._last = None         # most recent (x, values)
+        if policy == 'minmax':
+            self._x_last = np.empty(rows, dtype=np.int64)
+            self._max = np.empty((rows, width), dtype=np.float64)
+            self._min_first = np.empty((rows, width), dtype=bool)
+            self._open = None     # [x_first, x_last, min, max, min_first, count]
+
+    def __len__(self) -> int:
+        return self._samples
+
+    def append(self, x: int, values):
+        """Record one row of values at position x."""
+        values = np.asarray(values, dtype=np.float64)
+        self._last = (x, values)
+        sample = self._samples
+        self._samples += 1
+        if self.policy == 'ring':
+            self._append_ring(x, values)
+        elif self.policy == 'decimate':
+            if sample % self._stride == 0:
+                self._append_decimated(x, values)
+        else:
+            self._append_minmax(x, values)
+
+    def _append_ring(self, x: int, values: np.ndarray):
+        capacity = len(self._x)
+        if self._size < capacity:
+            index = self._size
+            self._size += 1
+        else:
+            index = self._head
+            self._head = (self._head + 1) % capacity
+        self._x[index] = x
+        self._values[index] = values
+
+    def _append_decimated(self, x: int, values: np.ndarray):
+        if self._size == len(self._x):
+            # Keep every other row; the kept rows are exactly the multiples of the new stride
+            kept = (self._size + 1) // 2
+            self._x[:kept] = self._x[:self._size:2]
+            self._values[:kept] = self._values[:self._size:2]
+            self._size = kept
+            self._stride *= 2
+            if (self._samples - 1) % self._stride:
+                return
+        self._x[self._size] = x
+        self._values[self._size] = values
+        self._size += 1
+
+    def _append_minmax(self, x: int, values: np.ndarray):
+        bucket = self._open
+        if bucket is None:
+            self._open = bucket = [x, x, values.copy(), values.copy(), np.ones(self.width, dtype=bool), 1]
+        else:
+            bucket[1] = x
+            lower = values < bucket[2]
+            higher = values > bucket[3]
+            bucket[2] = np.where(lower, values, bucket[2])
+            bucket[3] = np.where(higher, values, bucket[3])
+            # The extreme updated last decides the order within the bucket
+            bucket[4] = np.where(lower, False, np.where(higher, True, bucket[4]))
+            bucket[5] += 1
+        if bucket[5] >= self._stride:
+            self._close_bucket()
+
+    def _close_bucket(self):
+        x_first, x_last, low, high, min_first, _ = self._open
+        self._open = None
+        if self._size == len(self._x):
+            self._merge_buckets()
+        i = self._size
+        self._x[i] = x_first
+        self._x_last[i] = x_last
+        self._values[i] = low
+        self._max[i] = high
+        self._min_first[i] = min_first
+        self._size += 1
+
+    @staticmethod
+    def _combine(low_a, high_a, min_first_a, low_b, high_b, min_first_b):
+        """(min, max, min_first) of bucket a followed by bucket b (elementwise, so also for arrays of buckets)."""
+        min_from_a = low_a <= low_b
+        max_from_a = high_a >= high_b
+        min_first = np.where(min_from_a == max_from_a,
+                             np.where(min_from_a, min_first_a, min_first_b),
+                             min_from_a)
+        return np.where(min_from_a, low_a, low_b), np.where(max_from_a, high_a, high_b), min_first
+
+    def _merge_buckets(self):
+        """Merge adjacent bucket pairs, halving the bucket count and doubling the width."""
+        a = slice(0, self._size, 2)
+        b = slice(1, self._size, 2)
+        low, high, min_first = self._combine(self._values[a], self._max[a], self._min_first[a],
+                                             self._values[b], self._max[b], self._min_first[b])
+        half = self._size // 2
+        self._x[:half] = self._x[a]
+        self._x_last[:half] = self._x_last[b]
+        self._values[:half] = low
+        self._max[:half] = high
+        self._min_first[:half] = min_first
+        self._size = half
+        self._stride *= 2
+
+    def export(self) -> Tuple[List[int], np.ndarray]:
+        """Return (x values, rows × width array) in x order, ending with the latest row."""
+        if self._last is None:
+            return [], np.empty((0, self.width))
+        if self.policy == 'ring':
+            order = (np.arange(self._size) + self._head) % len(self._x)
+            return self._x[order].tolist(), self._values[order]
+        if self.policy == 'decimate':
+            xs = self._x[:self._size].tolist()
+            values = self._values[:self._size]
+            if xs[-1] != self._last[0]:
+                xs.append(self._last[0])
+                values = np.vstack([values, self._last[1]])
+            return xs, values
+        return self._export_minmax()
+
+    def _export_minmax(self) -> Tuple[List[int], np.ndarray]:
+        x_first = self._x[:self._size]
+        x_last = self._x_last[:self._size]
+        low = self._values[:self._size]
+        high = self._max[:self._size]
+        min_first = self._min_first[:self._size]
+        if self._open is not None:
+            ox_first, ox_last, olow, ohigh, omin_first, _ = self._open
+            if 2 * (self._size + 1) <= self.capacity:
+                x_first = np.append(x_first, ox_first)
+                x_last = np.append(x_last, ox_last)
+                low = np.vstack([low, olow])
+                high = np.vstack([high, ohigh])
+                min_first = np.vstack([min_first, omin_first])
+            else:
+                # No room for another bucket: fold the open one into the last closed one
+                x_last = x_last.copy()
+                x_last[-1] = ox_last
+                low, high, min_first = low.copy(), high.copy(), min_first.copy()
+                low[-1], high[-1], min_first[-1] = self._combine(low[-1], high[-1], min_first[-1],
+                                                                 olow, ohigh, omin_first)
+        # Two rows per bucket, at its first and last x; single-sample buckets emit one
+        first = np.where(min_first, low, high)
+        second = np.where(min_first, high, low)
+        xs = np.empty(2 * len(x_first), dtype=np.int64)
+        xs[0::2] = x_first
+        xs[1::2] = x_last
+        rows = np.empty((2 * len(x_first), self.width))
+        rows[0::2] = first
+        rows[1::2] = second
+        keep = np.ones(len(xs), dtype=bool)
+        keep[1::2] = x_last != x_first
+        return xs[keep].tolist(), rows[keep]
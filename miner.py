@@ -1,28 +1,49 @@
+import math
 import random
 from typing import List, Optional, Any
-from task import Task, TaskType
+from task import Task, TaskType, PRODUCT_MODULUS
+
+# Selection tiers of thesis Equation 4, indexed by selection_tier()
+SELECTION_TIERS = ('honest', 'suspicious', 'byzantine')
+TIER_MULTIPLIERS = (1.0, 0.5, 0.1)
+
+
+def selection_tier(error_rate: float) -> int:
+    """
+    Equation 4 tier of an error rate: 0 honest (e ≤ 0.15), 1 suspicious
+    (0.15 < e ≤ 0.2), 2 byzantine (e > 0.2).
+    """
+    if error_rate > 0.2:
+        return 2
+    elif error_rate > 0.15:
+        return 1
+    return 0
+
 
 class Miner:
-    # Class variable to track Byzantine miners
-    _num_byzantine_miners = 0
-    _max_byzantine_miners = 3
-    _byzantine_error_rate = 0.3  # Error rate for Byzantine miners (per thesis Equation 3: 30%)
+    # Fixed attribute layout: no per-instance __dict__, which shrinks each
+    # miner and speeds up the score/token updates in the validation loop
+    __slots__ = ('miner_id', 'rng', 'score', 'renewable_energy_proportion', 'tasks_completed',
+                 'penalties', 'tokens', 'current_task', 'error_probability', 'is_byzantine',
+                 'total_tasks_attempted', 'total_failures', 'error_rate')
 
-    def __init__(self, miner_id: int, force_byzantine: bool = False):
+    def __init__(self, miner_id: int, force_byzantine: bool = False, rng: Optional[random.Random] = None,
+                 byzantine_error_rate: float = 0.3):
         self.miner_id = miner_id
+        self.rng = rng if rng is not None else random  # Simulation-owned generator
         self.score = 0.0
-        self.renewable_energy_proportion = random.uniform(0.0, 0.5)  # Range between 0 (no renewable) and 0.5
+        self.renewable_energy_proportion = self.rng.uniform(0.0, 0.5)  # Range between 0 (no renewable) and 0.5
         self.tasks_completed = 0
         self.penalties = 0
         self.tokens = 0.0
         self.current_task: Optional[Task] = None
         
         # Determine if this miner should be Byzantine
-        # Now deterministic based on force_byzantine flag
+        # Now deterministic based on force_byzantine flag; the error rate is
+        # passed in (thesis Equation 3: 30%) rather than read from shared state
         if force_byzantine:
-            self.error_probability = Miner._byzantine_error_rate
+            self.error_probability = byzantine_error_rate
             self.is_byzantine = True
-            Miner._num_byzantine_miners += 1
         else:
             self.error_probability = 0.02  # Very low error rate for honest miners
             self.is_byzantine = False
@@ -31,20 +52,11 @@ class Miner:
         self.total_failures = 0
         self.error_rate = 0.0
 
-    @classmethod
-    def reset_byzantine_count(cls):
-        """Reset the Byzantine miner counter"""
-        cls._num_byzantine_miners = 0
-
-    @classmethod
-    def set_byzantine_error_rate(cls, rate: float):
-        """Set the error rate for Byzantine miners"""
-        cls._byzantine_error_rate = rate
-
     @classmethod
     def create_miners(cls, num_miners: int, max_byzantine: int, 
                       byzantine_error_rate: float = 0.3,
-                      renewable_energy_alpha: float = None) -> List['Miner']:
+                      renewable_energy_alpha: float = None,
+                      rng: Optional[random.Random] = None) -> List['Miner']:
         """
         Create miners with exactly max_byzantine Byzantine miners.
         Byzantine miners are randomly selected but guaranteed to be created.
@@ -59,10 +71,11 @@ class Miner:
             byzantine_error_rate: Error probability for Byzantine miners (default 0.3)
             renewable_energy_alpha: If set, all miners use this α value.
                                    If None, random α in [0, 0.5] per miner.
+            rng: Random generator owned by the simulation, shared by all miners.
+                 If None, the module-level random functions are used.
         """
-        cls.reset_byzantine_count()
-        cls._max_byzantine_miners = max_byzantine
-        cls._byzantine_error_rate = byzantine_error_rate
+        if rng is None:
+            rng = random
         
         miners = []
         
@@ -70,12 +83,13 @@ class Miner:
         byzantine_ids = set()
         if max_byzantine > 0 and num_miners > 0:
             num_byzantine = min(max_byzantine, num_miners)
-            byzantine_ids = set(random.sample(range(num_miners), num_byzantine))
+            byzantine_ids = set(rng.sample(range(num_miners), num_byzantine))
         
         # Create miners
         for i in range(num_miners):
             is_byzantine = i in byzantine_ids
-            miner = Miner(i, force_byzantine=is_byzantine)
+            miner = cls(i, force_byzantine=is_byzantine, rng=rng,
+                        byzantine_error_rate=byzantine_error_rate)
             
             # Set renewable energy proportion (α_m)
             if renewable_energy_alpha is not None:
@@ -91,21 +105,22 @@ class Miner:
         """Execute the assigned task and return the result."""
         self.current_task = task
         self.total_tasks_attempted += 1
-        correct_result = task.execute()
+        correct_result = task.canonical_result()
         
         # Introduce potential errors based on error probability
-        if random.random() < self.error_probability:
+        rng = self.rng
+        if rng.random() < self.error_probability:
             self.total_failures += 1
             self.error_rate = self.total_failures / self.total_tasks_attempted
             if task.task_type == TaskType.ADDITION:
-                return correct_result + random.randint(-10, 10)
+                return correct_result + rng.randint(-10, 10)
             elif task.task_type == TaskType.MULTIPLICATION:
-                return correct_result * random.uniform(0.9, 1.1)
+                return self._corrupt_product(task, correct_result)
             elif task.task_type == TaskType.SORTING:
-                # Randomly swap two elements in the sorted list
-                result = list(correct_result)
+                # Randomly swap two elements in the sorted array
+                result = correct_result.copy()
                 if len(result) > 1:
-                    i, j = random.sample(range(len(result)), 2)
+                    i, j = rng.sample(range(len(result)), 2)
                     result[i], result[j] = result[j], result[i]
                 return result
             elif task.task_type == TaskType.SEARCHING:
@@ -115,9 +130,28 @@ class Miner:
         self.error_rate = self.total_failures / self.total_tasks_attempted if self.total_tasks_attempted > 0 else 0
         return correct_result
 
-    def verify_task(self, task: Task, solution: Any) -> bool:
-        """Verify another miner's solution."""
-        return task.verify_solution(solution)
+    def _corrupt_product(self, task: Task, correct_result: Any) -> Any:
+        """Return a wrong MULTIPLICATION result, scaled by a random factor in [0.9, 1.1]."""
+        rng = self.rng
+        if task.multiplication_mode == 'modular':
+            # Any non-zero offset yields a different residue
+            return (correct_result + rng.randint(1, PRODUCT_MODULUS - 1)) % PRODUCT_MODULUS
+        if task.multiplication_mode == 'log':
+            return correct_result + math.log(rng.uniform(0.9, 1.1))
+        if correct_result.bit_length() <= 1000:
+            return correct_result * rng.uniform(0.9, 1.1)
+        # Beyond float range int × float overflows; scale in exact integer arithmetic
+        corrupted = correct_result * rng.randint(900, 1100) // 1000
+        return corrupted if corrupted != correct_result else correct_result + 1
+
+    def verify_task(self, task: Task, solution: Any, recompute: bool = False) -> bool:
+        """
+        Verify another miner's solution.
+        
+        By default the solution is checked against the task's cached canonical
+        result; recompute=True re-executes the task independently.
+        """
+        return task.verify_solution(solution, recompute=recompute)
 
     def update_score(self, reward: float):
         """Update miner's score based on reward."""
@@ -132,6 +166,25 @@ class Miner:
         """Receive tokens as reward."""
         self.tokens += amount
 
+    def get_selection_weight(self, fault_tolerance_enabled: bool = True) -> float:
+        """
+        Unnormalized selection weight (thesis Equation 4 without the Σs_i denominator).
+        
+        When fault_tolerance_enabled=True:
+            - 0.1 × s_m  if e_m > 0.2 (Byzantine behavior)
+            - 0.5 × s_m  if 0.15 < e_m ≤ 0.2 (suspicious behavior)
+            - s_m        otherwise (honest behavior)
+        
+        When fault_tolerance_enabled=False every miner has weight 1.0.
+        """
+        if not fault_tolerance_enabled:
+            return 1.0
+        return self.score * TIER_MULTIPLIERS[selection_tier(self.error_rate)]
+
+    def selection_tier(self) -> int:
+        """Current Equation 4 tier (index into SELECTION_TIERS)."""
+        return selection_tier(self.error_rate)
+
     def get_selection_probability(self, total_score: float, fault_tolerance_enabled: bool = True) -> float:
         """
         Calculate probability of being selected for a task.
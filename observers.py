@@ -0,0 +1,124 @@
+from typing import Any, Dict, List
+import numpy as np
+from task import Task
+from miner import Miner
+from metrics import BoundedSeries
+from simulation import SimulationCore, SimulationObserver
+from visualization import Visualizer
+
+
+class ConsoleReporter(SimulationObserver):
+    """Console output of the command-line simulation: setup, every interval-th task, final statistics."""
+
+    def __init__(self, interval: int = 100):
+        self.report_interval = interval
+
+    def on_start(self, sim: SimulationCore):
+        sim.print_initial_state()
+
+    def on_task_assigned(self, sim: SimulationCore, task: Task, miner: Miner, verifiers: List[Miner]):
+        # Only print every report_interval-th task to avoid console spam
+        if (sim.completed_tasks + 1) % self.report_interval == 0:
+            print(f"\nTask {sim.completed_tasks + 1}/{sim.total_tasks}")
+            print(f"Assigned to: {miner}")
+            print(f"Verifiers: {len(verifiers)}")
+
+    def on_validated(self, sim: SimulationCore, task: Task, miner: Miner, verifiers: List[Miner], is_valid: bool):
+        if sim.completed_tasks % self.report_interval != 0:
+            return
+        if is_valid:
+            print("Task completed successfully!")
+        else:
+            print("Task failed validation.")
+            if miner.error_rate > sim.byzantine_threshold:
+                print(f"WARNING: Miner {miner.miner_id} shows Byzantine behavior! "
+                      f"Error rate: {miner.error_rate:.2%}")
+        print(f"Current success rate: {sim.success_rate:.2%}")
+
+    def on_finish(self, sim: SimulationCore):
+        sim.print_final_stats()
+
+
+class PlotRecorder(SimulationObserver):
+    """Feeds a Visualizer after every task and renders its plots every plot_interval tasks and at the end."""
+
+    def __init__(self, visualizer: Visualizer, plot_interval: int = 100):
+        self.visualizer = visualizer
+        self.plot_interval = plot_interval
+
+    def on_interval(self, sim: SimulationCore):
+        self.visualizer.update_metrics(sim.miners, sim.success_rate)
+        if sim.completed_tasks % self.plot_interval == 0:
+            self.visualizer.plot_metrics()
+
+    def on_finish(self, sim: SimulationCore):
+        self.visualizer.plot_metrics()
+
+
+class MetricsSampler(SimulationObserver):
+    """
+    Chart metrics of the web simulation, sampled every interval tasks.
+
+    Each sample is one row of a BoundedSeries: every miner's score, every
+    miner's tokens, then POPULATION_METRICS. The samples recorded since the
+    last take_delta() call are also kept for streaming, restricted to the
+    first stream_miner_limit miners.
+    """
+
+    # Population statistics recorded after the per-miner columns
+    POPULATION_METRICS = ('renewable_energy', 'success_rate', 'useful_work_efficiency')
+
+    def __init__(self, miners: List[Miner], interval: int = 10, capacity: int = 500,
+                 policy: str = 'decimate', stream_miner_limit: int = 10):
+        self.miners = miners
+        self.interval = max(1, interval)
+        self.series = BoundedSeries(width=2 * len(miners) + len(self.POPULATION_METRICS),
+                                    capacity=capacity, policy=policy)
+        self.stream_miners = miners[:stream_miner_limit]
+        self._delta_rows = []
+
+    def on_interval(self, sim: SimulationCore):
+        self.sample(sim)
+
+    def on_finish(self, sim: SimulationCore):
+        # Final sample, unless the last task was already sampled
+        if sim.completed_tasks and sim.completed_tasks % self.interval != 0:
+            self.sample(sim)
+
+    def sample(self, sim: SimulationCore):
+        """Record one row at the current task index."""
+        num_miners = len(self.miners)
+        row = np.empty(self.series.width)
+        row[:num_miners] = [m.score for m in self.miners]
+        row[num_miners:2 * num_miners] = [m.tokens for m in self.miners]
+        # α_m is fixed per miner, so the population mean is constant
+        row[2 * num_miners:] = (sim.aggregates.renewable_mean, sim.success_rate,
+                                sim.calculate_useful_work_efficiency())
+        self.series.append(sim.completed_tasks, row)
+        self._delta_rows.append((sim.completed_tasks, row))
+
+    def _as_series(self, task_index: List[int], rows: np.ndarray, miners: List[Miner]) -> Dict[str, Any]:
+        num_miners = len(self.miners)
+        series = {
+            'task_index': task_index,
+            'scores': {m.miner_id: rows[:, i].tolist() for i, m in enumerate(miners)},
+            'tokens': {m.miner_id: rows[:, num_miners + i].tolist() for i, m in enumerate(miners)},
+        }
+        for j, name in enumerate(self.POPULATION_METRICS):
+            series[name] = rows[:, 2 * num_miners + j].tolist()
+        return series
+
+    def history(self) -> Dict[str, Any]:
+        """
+        Recorded metrics as chart series. Every series is plotted against
+        'task_index' (the task count at each retained sample), which is no
+        longer evenly spaced once the history has been downsampled.
+        """
+        task_index, rows = self.series.export()
+        return self._as_series(task_index, rows, self.miners)
+
+    def take_delta(self) -> Dict[str, Any]:
+        """Samples recorded since the last call, in the layout of history()."""
+        rows, self._delta_rows = self._delta_rows, []
+        values = np.array([row for _, row in rows]).reshape(len(rows), self.series.width)
+        return self._as_series([task_index for task_index, _ in rows], values, self.stream_miners)
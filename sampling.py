@@ -0,0 +1,210 @@
+from typing import Iterable, List
+import numpy as np
+
+# Upper bound on the number of random keys drawn at once by the dense sampler
+_KEY_BLOCK_ELEMENTS = 1 << 20
+
+
+class FenwickTree:
+    """
+    Binary indexed tree over non-negative weights.
+
+    Supports O(log n) weight updates, prefix sums and weighted sampling, so a
+    miner can be drawn with probability w_m / Σw_i (thesis Equation 4) without
+    rebuilding the probability list for every task.
+
+    Weights are updated by deltas, which accumulates floating-point drift in
+    the internal node sums. The tree is rebuilt from the exact weights every
+    `size` updates, which keeps the drift bounded at O(1) amortized cost.
+    """
+
+    def __init__(self, weights: Iterable[float]):
+        self.weights: List[float] = [float(w) for w in weights]
+        self.size = len(self.weights)
+        self._updates_since_rebuild = 0
+        self._top_bit = 1 << (self.size.bit_length() - 1) if self.size else 0
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute all node sums from the stored weights in O(n)."""
+        tree = [0.0] + list(self.weights)
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self._total = sum(self.weights)
+        self._updates_since_rebuild = 0
+
+    def total(self) -> float:
+        """Sum of all weights."""
+        return self._total
+
+    def update(self, index: int, weight: float):
+        """Set the weight at index (0-based)."""
+        delta = weight - self.weights[index]
+        if delta == 0:
+            return
+        self.weights[index] = weight
+        self._updates_since_rebuild += 1
+        if self._updates_since_rebuild >= self.size:
+            self.rebuild()
+            return
+        self._total += delta
+        tree = self.tree
+        i = index + 1
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, count: int) -> float:
+        """Sum of the first count weights."""
+        result = 0.0
+        tree = self.tree
+        i = count
+        while i > 0:
+            result += tree[i]
+            i -= i & -i
+        return result
+
+    def find(self, value: float) -> int:
+        """
+        Return the index i with prefix_sum(i) <= value < prefix_sum(i + 1).
+
+        Drawing value = u × total() for u ~ U[0, 1) selects index i with
+        probability weights[i] / total(). Zero-weight entries are never returned.
+        """
+        tree = self.tree
+        position = 0
+        step = self._top_bit
+        while step:
+            nxt = position + step
+            if nxt <= self.size and tree[nxt] <= value:
+                position = nxt
+                value -= tree[nxt]
+            step >>= 1
+        # Rounding can land past the end or on an empty slot; move to the
+        # nearest entry that actually carries weight
+        if position >= self.size:
+            position = self.size - 1
+        weights = self.weights
+        if weights[position] <= 0:
+            right = position + 1
+            while right < self.size and weights[right] <= 0:
+                right += 1
+            if right < self.size:
+                return right
+            while position > 0 and weights[position] <= 0:
+                position -= 1
+        return position
+
+
+class TieredSampler:
+    """
+    Weighted sampler over items grouped into tiers with fixed multipliers.
+
+    Item i has weight multipliers[tier_i] × score_i (thesis Equation 4 with
+    the honest/suspicious/byzantine tiers). Each tier keeps its members'
+    scores in its own Fenwick tree, so a draw first picks a tier in
+    proportion to multiplier × tier total and then a member in proportion to
+    its score. Moving an item to another tier is two O(log n) updates.
+    """
+
+    def __init__(self, scores: Iterable[float], tiers: Iterable[int], multipliers: Iterable[float]):
+        self.multipliers = [float(m) for m in multipliers]
+        self.scores = [float(s) for s in scores]
+        self.tiers = list(tiers)
+        self.buckets = [FenwickTree(s if t == b else 0.0 for s, t in zip(self.scores, self.tiers))
+                        for b in range(len(self.multipliers))]
+        self.counts = [self.tiers.count(b) for b in range(len(self.multipliers))]
+
+    def total(self) -> float:
+        """Sum of all item weights."""
+        return sum(m * bucket.total() for m, bucket in zip(self.multipliers, self.buckets))
+
+    def tier_total(self, tier: int) -> float:
+        """Sum of the scores (without multiplier) of the items in a tier."""
+        return self.buckets[tier].total()
+
+    def update(self, index: int, score: float, tier: int) -> int:
+        """Set an item's score and tier; returns its previous tier."""
+        old_tier = self.tiers[index]
+        if tier != old_tier:
+            self.buckets[old_tier].update(index, 0.0)
+            self.counts[old_tier] -= 1
+            self.counts[tier] += 1
+            self.tiers[index] = tier
+        self.buckets[tier].update(index, score)
+        self.scores[index] = score
+        return old_tier
+
+    def find(self, value: float) -> int:
+        """
+        Return the item selected by value ∈ [0, total()).
+
+        Drawing value = u × total() selects item i with probability
+        multipliers[tier_i] × score_i / total().
+        """
+        last = None
+        for multiplier, bucket in zip(self.multipliers, self.buckets):
+            weight = multiplier * bucket.total()
+            if weight <= 0:
+                continue
+            if value < weight:
+                return bucket.find(value / multiplier)
+            value -= weight
+            last = (multiplier, bucket)
+        # Rounding pushed value past the last non-empty tier
+        return last[1].find(last[1].total())
+
+
+def sample_distinct(rng: np.random.Generator, population: int, count: int, num_rows: int) -> np.ndarray:
+    """
+    Draw count distinct indices from range(population) for each of num_rows rows.
+
+    Sparse draws (count² ≤ population) use batched rejection: every row is
+    drawn with replacement and only rows containing a duplicate are redrawn,
+    which is uniform over distinct sets and touches O(num_rows × count)
+    elements in expectation regardless of population. Dense draws take the
+    count smallest of population random keys per row instead.
+
+    Returns:
+        int64 array of shape (num_rows, count)
+    """
+    if count > population:
+        raise ValueError(f"Cannot draw {count} distinct indices from {population}")
+    if count == 0 or num_rows == 0:
+        return np.empty((num_rows, count), dtype=np.int64)
+    if count * count <= population:
+        rows = rng.integers(0, population, size=(num_rows, count))
+        pending = np.arange(num_rows)
+        while count > 1:
+            ordered = np.sort(rows[pending], axis=1)
+            pending = pending[(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)]
+            if len(pending) == 0:
+                break
+            rows[pending] = rng.integers(0, population, size=(len(pending), count))
+        return rows
+    rows = np.empty((num_rows, count), dtype=np.int64)
+    block = max(1, _KEY_BLOCK_ELEMENTS // population)
+    for start in range(0, num_rows, block):
+        stop = min(start + block, num_rows)
+        keys = rng.random((stop - start, population))
+        if count < population:
+            rows[start:stop] = np.argpartition(keys, count - 1, axis=1)[:, :count]
+        else:
+            rows[start:stop] = np.argsort(keys, axis=1)
+    return rows
+
+
+def sample_excluding(rng: np.random.Generator, population: int, count: int,
+                     excluded: np.ndarray) -> np.ndarray:
+    """
+    Draw count distinct indices from range(population) per row, skipping excluded[row].
+
+    Indices are drawn from range(population - 1) and shifted past the excluded
+    index (i >= e → i + 1), so no per-row candidate list is built.
+    """
+    excluded = np.asarray(excluded, dtype=np.int64)
+    offsets = sample_distinct(rng, population - 1, count, len(excluded))
+    return offsets + (offsets >= excluded[:, None])
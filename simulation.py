@@ -0,0 +1,320 @@
+import random
+from typing import Any, Callable, List, Optional, Tuple
+import numpy as np
+from task import Task, TaskType, MULTIPLICATION_MODES
+from miner import Miner
+from distribution import TaskDistributor
+from validation import ValidationManager, VERIFIER_FAULT_MODELS
+from history import TaskHistory
+from aggregation import MinerAggregates
+
+
+# Hooks called for individual tasks, in loop order
+TASK_HOOKS = ('on_task_assigned', 'on_executed', 'on_validated')
+
+
+class SimulationObserver:
+    """
+    Base class for observers of the simulation loop; override only the hooks
+    you need.
+
+    The engine dispatches a hook only to observers that override it, and
+    checks this once per run_tasks() call. A run where no observer overrides
+    a task hook does no per-task dispatch work at all. on_interval observers
+    are called between segments of interval tasks, so a sampler costs nothing
+    in between.
+    """
+
+    # on_interval is called whenever the completed task count is a multiple of this
+    interval = 1
+
+    def on_start(self, sim: 'SimulationCore'):
+        """Called once, before the first task."""
+
+    def on_task_assigned(self, sim: 'SimulationCore', task: Task, miner: Miner, verifiers: List[Miner]):
+        """Called when a task has been assigned to an executor and verifiers, before it runs."""
+
+    def on_executed(self, sim: 'SimulationCore', task: Task, miner: Miner, solution: Any):
+        """Called after the executor has produced its solution."""
+
+    def on_validated(self, sim: 'SimulationCore', task: Task, miner: Miner, verifiers: List[Miner], is_valid: bool):
+        """Called after validation, once the task is counted and recorded."""
+
+    def on_interval(self, sim: 'SimulationCore'):
+        """Called after every interval-th task (by completed task count)."""
+
+    def on_finish(self, sim: 'SimulationCore'):
+        """Called once, after the last task."""
+
+    def overrides(self, hook: str) -> bool:
+        """True if this observer's class implements the given hook."""
+        return getattr(type(self), hook) is not getattr(SimulationObserver, hook)
+
+
+class SimulationCore:
+    """
+    Miner population, task stream and the per-task loop of the object engine.
+
+    Shared by the command-line simulation (main.BlockchainSimulation) and the
+    web simulation (app.WebBlockchainSimulation): both run the same loop and
+    differ only in the observers they attach (console output, plotting,
+    metrics sampling).
+    """
+
+    def __init__(self, num_miners: int = 20, num_tasks: int = 1000,
+                 max_byzantine: int = 3, byzantine_error_rate: float = 0.3,
+                 reward_multiplier: float = 1.0, verifier_reward_multiplier: float = 0.5,
+                 renewable_energy_alpha: float = None,
+                 num_verifiers: int = 3, byzantine_threshold: float = 0.2,
+                 fault_tolerance_enabled: bool = True, seed: int = None,
+                 independent_verification: bool = False,
+                 input_size_min: int = 10, input_size_max: int = 100,
+                 multiplication_mode: str = 'exact',
+                 history_spill_threshold: int = None, history_spill_dir: str = None,
+                 verifier_fault_model: str = 'honest'):
+        """
+        Initialize the miners and protocol components (see
+        main.BlockchainSimulation for the meaning of each parameter).
+        verifier_reward_multiplier is z of thesis Equation 8.
+        """
+        if verifier_fault_model not in VERIFIER_FAULT_MODELS:
+            raise ValueError(f"Unknown verifier fault model '{verifier_fault_model}', "
+                             f"expected one of {VERIFIER_FAULT_MODELS}")
+        if multiplication_mode not in MULTIPLICATION_MODES:
+            raise ValueError(f"Unknown multiplication mode '{multiplication_mode}', "
+                             f"expected one of {MULTIPLICATION_MODES}")
+        # Each simulation owns its generators, so concurrent simulations in one
+        # process never share random state and stay reproducible per seed
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
+
+        # Create miners with deterministic Byzantine selection
+        self.miners = Miner.create_miners(
+            num_miners=num_miners,
+            max_byzantine=max_byzantine,
+            byzantine_error_rate=byzantine_error_rate,
+            renewable_energy_alpha=renewable_energy_alpha,
+            rng=self.rng
+        )
+        self.distributor = TaskDistributor(self.miners, fault_tolerance_enabled=fault_tolerance_enabled,
+                                           rng=self.rng, np_rng=self.np_rng)
+        # Running per-class miner totals, kept current by the validator
+        self.aggregates = MinerAggregates(self.miners, byzantine_threshold)
+        self.validator = ValidationManager(k=reward_multiplier,  # Per thesis Equations 5-8
+                                           z=verifier_reward_multiplier,
+                                           independent_verification=independent_verification,
+                                           aggregates=self.aggregates,
+                                           verifier_fault_model=verifier_fault_model,
+                                           np_rng=self.np_rng)
+        self.total_tasks = num_tasks
+        self.completed_tasks = 0
+        self.successful_tasks = 0
+        self.byzantine_threshold = byzantine_threshold
+        self.actual_byzantine_count = sum(1 for m in self.miners if m.is_byzantine)
+        self.num_verifiers = num_verifiers
+        self.fault_tolerance_enabled = fault_tolerance_enabled
+        self.input_size_min = input_size_min
+        self.input_size_max = input_size_max
+        self.multiplication_mode = multiplication_mode
+
+        # Metrics tracking for analysis
+        self.task_history = TaskHistory(spill_threshold=history_spill_threshold,
+                                        spill_dir=history_spill_dir)
+        self.success_rate_history = []
+        self.miner_selection_count = {m.miner_id: 0 for m in self.miners}
+
+        self.observers: List[SimulationObserver] = []
+        self._started = False
+
+    def add_observer(self, observer: SimulationObserver) -> SimulationObserver:
+        """Attach an observer (before the run starts) and return it."""
+        self.observers.append(observer)
+        return observer
+
+    def generate_random_task(self) -> Task:
+        """Generate a random task with random input size."""
+        task_type = self.rng.choice(list(TaskType))
+        input_size = self.rng.randint(self.input_size_min, self.input_size_max)
+        return Task(task_type, input_size, rng=self.rng, multiplication_mode=self.multiplication_mode)
+
+    def start(self):
+        """Queue the task stream and notify observers (run_tasks calls this on first use)."""
+        if self._started:
+            return
+        self._started = True
+        # Stream tasks: each one is generated only when it is distributed
+        self.distributor.add_tasks(self.generate_random_task() for _ in range(self.total_tasks))
+        for observer in self.observers:
+            observer.on_start(self)
+
+    def _hooks(self, hook: str) -> Tuple[Callable, ...]:
+        """Bound hook methods of the observers that override hook, in registration order."""
+        return tuple(getattr(observer, hook) for observer in self.observers if observer.overrides(hook))
+
+    def run_tasks(self, max_tasks: Optional[int] = None) -> int:
+        """
+        Run up to max_tasks more tasks (all remaining if None) and return how
+        many ran. Running in chunks lets callers report progress in between.
+        """
+        self.start()
+        end = self.total_tasks if max_tasks is None else min(self.total_tasks, self.completed_tasks + max_tasks)
+        first = self.completed_tasks
+        task_hooks = [self._hooks(hook) for hook in TASK_HOOKS]
+        interval_hooks = [(max(1, observer.interval), observer.on_interval)
+                          for observer in self.observers if observer.overrides('on_interval')]
+
+        while self.completed_tasks < end:
+            # Run up to the next multiple of any observer interval, then dispatch on_interval
+            stop = end
+            for interval, _ in interval_hooks:
+                stop = min(stop, (self.completed_tasks // interval + 1) * interval)
+            if not self._run_segment(stop, *task_hooks):
+                break
+            for interval, on_interval in interval_hooks:
+                if self.completed_tasks % interval == 0:
+                    on_interval(self)
+
+        return self.completed_tasks - first
+
+    def _run_segment(self, stop: int, on_task_assigned: Tuple[Callable, ...],
+                     on_executed: Tuple[Callable, ...], on_validated: Tuple[Callable, ...]) -> bool:
+        """
+        The per-task hot loop: run tasks until stop completed tasks. Returns
+        False if the task queue ran dry first. Each hook tuple is empty unless
+        an observer implements that hook, so unused hooks cost one falsy test.
+        """
+        distributor = self.distributor
+        validator = self.validator
+        num_verifiers = self.num_verifiers
+        selection_count = self.miner_selection_count
+        success_rate_history = self.success_rate_history
+        task_history = self.task_history
+
+        while self.completed_tasks < stop:
+            # Distribute task with configured number of verifiers
+            distribution_result = distributor.distribute_task(num_verifiers=num_verifiers)
+            if not distribution_result:
+                return False
+
+            task, miner, verifiers = distribution_result
+
+            # Track miner selection
+            selection_count[miner.miner_id] += 1
+            if on_task_assigned:
+                for hook in on_task_assigned:
+                    hook(self, task, miner, verifiers)
+
+            # Execute task
+            solution = miner.execute_task(task)
+            if on_executed:
+                for hook in on_executed:
+                    hook(self, task, miner, solution)
+
+            # Validate and process rewards
+            is_valid = validator.process_validation(task, solution)
+            if is_valid:
+                self.successful_tasks += 1
+
+            self.completed_tasks += 1
+            success_rate_history.append(self.successful_tasks / self.completed_tasks)
+
+            # Store task outcome for analysis
+            task_history.append(self.completed_tasks, miner.miner_id, miner.is_byzantine,
+                                is_valid, len(verifiers), task.task_type, task.cost)
+            if on_validated:
+                for hook in on_validated:
+                    hook(self, task, miner, verifiers, is_valid)
+
+        return True
+
+    def finish(self):
+        """Compact the task history and notify observers that the run is over."""
+        self.task_history.shrink_to_fit()
+        for observer in self.observers:
+            observer.on_finish(self)
+
+    @property
+    def success_rate(self) -> float:
+        return self.successful_tasks / self.completed_tasks if self.completed_tasks > 0 else 0
+
+    def calculate_useful_work_efficiency(self) -> float:
+        """
+        Calculate useful work efficiency η = U/(U+W).
+        U = useful work (successful tasks), W = wasted work (failed tasks + verification overhead).
+        """
+        useful_work = self.successful_tasks
+        wasted_work = (self.completed_tasks - self.successful_tasks) + (self.completed_tasks * self.num_verifiers * 0.1)
+        return useful_work / (useful_work + wasted_work) if (useful_work + wasted_work) > 0 else 0
+
+    def print_initial_state(self):
+        """Print the simulation configuration and initial miner states."""
+        print("Starting blockchain mining simulation...")
+        print(f"Number of miners: {len(self.miners)}")
+        print(f"Number of tasks: {self.total_tasks}")
+        print(f"Byzantine miners: {self.actual_byzantine_count}")
+        print(f"Number of verifiers per task (V): {self.num_verifiers}")
+        print(f"Byzantine fault tolerance: {'Enabled' if self.fault_tolerance_enabled else 'Disabled'}")
+        print(f"Verifier fault model: {self.validator.verifier_fault_model}")
+        print(f"Byzantine threshold: {self.byzantine_threshold:.2%}")
+        print("\nInitial miner states:")
+        for miner in self.miners:
+            print(miner)
+        print("\nStarting tasks...")
+
+    def print_final_stats(self):
+        """Print final simulation statistics with detailed Byzantine analysis."""
+        print("\n=== Final Statistics ===")
+        print("\n1. Overall Performance:")
+        print(f"   Total tasks completed: {self.completed_tasks}")
+        print(f"   Successful tasks: {self.successful_tasks}")
+        print(f"   Overall success rate: {(self.successful_tasks / self.completed_tasks):.2%}")
+        print(f"   Useful work efficiency (η): {self.calculate_useful_work_efficiency():.2%}")
+        
+        # Byzantine Analysis
+        aggregates = self.aggregates
+        byzantine_miners = [m for m in self.miners if m.error_rate > self.byzantine_threshold]
+        print(f"   {aggregates.count(byzantine=True)} miners showed Byzantine behavior (error rate > {self.byzantine_threshold:.0%})")
+        
+        print("\n2. Byzantine Miners (error rate > 20%):")
+        # Sort byzantine miners by error rate
+        byzantine_miners.sort(key=lambda x: x.error_rate, reverse=True)
+        for miner in byzantine_miners:
+            print(f"   Miner {miner.miner_id}: {miner.error_rate:.2%} error rate, selected {self.miner_selection_count[miner.miner_id]} times")
+        
+        print("\n3. Impact of Byzantine Behavior on Rewards:")
+        # Sort all miners by tokens for top performers
+        sorted_miners = sorted(self.miners, key=lambda x: x.tokens, reverse=True)
+        top_performers = sorted_miners[:4]
+        print("   Top performers:")
+        for miner in top_performers:
+            print(f"   Miner {miner.miner_id}: {miner.tasks_completed} tasks, {miner.error_rate:.2%} error rate, {miner.tokens:.0f} tokens")
+        
+        print("\n   Byzantine miners performance:")
+        for miner in byzantine_miners:
+            print(f"   Miner {miner.miner_id} ({miner.error_rate:.2%} error rate): {miner.tasks_completed} tasks completed, {miner.tokens:.0f} tokens")
+        
+        print("\n4. Byzantine Fault Tolerance Analysis:")
+        print("   a. Task Distribution Impact:")
+        avg_tasks_normal = aggregates.avg_tasks(byzantine=False)
+        avg_tasks_byzantine = aggregates.avg_tasks(byzantine=True)
+        print(f"      - Average tasks per normal miner: {avg_tasks_normal:.1f}")
+        print(f"      - Average tasks per Byzantine miner: {avg_tasks_byzantine:.1f}")
+        
+        print("\n   b. Token Distribution Impact:")
+        avg_tokens_normal = aggregates.avg_tokens(byzantine=False)
+        avg_tokens_byzantine = aggregates.avg_tokens(byzantine=True)
+        print(f"      - Average tokens per normal miner: {avg_tokens_normal:.0f}")
+        print(f"      - Average tokens per Byzantine miner: {avg_tokens_byzantine:.0f}")
+        
+        print("\n5. Detailed Miner Statistics (sorted by tokens):")
+        for miner in sorted_miners:
+            print(f"\nMiner {miner.miner_id}:")
+            print(f"   Score: {miner.score:.2f}")
+            print(f"   Renewable Energy: {miner.renewable_energy_proportion:.2%}")
+            print(f"   Tasks Completed: {miner.tasks_completed}")
+            print(f"   Selection Count: {self.miner_selection_count[miner.miner_id]}")
+            print(f"   Penalties: {miner.penalties}")
+            print(f"   Error Rate: {miner.error_rate:.2%}")
+            print(f"   Total Tokens: {miner.tokens:.0f}")
+            print(f"   Status: {'BYZANTINE' if miner.error_rate > self.byzantine_threshold else 'Normal'}")
@@ -1,10 +1,16 @@
 // Configuration management
 let currentConfig = {};
 let isSimulationRunning = false;
+let currentJobId = null;
+let liveChartsCreated = false;
+
+// Compact binary result encoding served by the results endpoints (see encoding.py)
+const COLUMNS_MIMETYPE = 'application/x-sim-columns';
 
 // DOM elements
 const runButton = document.getElementById('runSimulation');
 const resetButton = document.getElementById('resetConfig');
+const cancelButton = document.getElementById('cancelSimulation');
 const progressSection = document.getElementById('progressSection');
 const progressBar = document.getElementById('progressBar');
 const progressText = document.getElementById('progressText');
@@ -68,6 +74,7 @@ function setupEventListeners() {
     resetButton.addEventListener('click', () => {
         loadDefaultConfig();
     });
+    cancelButton.addEventListener('click', cancelSimulation);
 }
 
 // Run simulation
@@ -97,8 +104,8 @@ async function runSimulation() {
     loadingMessage.textContent = 'Running simulation...';
 
     try {
-        // Use synchronous endpoint for simplicity
-        const response = await fetch('/api/simulate/sync', {
+        // Submit a background job, then stream its progress until it finishes
+        const submitResponse = await fetch('/api/jobs', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -106,17 +113,30 @@ async function runSimulation() {
             body: JSON.stringify(config)
         });
 
-        if (!response.ok) {
+        if (!submitResponse.ok) {
             throw new Error('Simulation failed');
         }
 
-        const result = await response.json();
+        const job = await submitResponse.json();
+        currentJobId = job.job_id;
+        cancelButton.disabled = false;
+        liveChartsCreated = false;
+
+        const result = await streamJob(job.job_id);
+        if (result.type === 'cancelled') {
+            loadingMessage.style.display = 'block';
+            loadingMessage.textContent = 'Simulation cancelled';
+            return;
+        }
+        if (result.type !== 'final') {
+            throw new Error(result.error || 'Simulation failed');
+        }
         
         // Update progress to 100%
         updateProgress(result.summary.total_tasks, result.summary.total_tasks, result.summary.success_rate);
         
-        // Display results
-        displayResults(result);
+        // Display results (a cached run streamed no deltas, so fetch its series)
+        displayResults(result.metrics_streamed ? result : await fetchJobResult(result.job_id));
 
     } catch (error) {
         console.error('Error running simulation:', error);
@@ -124,11 +144,113 @@ async function runSimulation() {
         loadingMessage.textContent = 'Error running simulation';
     } finally {
         isSimulationRunning = false;
+        currentJobId = null;
+        cancelButton.disabled = true;
         runButton.disabled = false;
         runButton.textContent = 'Run Simulation';
     }
 }
 
+// Follow a job's server-sent events, appending each progress delta to the live
+// charts; resolves with the terminal frame ('final', 'cancelled' or 'failed')
+function streamJob(jobId) {
+    return new Promise((resolve, reject) => {
+        const source = new EventSource(`/api/jobs/${jobId}/events`);
+        source.onmessage = (event) => {
+            const frame = JSON.parse(event.data);
+            if (frame.type === 'progress') {
+                updateProgress(frame.completed, frame.total, frame.success_rate);
+                appendMetrics(frame.delta);
+                return;
+            }
+            // Close before the server ends the stream, or EventSource reconnects
+            source.close();
+            resolve(frame);
+        };
+        source.onerror = () => {
+            source.close();
+            reject(new Error('Lost connection to simulation stream'));
+        };
+    });
+}
+
+// Fetch a finished job's full results in the binary columns encoding
+async function fetchJobResult(jobId) {
+    const response = await fetch(`/api/jobs/${jobId}/result`, {
+        headers: { 'Accept': COLUMNS_MIMETYPE }
+    });
+    if (!response.ok) {
+        throw new Error('Could not fetch simulation results');
+    }
+    if (response.headers.get('Content-Type') !== COLUMNS_MIMETYPE) {
+        return response.json();
+    }
+    return decodeColumns(await response.arrayBuffer());
+}
+
+// Decode 'SIMC' | uint32 header length | JSON header | column data into the
+// original document, with numeric series as typed-array views (no copying)
+function decodeColumns(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'SIMC') {
+        throw new Error('Unexpected result encoding');
+    }
+    const headerLength = view.getUint32(4, true);
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+    const base = 8 + headerLength;
+    const columns = header.columns.map(spec => spec.dtype === 'int32'
+        ? new Int32Array(buffer, base + spec.offset, spec.length)
+        : new Float32Array(buffer, base + spec.offset, spec.length));
+
+    const restore = (node) => {
+        if (Array.isArray(node)) return node.map(restore);
+        if (node !== null && typeof node === 'object') {
+            if ('$col' in node) return columns[node.$col];
+            const out = {};
+            for (const key of Object.keys(node)) out[key] = restore(node[key]);
+            return out;
+        }
+        return node;
+    };
+    return restore(header.document);
+}
+
+// Append streamed samples to the time-series charts (created on the first delta)
+function appendMetrics(delta) {
+    if (!delta || delta.task_index.length === 0) return;
+
+    if (!liveChartsCreated) {
+        loadingMessage.style.display = 'none';
+        resultsContent.style.display = 'block';
+        createScoresChart(delta.task_index, delta.scores);
+        createSuccessRateChart(delta.task_index, delta.success_rate);
+        createRenewableEnergyChart(delta.task_index, delta.renewable_energy);
+        liveChartsCreated = true;
+        return;
+    }
+
+    // Same miner order and limit as createScoresChart
+    const minerIds = Object.keys(delta.scores).slice(0, 10);
+    Plotly.extendTraces('scoresChart', {
+        x: minerIds.map(() => delta.task_index),
+        y: minerIds.map(id => delta.scores[id])
+    }, minerIds.map((_, i) => i));
+    Plotly.extendTraces('successRateChart', { x: [delta.task_index], y: [delta.success_rate] }, [0]);
+    Plotly.extendTraces('renewableEnergyChart', { x: [delta.task_index], y: [delta.renewable_energy] }, [0]);
+}
+
+// Cancel the running simulation job (the stream then ends with a 'cancelled' frame)
+async function cancelSimulation() {
+    if (!currentJobId) return;
+    cancelButton.disabled = true;
+    try {
+        await fetch(`/api/jobs/${currentJobId}`, { method: 'DELETE' });
+    } catch (error) {
+        console.error('Error cancelling simulation:', error);
+    }
+}
+
 // Update progress display
 function updateProgress(completed, total, successRate) {
     const percentage = (completed / total) * 100;
@@ -148,18 +270,23 @@ function displayResults(result) {
     document.getElementById('statSuccessRate').textContent = `${(result.summary.success_rate * 100).toFixed(2)}%`;
     document.getElementById('statByzantineCount').textContent = result.summary.byzantine_count;
 
-    // Create charts
-    createScoresChart(result.metrics.scores);
+    // Create charts. A streamed run already drew its time series from the
+    // progress deltas, and its final frame carries no 'metrics'.
+    if (result.metrics) {
+        // Metric series share one x axis: the task index of each retained sample
+        const taskIndex = result.metrics.task_index;
+        createScoresChart(taskIndex, result.metrics.scores);
+        createSuccessRateChart(taskIndex, result.metrics.success_rate);
+        createRenewableEnergyChart(taskIndex, result.metrics.renewable_energy);
+    }
     createTokensChart(result.miners);
-    createSuccessRateChart(result.metrics.success_rate);
-    createRenewableEnergyChart(result.metrics.renewable_energy);
 
     // Populate miners table
     populateMinersTable(result.miners);
 }
 
 // Create scores over time chart
-function createScoresChart(scoresData) {
+function createScoresChart(taskIndex, scoresData) {
     const traces = [];
     
     // Show only top 10 miners to avoid clutter
@@ -168,6 +295,7 @@ function createScoresChart(scoresData) {
     
     for (const minerId of topMiners) {
         traces.push({
+            x: taskIndex,
             y: scoresData[minerId],
             type: 'scatter',
             mode: 'lines',
@@ -177,7 +305,7 @@ function createScoresChart(scoresData) {
     }
 
     const layout = {
-        xaxis: { title: 'Task Iterations' },
+        xaxis: { title: 'Tasks Completed' },
         yaxis: { title: 'Score' },
         showlegend: true,
         legend: { orientation: 'v', x: 1.05, y: 1 },
@@ -214,8 +342,9 @@ function createTokensChart(minersData) {
 }
 
 // Create success rate chart
-function createSuccessRateChart(successRateData) {
+function createSuccessRateChart(taskIndex, successRateData) {
     const trace = {
+        x: taskIndex,
         y: successRateData,
         type: 'scatter',
         mode: 'lines',
@@ -226,7 +355,7 @@ function createSuccessRateChart(successRateData) {
     };
 
     const layout = {
-        xaxis: { title: 'Task Iterations' },
+        xaxis: { title: 'Tasks Completed' },
         yaxis: { 
             title: 'Success Rate',
             tickformat: '.0%',
@@ -240,8 +369,9 @@ function createSuccessRateChart(successRateData) {
 }
 
 // Create renewable energy usage chart
-function createRenewableEnergyChart(renewableEnergyData) {
+function createRenewableEnergyChart(taskIndex, renewableEnergyData) {
     const trace = {
+        x: taskIndex,
         y: renewableEnergyData,
         type: 'scatter',
         mode: 'lines',
@@ -252,7 +382,7 @@ function createRenewableEnergyChart(renewableEnergyData) {
     };
 
     const layout = {
-        xaxis: { title: 'Task Iterations' },
+        xaxis: { title: 'Tasks Completed' },
         yaxis: { 
             title: 'Proportion',
             tickformat: '.0%',
@@ -0,0 +1,100 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from aggregation import RunningStats
+
+Grid = Dict[str, Sequence[Any]]
+
+
+def expand_grid(grid: Union[Grid, Sequence[Grid]]) -> List[Dict[str, Any]]:
+    """
+    Expand a declarative parameter grid into the list of configurations.
+
+    A dict maps each constructor argument to the values to try and expands to
+    their Cartesian product (first key varies slowest). A list of dicts is
+    expanded one grid at a time and concatenated, which covers studies whose
+    arms are not a full product (e.g. an ablation).
+
+    Example:
+        expand_grid({'byzantine_error_rate': [0.1, 0.3], 'num_verifiers': [3, 5]})
+        → 4 configurations
+    """
+    grids = [grid] if isinstance(grid, dict) else list(grid)
+    configs = []
+    for g in grids:
+        keys = list(g.keys())
+        for values in itertools.product(*(g[k] for k in keys)):
+            configs.append(dict(zip(keys, values)))
+    return configs
+
+
+def execute_cells(cells: Sequence[tuple], run_cell: Callable, workers: Optional[int] = None,
+                  cost: Optional[Callable[[tuple], float]] = None,
+                  on_result: Optional[Callable[[int, Any], None]] = None) -> List[Any]:
+    """
+    Run run_cell(*cell) for every cell and return the results in cell order.
+
+    With workers > 1 every cell is submitted to a process pool as its own work
+    item, so an idle worker always pulls the next pending cell instead of
+    waiting on a fixed pre-assigned chunk. Cells are submitted most expensive
+    first (according to cost, if given), which keeps a long cell from being
+    left for the end of the sweep.
+
+    Args:
+        cells: Argument tuples, one per unit of work
+        run_cell: Top-level (picklable) function to apply to each cell
+        workers: Process pool size; serial execution if None or 1
+        cost: Optional estimate of a cell's relative run time
+        on_result: Called as on_result(index, result) as each cell finishes
+    """
+    results: List[Any] = [None] * len(cells)
+    if workers is None or workers <= 1 or len(cells) <= 1:
+        for i, cell in enumerate(cells):
+            results[i] = run_cell(*cell)
+            if on_result is not None:
+                on_result(i, results[i])
+        return results
+
+    order = list(range(len(cells)))
+    if cost is not None:
+        order.sort(key=lambda i: cost(cells[i]), reverse=True)
+    with ProcessPoolExecutor(max_workers=min(workers, len(cells))) as executor:
+        futures = {executor.submit(run_cell, *cells[i]): i for i in order}
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if on_result is not None:
+                on_result(i, results[i])
+    return results
+
+
+def summarize_sweep(rows: Sequence[Dict[str, Any]], by: Sequence[str],
+                    metrics: Sequence[str] = ('success_rate', 'useful_work_efficiency')) -> List[Dict[str, Any]]:
+    """
+    Aggregate a tidy sweep table over seeds.
+
+    Rows are grouped by the values of the `by` columns (groups keep the order
+    in which they first appear) and each metric is reduced to its mean,
+    population std and 95% CI.
+
+    Returns:
+        One dict per group: the `by` values, 'num_runs', and
+        '<metric>_mean', '<metric>_std', '<metric>_ci' for each metric.
+    """
+    groups: Dict[tuple, Dict[str, RunningStats]] = {}
+    for row in rows:
+        key = tuple(row[k] for k in by)
+        stats = groups.setdefault(key, {m: RunningStats() for m in metrics})
+        for m in metrics:
+            stats[m].add(row[m])
+
+    summary = []
+    for key, stats in groups.items():
+        entry = dict(zip(by, key))
+        entry['num_runs'] = next(iter(stats.values())).count if stats else 0
+        for m, s in stats.items():
+            entry[f'{m}_mean'] = s.mean
+            entry[f'{m}_std'] = s.std
+            entry[f'{m}_ci'] = s.ci()
+        summary.append(entry)
+    return summary
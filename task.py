@@ -1,7 +1,9 @@
 from enum import Enum
+import math
 import random
 import time
-from typing import List, Any, Optional
+from typing import Any, Optional
+import numpy as np
 
 class TaskType(Enum):
     ADDITION = "addition"
@@ -9,21 +11,178 @@ class TaskType(Enum):
     SORTING = "sorting"
     SEARCHING = "searching"
 
+# How MULTIPLICATION tasks represent their product:
+# - 'exact':   arbitrary-precision Python int (grows with input size)
+# - 'modular': product modulo the Mersenne prime 2^61 - 1 (fixed width)
+# - 'log':     sum of natural logs, i.e. the log of the product (fixed width)
+MULTIPLICATION_MODES = ('exact', 'modular', 'log')
+PRODUCT_MODULUS = (1 << 61) - 1
+
+# Task inputs are integers in [1, INPUT_VALUE_MAX]
+INPUT_VALUE_MAX = 100
+
+# Cost coefficients per task type, in TaskType declaration order (thesis Equation 1).
+# SORTING is quadratic, so its coefficient multiplies n² instead of n.
+LINEAR_COST = np.array([0.5, 1.0, 0.0, 2.0])
+QUADRATIC_COST = np.array([0.0, 0.0, 1.0, 0.0])
+
+# Probability that a faulty execution (Miner.execute_task) still yields the
+# correct result, in TaskType declaration order.
+# - ADDITION adds randint(-10, 10), which is 0 with probability 1/21
+# - SORTING swaps two positions holding equal values with probability
+#   1/INPUT_VALUE_MAX (inputs are i.i.d. uniform over 1..INPUT_VALUE_MAX)
+# - MULTIPLICATION and SEARCHING always produce a wrong result
+MASKED_FAULT_PROBABILITY = np.array([1.0 / 21.0, 0.0, 1.0 / INPUT_VALUE_MAX, 0.0])
+
+# SplitMix64 constants (golden-ratio increment and finalizer multipliers)
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_M2 = np.uint64(0x94D049BB133111EB)
+
+
+def task_stream(seed: int, count: int) -> np.ndarray:
+    """
+    The first count + 1 outputs of a SplitMix64 stream for a task seed.
+    
+    SplitMix64 is counter-based: output i is a fixed hash of seed + i × γ, so
+    a task's inputs can be regenerated from (seed, size) at any time with a
+    handful of vectorized operations and no generator object to construct.
+    Output 0 picks the SEARCHING target; outputs 1..count are the input values.
+    """
+    z = np.arange(count + 1, dtype=np.uint64) * _SPLITMIX_GAMMA + np.uint64(seed)
+    z = (z ^ (z >> np.uint64(30))) * _SPLITMIX_M1
+    z = (z ^ (z >> np.uint64(27))) * _SPLITMIX_M2
+    return z ^ (z >> np.uint64(31))
+
+
+def results_equal(solution: Any, expected: Any) -> bool:
+    """Compare a submitted result with the expected one (array-aware for SORTING)."""
+    if isinstance(expected, np.ndarray) or isinstance(solution, np.ndarray):
+        return np.array_equal(solution, expected)
+    return solution == expected
+
+
+def mulmod61(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Element-wise (a × b) mod (2^61 - 1) for uint64 arrays with a, b < 2^61.
+    
+    The 122-bit product does not fit in 64 bits, so both operands are split
+    into 31-bit low and 30-bit high limbs and the partial products are folded
+    using 2^61 ≡ 1 (mod 2^61 - 1). Every intermediate stays below 2^64.
+    """
+    a = np.asarray(a, dtype=np.uint64)
+    b = np.asarray(b, dtype=np.uint64)
+    mask31 = np.uint64((1 << 31) - 1)
+    mask30 = np.uint64((1 << 30) - 1)
+    modulus = np.uint64(PRODUCT_MODULUS)
+    a_hi, a_lo = a >> np.uint64(31), a & mask31
+    b_hi, b_lo = b >> np.uint64(31), b & mask31
+    # a×b = hi×2^62 + mid×2^31 + lo, with 2^62 ≡ 2
+    mid = a_hi * b_lo + a_lo * b_hi
+    total = ((a_hi * b_hi) << np.uint64(1)) \
+        + (mid >> np.uint64(30)) + ((mid & mask30) << np.uint64(31)) \
+        + a_lo * b_lo
+    total = (total & modulus) + (total >> np.uint64(61))
+    return np.where(total >= modulus, total - modulus, total)
+
+
+def batch_products(values: np.ndarray, mode: str = 'modular') -> np.ndarray:
+    """
+    Vectorized MULTIPLICATION results for a batch of inputs.
+    
+    Args:
+        values: 2-D array of positive integers, one task per row. Ragged
+                batches should be padded with 1 (the multiplicative identity).
+        mode: 'modular' or 'log' (see MULTIPLICATION_MODES). 'exact' products
+              are unbounded and cannot be represented in a NumPy array.
+    
+    Returns:
+        1-D array with one product per row (uint64 residues or float64 logs).
+    """
+    values = np.atleast_2d(values)
+    if mode == 'log':
+        return np.log(values.astype(np.float64)).sum(axis=1)
+    if mode != 'modular':
+        raise ValueError(f"batch_products supports 'modular' and 'log', got '{mode}'")
+    residues = values.astype(np.uint64) % np.uint64(PRODUCT_MODULUS)
+    # Pairwise tree reduction: log2(n) vectorized mulmod passes
+    while residues.shape[1] > 1:
+        if residues.shape[1] % 2:
+            residues = np.concatenate([residues, np.ones((residues.shape[0], 1), dtype=np.uint64)], axis=1)
+        residues = mulmod61(residues[:, 0::2], residues[:, 1::2])
+    return residues[:, 0]
+
+
 class Task:
-    def __init__(self, task_type: TaskType, input_size: int):
+    # Fixed attribute layout: no per-instance __dict__, so queued and
+    # in-flight tasks stay small and attribute access is a slot lookup
+    __slots__ = ('task_type', 'input_size', 'multiplication_mode', 'seed', '_input_data',
+                 '_search_position', '_search_index', 'assigned_miner', 'cost', 'result',
+                 'is_validated', 'verifiers', 'approvals', '_canonical_result',
+                 '_canonical_computed')
+
+    def __init__(self, task_type: TaskType, input_size: int, rng: Optional[random.Random] = None,
+                 multiplication_mode: str = 'exact', seed: Optional[int] = None):
+        """
+        Create a task whose random input is generated lazily from a per-task seed.
+        
+        A task only stores (type, size, seed); input_data is materialized on
+        first use, so building and queueing tasks is O(1) in the input size and
+        any task can be replayed exactly with Task(task_type, input_size, seed=seed).
+        
+        Args:
+            task_type: Kind of computation to perform
+            input_size: Number of input values n
+            rng: Random generator owned by the simulation, used to draw the seed.
+                 If None, the module-level random functions are used.
+            multiplication_mode: Product representation for MULTIPLICATION
+                                 tasks, one of MULTIPLICATION_MODES. 'modular'
+                                 and 'log' keep the per-task cost flat for
+                                 large input sizes.
+            seed: 64-bit input seed; drawn from rng if None
+        """
+        if multiplication_mode not in MULTIPLICATION_MODES:
+            raise ValueError(f"Unknown multiplication mode '{multiplication_mode}', "
+                             f"expected one of {MULTIPLICATION_MODES}")
         self.task_type = task_type
         self.input_size = input_size
-        self.input_data = self._generate_input()
+        self.multiplication_mode = multiplication_mode
+        if seed is None:
+            seed = (rng if rng is not None else random).getrandbits(64)
+        self.seed = seed
+        self._input_data = None
+        self._search_position = None
+        self._search_index = None
         self.assigned_miner = None
         self.cost = self._calculate_cost()
         self.result = None
         self.is_validated = False
-        self.verifiers = []
+        self.verifiers = ()  # Replaced by the distributor's list on assignment
         self.approvals = 0
+        self._canonical_result = None
+        self._canonical_computed = False  # execute() results may themselves be None
 
-    def _generate_input(self) -> List[int]:
-        """Generate random input data based on task type and size."""
-        return [random.randint(1, 100) for _ in range(self.input_size)]
+    def _generate_input(self):
+        """Materialize input_data (and the SEARCHING target position) from the seed."""
+        stream = task_stream(self.seed, self.input_size)
+        self._input_data = (stream[1:] % np.uint64(INPUT_VALUE_MAX)).astype(np.int64) + 1
+        # SEARCHING looks up a target fixed by the seed, so every execution
+        # (executor or verifier) answers the same question
+        self._search_position = int(stream[0] % np.uint64(max(self.input_size, 1)))
+
+    @property
+    def input_data(self) -> np.ndarray:
+        """The n input values in [1, INPUT_VALUE_MAX], generated on first access."""
+        if self._input_data is None:
+            self._generate_input()
+        return self._input_data
+
+    @property
+    def search_target(self) -> Optional[int]:
+        """Value a SEARCHING task looks up (one of its inputs); None for other types."""
+        if self.task_type != TaskType.SEARCHING or self.input_size == 0:
+            return None
+        return int(self.input_data[self._search_position])
 
     def _calculate_cost(self) -> float:
         """
@@ -48,23 +207,52 @@ class Task:
 
     def execute(self) -> Any:
         """Execute the task based on its type."""
+        data = self.input_data
         if self.task_type == TaskType.ADDITION:
-            return sum(self.input_data)
+            return int(data.sum())
         elif self.task_type == TaskType.MULTIPLICATION:
-            result = 1
-            for num in self.input_data:
-                result *= num
-            return result
+            if self.multiplication_mode == 'exact':
+                return math.prod(data.tolist())
+            product = batch_products(data, self.multiplication_mode)[0]
+            return product.item()
         elif self.task_type == TaskType.SORTING:
-            return sorted(self.input_data)
+            return np.sort(data)
         elif self.task_type == TaskType.SEARCHING:
-            target = random.choice(self.input_data)
-            return target in self.input_data
+            return self.search_target in self._get_search_index()
+
+    def _get_search_index(self) -> frozenset:
+        """Build the membership index over input_data once; later lookups are O(1)."""
+        if self._search_index is None:
+            self._search_index = frozenset(self.input_data.tolist())
+        return self._search_index
 
-    def verify_solution(self, solution: Any) -> bool:
-        """Verify if the provided solution is correct."""
-        correct_solution = self.execute()
-        return solution == correct_solution
+    def canonical_result(self) -> Any:
+        """
+        Return the correct result, executing the task only the first time.
+        
+        The executor and all V verifiers compare against this one cached value
+        instead of re-running the computation V + 1 times. Verification
+        therefore draws nothing from the simulation's random stream, which
+        SEARCHING executions used to do once per verifier: seeded runs do not
+        reproduce results from before this cache.
+        """
+        if not self._canonical_computed:
+            self._canonical_result = self.execute()
+            self._canonical_computed = True
+        return self._canonical_result
+
+    def verify_solution(self, solution: Any, recompute: bool = False) -> bool:
+        """
+        Verify if the provided solution is correct.
+        
+        Args:
+            solution: Result submitted by the executor
+            recompute: If True, re-execute the task independently instead of
+                       using the cached canonical result (models the cost of
+                       each verifier redoing the work)
+        """
+        correct_solution = self.execute() if recompute else self.canonical_result()
+        return results_equal(solution, correct_solution)
 
     def __str__(self) -> str:
         return f"Task(type={self.task_type.value}, size={self.input_size}, cost={self.cost})" 
\ No newline at end of file
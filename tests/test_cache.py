@@ -0,0 +1,28 @@
+import os
+import shutil
+import cache
+from cache import SIMULATION_MODULES, source_version
+from main import run_cache_key
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_editing_summarize_run_changes_the_cache_key(tmp_path, monkeypatch):
+    for name in SIMULATION_MODULES:
+        shutil.copy(os.path.join(PACKAGE_DIR, name), tmp_path)
+    before = source_version(str(tmp_path))
+
+    main_py = tmp_path / 'main.py'
+    source = main_py.read_text(encoding='utf-8')
+    edited = source.replace('return {key: float(result[key]) for key in RUN_SUMMARY_KEYS}',
+                            'return {key: round(float(result[key]), 3) for key in RUN_SUMMARY_KEYS}')
+    assert edited != source
+    main_py.write_text(edited, encoding='utf-8')
+    after = source_version(str(tmp_path))
+    assert after != before
+
+    config = {'num_miners': 10, 'num_tasks': 100}
+    monkeypatch.setattr(cache, '_code_version', before)
+    key_before = run_cache_key(1, config)
+    monkeypatch.setattr(cache, '_code_version', after)
+    assert run_cache_key(1, config) != key_before
@@ -0,0 +1,31 @@
+import random
+from distribution import TaskDistributor
+from miner import Miner
+
+
+def make_miners(count: int):
+    rng = random.Random(0)
+    miners = [Miner(i, rng=rng) for i in range(count)]
+    for miner in miners:
+        miner.score = 1.0
+    return miners
+
+
+def test_mark_dirty_refreshes_selection_weights():
+    miners = make_miners(5)
+    distributor = TaskDistributor(miners, rng=random.Random(1))
+    miners[3].score = 1e9
+    assert any(distributor.select_miner() is not miners[3] for _ in range(50))
+    distributor.mark_dirty(miners[3])
+    assert all(distributor.select_miner() is miners[3] for _ in range(50))
+
+
+def test_tier_events_keep_only_the_most_recent_moves():
+    miners = make_miners(3)
+    distributor = TaskDistributor(miners, rng=random.Random(1), max_tier_events=2)
+    for error_rate in (0.5, 0.0, 0.18, 0.0):
+        miners[0].error_rate = error_rate
+        distributor.mark_dirty(miners[0])
+        distributor.tier_counts()
+    assert [event[2:] for event in distributor.tier_events] == [('honest', 'suspicious'),
+                                                                ('suspicious', 'honest')]
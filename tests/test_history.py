@@ -0,0 +1,25 @@
+import os
+import pickle
+from history import TaskHistory
+from main import run_multiple_simulations
+
+
+def test_spilled_multi_worker_run_leaves_no_spill_directory(tmp_path):
+    for keep_raw_results in (True, False):
+        stats = run_multiple_simulations(num_runs=3, workers=3, num_miners=10, num_tasks=300,
+                                         keep_raw_results=keep_raw_results, cache=False,
+                                         history_spill_threshold=50, history_spill_dir=str(tmp_path))
+        if keep_raw_results:
+            assert [len(run['task_history']) for run in stats['raw_results']] == [300] * 3
+        assert os.listdir(tmp_path) == []
+
+
+def test_pickled_spilled_history_is_self_contained(tmp_path):
+    history = TaskHistory(spill_threshold=10, spill_dir=str(tmp_path))
+    for i in range(25):
+        history.append(i, i % 4, False, i % 3 != 0, 3)
+    copy = pickle.loads(pickle.dumps(history))
+    history.discard()
+    assert os.listdir(tmp_path) == []
+    assert [row['task_id'] for row in copy] == list(range(25))
+    assert copy[24]['is_valid'] is False
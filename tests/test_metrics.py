@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from metrics import BoundedSeries, SERIES_POLICIES
+
+
+@pytest.mark.parametrize('policy', SERIES_POLICIES)
+@pytest.mark.parametrize('capacity', [1, 4, 5, 6, 7, 8, 9, 16])
+def test_export_never_exceeds_capacity(policy, capacity):
+    series = BoundedSeries(width=2, capacity=capacity, policy=policy)
+    for x in range(300):
+        series.append(x, [np.sin(0.37 * x), x])
+        xs, rows = series.export()
+        assert len(xs) == len(rows) <= series.capacity
+        assert xs[-1] == x
+        assert xs == sorted(xs)
+
+
+@pytest.mark.parametrize('capacity', [4, 5, 8, 9])
+def test_minmax_keeps_extremes_at_small_capacity(capacity):
+    series = BoundedSeries(width=1, capacity=capacity, policy='minmax')
+    values = np.sin(0.37 * np.arange(300))
+    for x, value in enumerate(values):
+        series.append(x, [value])
+        _, rows = series.export()
+        assert rows.min() == values[:x + 1].min()
+        assert rows.max() == values[:x + 1].max()
@@ -0,0 +1,16 @@
+import copy
+import pickle
+import pytest
+from task import Task, TaskType, results_equal
+
+
+@pytest.mark.parametrize('task_type', list(TaskType))
+@pytest.mark.parametrize('computed', [False, True])
+def test_task_survives_pickle_and_deepcopy(task_type, computed):
+    task = Task(task_type, 10, seed=5)
+    expected = task.execute()
+    if computed:
+        task.canonical_result()
+    for clone in (pickle.loads(pickle.dumps(task)), copy.deepcopy(task)):
+        assert results_equal(clone.canonical_result(), expected)
+        assert clone.verify_solution(expected)
@@ -1,7 +1,51 @@
-from typing import List, Any
+from typing import Any, Optional
 import math
+import numpy as np
 from task import Task
-from miner import Miner
+from aggregation import MinerAggregates
+
+# How verifiers vote (Byzantine = miner created as Byzantine):
+# - 'honest':        every verifier approves iff the solution is correct
+# - 'random_flip':   every verifier flips its honest vote with its own error probability
+# - 'collude':       Byzantine verifiers approve Byzantine executors and reject honest ones
+# - 'always_reject': Byzantine verifiers reject every solution
+VERIFIER_FAULT_MODELS = ('honest', 'random_flip', 'collude', 'always_reject')
+
+
+def tally_votes(honest_votes: np.ndarray, executor_byzantine: np.ndarray,
+                verifier_byzantine: np.ndarray, verifier_error_probability: np.ndarray,
+                fault_model: str = 'honest', flip_draws: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Count approvals for a batch of tasks from a matrix of verifier votes.
+    
+    All verifier arguments have shape (..., V), one row per task; the vote
+    matrix is built and summed with array operations, so the cost does not
+    involve a Python call per verifier.
+    
+    Args:
+        honest_votes: Vote each verifier would cast if honest (solution correct)
+        executor_byzantine: Whether each task's executor is Byzantine, shape (...)
+        verifier_byzantine: Whether each verifier is Byzantine
+        verifier_error_probability: Each verifier's error probability
+        fault_model: One of VERIFIER_FAULT_MODELS
+        flip_draws: Uniform [0, 1) draws shaped like the votes ('random_flip' only)
+    
+    Returns:
+        Number of approvals per task, shape (...)
+    """
+    honest_votes = np.asarray(honest_votes, dtype=bool)
+    if fault_model == 'honest':
+        votes = honest_votes
+    elif fault_model == 'random_flip':
+        votes = honest_votes ^ (flip_draws < verifier_error_probability)
+    elif fault_model == 'collude':
+        votes = np.where(verifier_byzantine, np.asarray(executor_byzantine)[..., None], honest_votes)
+    elif fault_model == 'always_reject':
+        votes = honest_votes & ~verifier_byzantine
+    else:
+        raise ValueError(f"Unknown verifier fault model '{fault_model}', "
+                         f"expected one of {VERIFIER_FAULT_MODELS}")
+    return votes.sum(axis=-1)
 
 class ValidationManager:
     """
@@ -17,16 +61,33 @@ class ValidationManager:
     Where α_m ∈ [0, 0.5] is the renewable energy proportion for miner m
     """
     
-    def __init__(self, k: float = 1.0, z: float = 0.5):
+    def __init__(self, k: float = 1.0, z: float = 0.5, independent_verification: bool = False,
+                 aggregates: Optional[MinerAggregates] = None, verifier_fault_model: str = 'honest',
+                 np_rng: Optional[np.random.Generator] = None):
         """
         Initialize validation manager with reward parameters.
         
         Args:
             k: Base reward multiplier (thesis default: 1.0)
             z: Verifier reward coefficient (thesis default: 0.5)
+            independent_verification: If True, every verifier re-executes the
+                                      task instead of checking against the
+                                      cached ground truth (same outcome, but
+                                      pays the verification cost explicitly)
+            aggregates: Running miner totals to refresh whenever a miner's
+                        score, tokens or error rate change
+            verifier_fault_model: How verifiers vote, one of VERIFIER_FAULT_MODELS
+            np_rng: NumPy generator for 'random_flip' votes (fresh one if None)
         """
+        if verifier_fault_model not in VERIFIER_FAULT_MODELS:
+            raise ValueError(f"Unknown verifier fault model '{verifier_fault_model}', "
+                             f"expected one of {VERIFIER_FAULT_MODELS}")
         self.k = k  # Reward multiplier (thesis Equation 5)
         self.z = z  # Verifier reward multiplier (thesis Equation 8)
+        self.independent_verification = independent_verification
+        self.aggregates = aggregates
+        self.verifier_fault_model = verifier_fault_model
+        self.np_rng = np_rng if np_rng is not None else np.random.default_rng()
 
     def validate_solution(self, task: Task, solution: Any) -> bool:
         """
@@ -34,11 +95,16 @@ class ValidationManager:
         
         Per thesis Equation 11: Required Approvals = ⌈V/2⌉
         Per thesis Equation 12: Valid if Approvals ≥ ⌈V/2⌉
+        
+        With a faulty verifier model the votes are tallied by tally_votes.
         """
-        approvals = 0
-        for verifier in task.verifiers:
-            if verifier.verify_task(task, solution):
-                approvals += 1
+        if self.verifier_fault_model == 'honest':
+            approvals = 0
+            for verifier in task.verifiers:
+                if verifier.verify_task(task, solution, recompute=self.independent_verification):
+                    approvals += 1
+        else:
+            approvals = self._tally_faulty_votes(task, solution)
         
         task.approvals = approvals
         num_verifiers = len(task.verifiers)
@@ -46,6 +112,22 @@ class ValidationManager:
         task.is_validated = (approvals >= required_approvals)
         return task.is_validated
 
+    def _tally_faulty_votes(self, task: Task, solution: Any) -> int:
+        """Approvals for one task under the configured verifier fault model."""
+        verifiers = task.verifiers
+        count = len(verifiers)
+        if self.independent_verification:
+            honest_votes = np.fromiter((v.verify_task(task, solution, recompute=True) for v in verifiers),
+                                       dtype=bool, count=count)
+        else:
+            # All honest verifiers reach the same verdict against the cached result
+            honest_votes = np.full(count, task.verify_solution(solution))
+        verifier_byzantine = np.fromiter((v.is_byzantine for v in verifiers), dtype=bool, count=count)
+        error_probability = np.fromiter((v.error_probability for v in verifiers), dtype=np.float64, count=count)
+        flip_draws = self.np_rng.random(count) if self.verifier_fault_model == 'random_flip' else None
+        return int(tally_votes(honest_votes, task.assigned_miner.is_byzantine, verifier_byzantine,
+                               error_probability, self.verifier_fault_model, flip_draws))
+
     def calculate_miner_reward(self, task: Task) -> float:
         """
         Calculate reward for the task executor.
@@ -100,4 +182,12 @@ class ValidationManager:
             penalty = task.cost
             task.assigned_miner.apply_penalty(penalty)
 
+        # The executor's error rate changed during execution; verifiers are only
+        # touched when rewarded
+        if self.aggregates is not None:
+            self.aggregates.refresh(task.assigned_miner)
+            if is_valid:
+                for verifier in task.verifiers:
+                    self.aggregates.refresh(verifier)
+
         return is_valid
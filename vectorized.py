@@ -0,0 +1,281 @@
+import math
+from typing import Dict, List, Optional
+import numpy as np
+from task import TaskType, LINEAR_COST, QUADRATIC_COST, MASKED_FAULT_PROBABILITY
+from miner import Miner, TIER_MULTIPLIERS, selection_tier
+from sampling import FenwickTree, sample_distinct
+from validation import VERIFIER_FAULT_MODELS, tally_votes
+
+# Type codes index the per-type arrays of task.py (TaskType declaration order)
+_TASK_TYPES = list(TaskType)
+
+# Tasks per block when tallying votes up front, bounding the (tasks × (V+1) × V) temporaries
+_TALLY_CHUNK = 1 << 16
+
+
+class VectorizedEngine:
+    """
+    Array-based alternative to the object-per-task simulation loop.
+
+    Miner state (score, tokens, error counters, renewable α_m) is kept in NumPy
+    arrays, and all per-task randomness (task types, input sizes, executor
+    errors, verifier sets) is drawn up front in array form. Because verifiers
+    check solutions against ground truth, a task is valid exactly when the
+    executor's result is correct (thesis Equations 11-12), so task inputs are
+    never materialized. With a faulty verifier model the votes of all tasks are
+    tallied up front in array operations (validation.tally_votes), once for
+    every way the executor can split each task's verifier offsets. Only the
+    score/error-rate feedback into miner selection (thesis Equation 4) is
+    resolved sequentially.
+
+    The engine reproduces the object engine's model statistically, not
+    draw-for-draw: the same seed gives different individual runs.
+    """
+
+    def __init__(self, miners: List[Miner], num_verifiers: int = 3,
+                 k: float = 1.0, z: float = 0.5,
+                 fault_tolerance_enabled: bool = True,
+                 input_size_min: int = 10, input_size_max: int = 100,
+                 rng: Optional[np.random.Generator] = None, verifier_fault_model: str = 'honest'):
+        """
+        Initialize the engine from an existing miner population.
+
+        Args:
+            miners: Miners to simulate (their state is written back after a run)
+            num_verifiers: Number of verifiers per task V (thesis Eq.11)
+            k: Base reward multiplier (thesis Eq.5)
+            z: Verifier reward coefficient (thesis Eq.8)
+            fault_tolerance_enabled: Use thesis Equation 4 for selection
+            input_size_min: Minimum task input size n
+            input_size_max: Maximum task input size n
+            rng: NumPy generator owned by the simulation (fresh one if None)
+            verifier_fault_model: How verifiers vote, one of VERIFIER_FAULT_MODELS
+        """
+        if verifier_fault_model not in VERIFIER_FAULT_MODELS:
+            raise ValueError(f"Unknown verifier fault model '{verifier_fault_model}', "
+                             f"expected one of {VERIFIER_FAULT_MODELS}")
+        self.miners = miners
+        self.num_miners = len(miners)
+        self.num_verifiers = min(num_verifiers, max(self.num_miners - 1, 0))
+        self.k = k
+        self.z = z
+        self.fault_tolerance_enabled = fault_tolerance_enabled
+        self.input_size_min = input_size_min
+        self.input_size_max = input_size_max
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.verifier_fault_model = verifier_fault_model
+
+        self.error_probability = np.array([m.error_probability for m in miners], dtype=np.float64)
+        self.renewable = np.array([m.renewable_energy_proportion for m in miners], dtype=np.float64)
+        self.is_byzantine = np.array([m.is_byzantine for m in miners], dtype=bool)
+        self.score = np.array([m.score for m in miners], dtype=np.float64)
+        self.tokens = np.array([m.tokens for m in miners], dtype=np.float64)
+        self.attempts = np.array([m.total_tasks_attempted for m in miners], dtype=np.int64)
+        self.failures = np.array([m.total_failures for m in miners], dtype=np.int64)
+        self.tasks_completed = np.array([m.tasks_completed for m in miners], dtype=np.int64)
+        self.penalties = np.array([m.penalties for m in miners], dtype=np.int64)
+
+    @staticmethod
+    def tier_multiplier(error_rate: float) -> float:
+        """Selection multiplier for a miner's error-rate tier (thesis Equation 4)."""
+        return TIER_MULTIPLIERS[selection_tier(error_rate)]
+
+    def generate_tasks(self, num_tasks: int) -> Dict[str, np.ndarray]:
+        """Draw task types, input sizes and costs for a whole run at once."""
+        types = self.rng.integers(0, len(_TASK_TYPES), size=num_tasks)
+        sizes = self.rng.integers(self.input_size_min, self.input_size_max + 1, size=num_tasks)
+        n = sizes.astype(np.float64)
+        costs = LINEAR_COST[types] * n + QUADRATIC_COST[types] * n * n
+        masked = MASKED_FAULT_PROBABILITY[types]
+        # A single-element sort has nothing to swap, so a fault is always masked
+        masked = np.where((types == _TASK_TYPES.index(TaskType.SORTING)) & (sizes <= 1), 1.0, masked)
+        return {'types': types, 'sizes': sizes, 'costs': costs, 'masked': masked}
+
+    def sample_verifier_offsets(self, num_tasks: int) -> np.ndarray:
+        """
+        Draw V distinct indices from range(M-1) for every task.
+
+        Each index is later shifted past the executor (i >= e → i + 1), which
+        yields V distinct verifiers excluding the executor without building a
+        per-task candidate list.
+        """
+        return sample_distinct(self.rng, max(self.num_miners - 1, 0), self.num_verifiers, num_tasks)
+
+    def approval_table(self, offsets: np.ndarray,
+                       flip_draws: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Approvals of every task's verifiers, for each outcome the loop can reach.
+
+        Verifier j of task t is offsets[t, j], or offsets[t, j] + 1 if that is
+        at or past the executor. With a task's offsets sorted, the executor only
+        decides how many of them (k) stay unshifted, so thesis Equations 11-12
+        can be tallied before the executor is known.
+
+        Returns:
+            Array of shape (num_tasks, 2, 2, V + 1): the approvals given
+            [t, solution correct, executor Byzantine, k]
+        """
+        num_tasks, V = offsets.shape
+        table = np.empty((num_tasks, 2, 2, V + 1), dtype=np.min_scalar_type(V))
+        # shift[k, j]: whether sorted offset j is shifted past the executor when k are not
+        shift = np.arange(V) >= np.arange(V + 1)[:, None]
+        outcome = np.array([False, True])
+        for start in range(0, num_tasks, _TALLY_CHUNK):
+            block = slice(start, start + _TALLY_CHUNK)
+            order = np.argsort(offsets[block], axis=1)
+            identities = np.take_along_axis(offsets[block], order, axis=1)[:, None, :] + shift
+            flips = None
+            if flip_draws is not None:
+                flips = np.take_along_axis(flip_draws[block], order, axis=1)[:, None, :]
+            # Axes: (correct, executor Byzantine, task, k)
+            approvals = tally_votes(outcome[:, None, None, None, None], outcome[:, None, None],
+                                    self.is_byzantine[identities],
+                                    self.error_probability[identities],
+                                    self.verifier_fault_model, flips)
+            approvals = np.broadcast_to(approvals, (2, 2) + identities.shape[:2])
+            table[block] = approvals.transpose(2, 0, 1, 3)
+        return table
+
+    def run(self, num_tasks: int, record_trace: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Simulate num_tasks tasks and write the final state back to the miners.
+
+        Args:
+            num_tasks: Number of tasks to process
+            record_trace: If True, also record per-task score and token
+                          snapshots of every miner (num_tasks × M arrays)
+
+        Returns:
+            Dictionary of per-task arrays: executor, is_valid, types, costs,
+            verifiers, plus score_trace/token_trace when requested.
+        """
+        M = self.num_miners
+        V = self.num_verifiers
+        tasks = self.generate_tasks(num_tasks)
+        costs = tasks['costs']
+        base_rewards = self.k * costs
+        verifier_rewards = self.k * costs * self.z
+        selection_draws = self.rng.random(num_tasks)
+        error_draws = self.rng.random(num_tasks)
+        mask_draws = self.rng.random(num_tasks)
+        offsets = self.sample_verifier_offsets(num_tasks)
+        fault_model = self.verifier_fault_model
+        faulty_verifiers = fault_model != 'honest' and V > 0
+        flip_draws = self.rng.random((num_tasks, V)) if fault_model == 'random_flip' else None
+        approval_table = self.approval_table(offsets, flip_draws) if faulty_verifiers else None
+        required_approvals = math.ceil(V / 2)  # Thesis Equation 11
+
+        executors = np.empty(num_tasks, dtype=np.int64)
+        is_valid = np.empty(num_tasks, dtype=bool)
+        verifiers = np.empty((num_tasks, V), dtype=np.int64)
+        score_trace = np.empty((num_tasks, M)) if record_trace else None
+        token_trace = np.empty((num_tasks, M)) if record_trace else None
+
+        score = self.score
+        tokens = self.tokens
+        attempts = self.attempts
+        failures = self.failures
+        error_probability = self.error_probability.tolist()
+        is_byzantine = self.is_byzantine.tolist()
+        renewable = self.renewable.tolist()
+        error_rate = np.where(attempts > 0, failures / np.maximum(attempts, 1), 0.0)
+        multiplier = np.array([self.tier_multiplier(rate) for rate in error_rate])
+        fault_tolerance = self.fault_tolerance_enabled
+        # Eq. 4 weights in a Fenwick tree: O(log M) per draw and per touched miner
+        weights = FenwickTree((score * multiplier).tolist()) if fault_tolerance else None
+
+        # Scalars read once per task are cheaper as Python lists than as NumPy items
+        selection_list = selection_draws.tolist()
+        error_list = error_draws.tolist()
+        mask_list = (mask_draws < tasks['masked']).tolist()
+        base_list = base_rewards.tolist()
+        verifier_list = verifier_rewards.tolist()
+        cost_list = costs.tolist()
+        attempt_list = attempts.tolist()
+        failure_list = failures.tolist()
+
+        for t in range(num_tasks):
+            # Thesis Equation 4: score-weighted selection with tier penalties,
+            # uniform when fault tolerance is off or no miner has a score yet
+            total = weights.total() if fault_tolerance else 0.0
+            if total > 0:
+                e = weights.find(selection_list[t] * total)
+            else:
+                e = int(selection_list[t] * M)
+
+            failed = error_list[t] < error_probability[e]
+            attempt_list[e] += 1
+            if failed:
+                failure_list[e] += 1
+            multiplier[e] = self.tier_multiplier(failure_list[e] / attempt_list[e])
+
+            # Thesis Equations 11-12: honest verifiers approve iff the solution
+            # matches ground truth; with no verifiers ⌈0/2⌉ = 0 approvals suffice
+            correct = (not failed) or mask_list[t]
+            shifted = offsets[t] >= e
+            row = offsets[t] + shifted
+            if faulty_verifiers:
+                unshifted = V - int(np.count_nonzero(shifted))
+                approvals = approval_table[t, int(correct), int(is_byzantine[e]), unshifted]
+                valid = approvals >= required_approvals
+            else:
+                valid = correct or V == 0
+
+            if valid:
+                reward = base_list[t] * (1.0 + renewable[e])  # Equations 5-7
+                score[e] += reward
+                score[row] += verifier_list[t]  # Equation 8
+                if record_trace:
+                    tokens[e] += reward
+                    tokens[row] += verifier_list[t]
+            else:
+                score[e] = max(0.0, score[e] - cost_list[t])  # Equation 10
+
+            if fault_tolerance:
+                weights.update(e, float(score[e] * multiplier[e]))
+                if valid:
+                    for v, weight in zip(row.tolist(), (score[row] * multiplier[row]).tolist()):
+                        weights.update(v, weight)
+
+            executors[t] = e
+            is_valid[t] = valid
+            verifiers[t] = row
+            if record_trace:
+                score_trace[t] = score
+                token_trace[t] = tokens
+
+        attempts[:] = attempt_list
+        failures[:] = failure_list
+        if not record_trace:
+            # Tokens never feed back into selection, so they are summed after the loop
+            executor_rewards = base_rewards * (1.0 + self.renewable[executors])
+            tokens += np.bincount(executors[is_valid], weights=executor_rewards[is_valid], minlength=M)
+            tokens += np.bincount(verifiers[is_valid].ravel(),
+                                  weights=np.repeat(verifier_rewards[is_valid], V), minlength=M)
+        self.tasks_completed += np.bincount(executors[is_valid], minlength=M)
+        self.penalties += np.bincount(executors[~is_valid], minlength=M)
+        self.sync_miners()
+
+        result = {
+            'executor': executors,
+            'is_valid': is_valid,
+            'types': tasks['types'],
+            'costs': costs,
+            'verifiers': verifiers,
+        }
+        if record_trace:
+            result['score_trace'] = score_trace
+            result['token_trace'] = token_trace
+        return result
+
+    def sync_miners(self):
+        """Write the array state back into the Miner objects."""
+        for i, miner in enumerate(self.miners):
+            miner.score = float(self.score[i])
+            miner.tokens = float(self.tokens[i])
+            miner.tasks_completed = int(self.tasks_completed[i])
+            miner.penalties = int(self.penalties[i])
+            miner.total_tasks_attempted = int(self.attempts[i])
+            miner.total_failures = int(self.failures[i])
+            miner.error_rate = (miner.total_failures / miner.total_tasks_attempted
+                                if miner.total_tasks_attempted > 0 else 0.0)